@@ -0,0 +1,29 @@
+"""
+Play a batch of seeded games without a display and write how each level went to a results file.
+
+    python batch.py GAMES [RESULTS_PATH [FIRST_SEED [WORKERS]]]
+"""
+import sys
+import time
+
+from maze.batch import run_batch, write_results
+
+
+def main(games: int, path: str = 'results.bin', first_seed: int = 0, workers: int = 0):
+    start = time.perf_counter()
+    columns = run_batch(games, first_seed, workers or None)
+    elapsed = time.perf_counter() - start
+    write_results(path, columns)
+
+    levels = len(columns['level'])
+    cleared = sum(columns['cleared'])
+    frames = sum(columns['frames'])
+    print('%d games, %d levels, %d cleared, %d frames in %.2fs (%.0f frames/s) -> %s' %
+          (games, levels, cleared, frames, elapsed, frames / elapsed, path))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(__doc__.strip())
+        sys.exit(1)
+    main(int(sys.argv[1]), *sys.argv[2:3], *(int(arg) for arg in sys.argv[3:5]))
@@ -0,0 +1,116 @@
+"""
+Micro benchmarks of the hot paths that make small objects: points, cell lookups, a frame of the headless game and a
+frame of the sprites following it.
+
+Run with ``python -m benchmarks.allocations [frames]``.  For each path it prints the time per call, and the most memory
+held at once by objects made during a call, as traced by tracemalloc, which grows with every object a call makes and
+keeps until it returns.
+"""
+import os
+import sys
+import tracemalloc
+from random import Random
+from time import perf_counter
+from typing import Callable, Tuple
+
+from maze.maze_generate import MazeGenerator, Point, EAST
+
+DEFAULT_FRAMES = 2000
+REPEATS = 5
+CATS = 100
+
+
+def measure(call: Callable[[], object], count: int) -> Tuple[float, float]:
+    """
+    Time a call and trace the memory it takes
+
+    :param call: The call to measure
+    :param count: Number of times to call it in each of REPEATS runs
+    :return: Microseconds per call in the best run, and the average of the peak bytes traced during each call
+    """
+    elapsed = float('inf')
+    for _ in range(REPEATS):
+        start = perf_counter()
+        for _ in range(count):
+            call()
+        elapsed = min(elapsed, perf_counter() - start)
+
+    peaks = 0
+    tracemalloc.start()
+    for _ in range(count):
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        call()
+        peaks += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+    return elapsed / count * 1000000, peaks / count
+
+
+def point_size() -> int:
+    """
+    Bytes taken by a Point, with its attribute dictionary if it has one
+    """
+    point = Point(0, 0)
+    size = sys.getsizeof(point)
+    if hasattr(point, '__dict__'):
+        size += sys.getsizeof(point.__dict__)
+    return size
+
+
+def maze_paths(frames: int):
+    maze = MazeGenerator(51, 51, seed=1).get_maze(1)
+    maze.build_exits()
+    rng = Random(1)
+    point = Point(3, 3)
+    yield 'right_hand_rule', measure(lambda: maze.right_hand_rule(Point(point.col, point.row), EAST), frames)
+    yield 'get_rand_cell', measure(lambda: maze.get_rand_cell(rng), frames)
+    yield 'points', measure(lambda: [Point(col, 1) for col in range(100)], frames)
+
+
+def game_paths(frames: int):
+    from maze.placement import Placement
+    from maze.simulation import Simulation
+    generator = MazeGenerator(51, 51, seed=1)
+    sim = Simulation(lambda: generator.get_maze(generator.next_seed()), 1)
+    sim.new_game()
+    sim.cats.reset(Placement(sim.map), CATS)
+    # Lives enough for the mouse to always be there to chase
+    sim.score.lives = 1 << 30
+    moves = Random(1)
+    yield 'sim frame', measure(lambda: sim.step(moves.randrange(4)), frames)
+
+    def new_level():
+        # Always the second level, each level has more cats than the last
+        sim.level = 1
+        sim.new_level()
+
+    yield 'new_level', measure(new_level, max(1, frames // 100))
+    sim.cats.reset(Placement(sim.map), CATS)
+
+    # The sprites following the game, drawing nothing
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    from maze.maze_game import MazeGame
+    game = MazeGame(asset_cache=None)
+    try:
+        game.sim = sim
+        game.update()
+
+        def frame():
+            sim.step(moves.randrange(4))
+            game.update()
+
+        yield 'view frame', measure(frame, frames)
+    finally:
+        game.prefetcher.close()
+
+
+def main(frames: int):
+    print('%-16s%12s%14s' % ('path', 'us/call', 'peak bytes'))
+    for paths in (maze_paths, game_paths):
+        for name, (time, peak) in paths(frames):
+            print('%-16s%12.2f%14.0f' % (name, time, peak))
+    print('%-16s%26d' % ('Point bytes', point_size()))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_FRAMES)
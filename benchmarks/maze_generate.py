@@ -0,0 +1,52 @@
+"""
+Benchmark of the maze generation algorithms.
+
+Run with ``python -m benchmarks.maze_generate [size ...]``.  Each size is the width and height of a square maze and
+must be odd.
+"""
+import sys
+from time import perf_counter
+from typing import List
+
+from maze.maze_generate import MazeGenerator, ALGORITHMS
+
+DEFAULT_SIZES = [51, 101, 201, 401, 1001]
+REPEATS = 3
+
+# The hunt and kill walk is quadratic, so past this size a single run takes minutes
+SIZE_LIMITS = {'hunt_and_kill': 401}
+
+
+def time_generator(algorithm: str, size: int, repeats: int = REPEATS) -> float:
+    """
+    Time how long it takes to generate a maze
+
+    :param algorithm: Name of the maze algorithm to time
+    :param size: Width and height of the maze
+    :param repeats: How many mazes to generate
+    :return: The best time of all the runs in seconds
+    """
+    generator = MazeGenerator(size, size, algorithm)
+    best = float('inf')
+    for _ in range(0, repeats):
+        start = perf_counter()
+        generator.get_maze()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def main(sizes: List[int]):
+    algorithms = list(ALGORITHMS)
+    print('%8s' % 'size' + ''.join('%15s' % algorithm for algorithm in algorithms))
+    for size in sizes:
+        line = '%8d' % size
+        for algorithm in algorithms:
+            if size > SIZE_LIMITS.get(algorithm, size):
+                line += '%15s' % '-'
+            else:
+                line += '%14.4fs' % time_generator(algorithm, size)
+        print(line)
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
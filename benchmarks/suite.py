@@ -0,0 +1,283 @@
+"""
+Benchmark suite of the game's hot paths: generating mazes, rendering them, drawing the view and running frames of the
+game without a display.  Every case is seeded, so each run does exactly the same work.
+
+Run with ``python -m benchmarks.suite [--quick] [--save PATH] [--compare PATH] [--threshold FRACTION]``.  Each case is
+timed as the median of several runs, along with how much the runs spread.  The times of a run can be saved to a JSON
+baseline, and a later run compared to it: a case slower than the baseline by more than the threshold, and by more than
+its runs spread, is a regression, and the run exits with status 1.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+from functools import partial
+from random import Random
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from pygame import Rect  # noqa: E402
+
+from benchmarks.maze_generate import SIZE_LIMITS  # noqa: E402
+from maze.config import TILE_WIDTH, TILE_HEIGHT, PLAY_WIDTH, PLAY_HEIGHT, HEAD_HEIGHT  # noqa: E402
+from maze.maze import Maze  # noqa: E402
+from maze.maze_game import MazeGame  # noqa: E402
+from maze.maze_generate import MazeGenerator, MazeMap, ALGORITHMS, NORTH  # noqa: E402
+from maze.placement import Placement  # noqa: E402
+
+BASELINE_VERSION = 2
+DEFAULT_THRESHOLD = 0.2
+# A slowdown within this many times the spread of the runs of a case is taken as noise
+NOISE_FACTOR = 2
+
+GENERATE_SIZES = [51, 101, 201, 501, 1001, 2001]
+RENDER_SIZES = [51, 101, 201]
+CAT_COUNTS = [10, 100, 500]
+FRAMES = 500
+REPEATS = 9
+# Mazes this big take seconds to build, so they are built fewer times
+SLOW_SIZE = 1001
+SLOW_REPEATS = 3
+QUICK_SIZE = 201
+
+# Median time in seconds, and the spread of the runs as a fraction of it
+Timing = Tuple[float, float]
+
+
+class Case:
+    """
+    A case of the suite: a call timed a number of times, each time after a setup that is not timed, so every run does
+    the same work
+    """
+    name: str
+    call: Callable[[], object]
+    setup: Optional[Callable[[], object]]
+    count: int
+    repeats: int
+    times: List[float]
+
+    def __init__(self, name: str, call: Callable[[], object], setup: Optional[Callable[[], object]] = None,
+                 count: int = 1, repeats: int = REPEATS):
+        """
+        :param name: Name of the case in the results
+        :param call: The call to time
+        :param setup: Called before each call, or None
+        :param count: Number of operations a call does, the time is per operation
+        :param repeats: How many times to call it
+        """
+        self.name = name
+        self.call = call
+        self.setup = setup
+        self.count = count
+        self.repeats = repeats
+        self.times = list()
+
+    def run(self):
+        """
+        Time one call
+        """
+        if self.setup is not None:
+            self.setup()
+        start = perf_counter()
+        self.call()
+        self.times.append((perf_counter() - start) / self.count)
+
+    def timing(self) -> Timing:
+        """
+        :return: The median time of the calls, and the spread between their lower and upper quartile times
+        """
+        times = sorted(self.times)
+        median = times[len(times) // 2]
+        spread = (times[len(times) * 3 // 4] - times[len(times) // 4]) / median if median else 0.0
+        return median, spread
+
+
+def generate_cases(sizes: List[int]) -> Iterator[Case]:
+    """
+    MazeGenerator.get_maze of each algorithm, at each size it can build in reasonable time
+    """
+    for size in sizes:
+        for algorithm in ALGORITHMS:
+            if size > SIZE_LIMITS.get(algorithm, size):
+                continue
+            generator = MazeGenerator(size, size, algorithm)
+            yield Case('generate/%s/%d' % (algorithm, size), partial(generator.get_maze, 1),
+                       repeats=SLOW_REPEATS if size >= SLOW_SIZE else REPEATS)
+
+
+def view_cases(game: MazeGame, sizes: List[int], frames: int) -> Iterator[Case]:
+    """
+    Maze.new_maze and the first frame drawn of each maze size, then Maze.draw following a critter scrolling across the
+    biggest maze and standing still in it with only a few tiles changing
+    """
+    screen = game.screen
+    maze = Maze(game.tiles)
+    dest = Rect(0, HEAD_HEIGHT, PLAY_WIDTH, PLAY_HEIGHT)
+    start = Rect(TILE_WIDTH, TILE_HEIGHT, TILE_WIDTH, TILE_HEIGHT)
+    maze_maps = [MazeGenerator(size, size, 'backtracker').get_maze(1) for size in sizes]
+
+    def new_maze(maze_map: MazeMap):
+        maze.new_maze(maze_map)
+        maze.draw(screen, dest, start)
+
+    for size, maze_map in zip(sizes, maze_maps):
+        yield Case('new_maze/%d' % size, partial(new_maze, maze_map))
+
+    # Scroll along the diagonal, every frame draws the whole window
+    span = (maze_maps[-1].width - 2) * TILE_WIDTH
+    path = [Rect(step, step, TILE_WIDTH, TILE_HEIGHT) for step in range(0, span, max(1, span // frames))][:frames]
+
+    def scroll():
+        for location in path:
+            maze.draw(screen, dest, location, [])
+
+    yield Case('draw/scroll', scroll, partial(maze.new_maze, maze_maps[-1]), len(path))
+
+    dirty = [Rect(column * TILE_WIDTH, TILE_HEIGHT, TILE_WIDTH, TILE_HEIGHT) for column in range(1, 9)]
+
+    def still():
+        for _ in range(frames):
+            maze.draw(screen, dest, start, dirty)
+
+    yield Case('draw/still', still, partial(new_maze, maze_maps[-1]), frames)
+
+
+def update_cases(game: MazeGame, cat_counts: List[int], frames: int) -> Iterator[Case]:
+    """
+    Frames of the game without drawing: a step of the simulation then MazeGame.update syncing the sprites, with more and
+    more cats.  The mouse cannot die, so every frame has it to chase.
+    """
+    sim = game.sim
+    moves = Random()
+
+    def setup(cats: int):
+        # Every run plays the same game
+        moves.seed(1)
+        game.start_game()
+        sim.score.lives = 1 << 30
+        sim.cats.reset(Placement(sim.map), cats)
+        game.update()
+
+    def run():
+        for frame in range(frames):
+            sim.step(moves.randrange(4) if frame % 8 == 0 else NORTH)
+            game.update()
+
+    for cats in cat_counts:
+        yield Case('update/%d_cats' % cats, run, partial(setup, cats), frames)
+
+
+def run_suite(quick: bool = False) -> Iterator[Tuple[str, Timing]]:
+    """
+    Run every case of the suite.  The cases are run in rounds, each case once a round, so a stretch of time the machine
+    runs slow is spread over all of them instead of landing on the repeats of one.
+
+    :param quick: Leave out the biggest mazes and run fewer frames, for a check in a few seconds
+    :return: Name and timing of each case
+    """
+    sizes = [size for size in GENERATE_SIZES if not quick or size <= QUICK_SIZE]
+    frames = FRAMES // 5 if quick else FRAMES
+    game = MazeGame(seed=1, asset_cache=None)
+    try:
+        cases = list(generate_cases(sizes)) + list(view_cases(game, RENDER_SIZES, frames)) + \
+            list(update_cases(game, CAT_COUNTS, frames))
+        for repeat in range(max(case.repeats for case in cases)):
+            for case in cases:
+                if repeat < case.repeats:
+                    case.run()
+    finally:
+        game.close()
+    for case in cases:
+        yield case.name, case.timing()
+
+
+def save_baseline(path: str, results: Dict[str, Timing]):
+    """
+    Save the times of a run as a baseline
+
+    :param path: Path of the JSON file
+    :param results: Timing of each case
+    """
+    with open(path, 'w') as file:
+        json.dump({'version': BASELINE_VERSION, 'python': platform.python_version(), 'machine': platform.machine(),
+                   'results': results}, file, indent=2, sort_keys=True)
+
+
+def load_baseline(path: str) -> Dict[str, Timing]:
+    """
+    Load a baseline saved by save_baseline()
+
+    :param path: Path of the JSON file
+    :return: Timing of each case
+    """
+    with open(path) as file:
+        baseline = json.load(file)
+    if baseline.get('version') != BASELINE_VERSION:
+        raise ValueError('"%s" is not a version %d baseline.' % (path, BASELINE_VERSION))
+    return {name: (time, spread) for name, (time, spread) in baseline['results'].items()}
+
+
+def compare(baseline: Dict[str, Timing], results: Dict[str, Timing],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Tuple[str, float]]:
+    """
+    Find the cases that got slower than a baseline.  A case is only a regression if it got slower by more than the
+    threshold and by more than NOISE_FACTOR times the spread of its runs, in either the baseline or this run.
+
+    :param baseline: Timing of each case in the baseline
+    :param results: Timing of each case in this run
+    :param threshold: Fraction of its baseline time a case can get slower by before it is a regression
+    :return: Name and ratio of this run's time to the baseline's of each regression.  Cases in only one of the runs are
+        not compared.
+    """
+    regressions = list()
+    for name, (time, spread) in results.items():
+        if name not in baseline:
+            continue
+        before, before_spread = baseline[name]
+        margin = max(threshold, NOISE_FACTOR * max(spread, before_spread))
+        if before and time / before > 1 + margin:
+            regressions.append((name, time / before))
+    return regressions
+
+
+def format_time(time: float) -> str:
+    if time >= 1:
+        return '%.3fs' % time
+    if time >= 0.001:
+        return '%.3fms' % (time * 1000)
+    return '%.1fus' % (time * 1000000)
+
+
+def main(args: List[str]) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the hot paths of the game.')
+    parser.add_argument('--quick', action='store_true', help='leave out the biggest mazes and run fewer frames')
+    parser.add_argument('--save', metavar='PATH', help='save the times as a JSON baseline')
+    parser.add_argument('--compare', metavar='PATH', help='compare the times to a JSON baseline')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='fraction slower than the baseline that is a regression (default %(default)s)')
+    options = parser.parse_args(args)
+
+    baseline = load_baseline(options.compare) if options.compare else dict()
+    results = dict()
+    print('%-28s%12s%8s%12s%9s' % ('case', 'time', 'spread', 'baseline', 'ratio'))
+    for name, (time, spread) in run_suite(options.quick):
+        results[name] = time, spread
+        line = '%-28s%12s%7.0f%%' % (name, format_time(time), spread * 100)
+        before = baseline.get(name, (0.0, 0.0))[0]
+        if before:
+            line += '%12s%9.2f' % (format_time(before), time / before)
+        print(line)
+
+    if options.save:
+        save_baseline(options.save, results)
+    regressions = compare(baseline, results, options.threshold)
+    for name, ratio in regressions:
+        print('regression: %s is %.0f%% slower' % (name, (ratio - 1) * 100))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
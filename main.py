@@ -1,5 +1,5 @@
 import sys
-from typing import List
+from typing import List, Optional
 
 import pygame
 
@@ -27,8 +27,8 @@ class MazeGame:
         pygame.init()
 
         self.maze_generator = MazeGenerator(49, 49)
-        self.width = len(self.maze_generator.maze_image.map[0]) * 10
-        self.height = len(self.maze_generator.maze_image.map) * 10
+        self.width = self.maze_generator.maze_image.width * 10
+        self.height = self.maze_generator.maze_image.height * 10
 
         self.size = self.width, self.height
         self.screen = pygame.display.set_mode(self.size)
@@ -113,8 +113,19 @@ class MazeGame:
             self.clock.tick(40)
 
 
+def option(name: str) -> Optional[str]:
+    """
+    Value following an option on the command line, or None if it is not given
+    """
+    if name in sys.argv[:-1]:
+        return sys.argv[sys.argv.index(name) + 1]
+    return None
+
+
 def main():
-    Game().game_loop()
+    seed = option('--seed')
+    Game(profile='--profile' in sys.argv, record=option('--record'),
+         seed=int(seed) if seed is not None else None).game_loop()
 
 
 # Press the green button in the gutter to run the script.
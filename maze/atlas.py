@@ -0,0 +1,183 @@
+import json
+import os
+import struct
+import sys
+from typing import Dict, Tuple, Set, Optional, Sequence
+
+import pygame
+from pygame import Rect
+from pygame.image import load
+from pygame.surface import Surface
+
+# Atlas cache file: magic, version, width and height of the atlas and the length of its key, then the key, then the
+# atlas pixels in the raw format named by the key
+ATLAS_MAGIC = b'ATLS'
+ATLAS_VERSION = 1
+ATLAS_HEADER = struct.Struct('<4sB3xIII')
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def png_size(path: str) -> Tuple[int, int]:
+    """
+    Read the size of a PNG image from its header, without decoding it
+
+    :param path: Path of the image
+    :return: Width and height of the image
+    """
+    with open(path, 'rb') as file:
+        header = file.read(24)
+    if header[:8] != PNG_SIGNATURE or header[12:16] != b'IHDR':
+        raise ValueError('"%s" is not a PNG image.' % path)
+    width, height = struct.unpack('>II', header[16:24])
+    return width, height
+
+
+def pack_sheets(sizes: Dict[str, Tuple[int, int]]) -> Tuple[Dict[str, Rect], int, int]:
+    """
+    Lay sheets out on shelves, the tallest first, in an atlas as wide as the widest sheet
+
+    :param sizes: Width and height of each sheet
+    :return: Where each sheet is in the atlas, and the width and height of the atlas
+    """
+    width = max(size[0] for size in sizes.values())
+    index = dict()
+    left = top = shelf = 0
+    for name in sorted(sizes, key=lambda sheet: (-sizes[sheet][1], sheet)):
+        sheet_width, sheet_height = sizes[name]
+        if left + sheet_width > width:
+            left = 0
+            top += shelf
+            shelf = 0
+        index[name] = Rect(left, top, sheet_width, sheet_height)
+        left += sheet_width
+        shelf = max(shelf, sheet_height)
+    return index, width, top + shelf
+
+
+def raw_format(surface: Surface) -> str:
+    """
+    Pick the raw pixel format matching a surface's, so loading pixels dumped in it is a straight copy
+
+    :param surface: The display surface
+    :return: A pygame.image string format
+    """
+    if surface is not None and surface.get_bitsize() == 32 and sys.byteorder == 'little' and \
+            surface.get_masks()[:3] == (0xFF0000, 0xFF00, 0xFF):
+        return 'BGRA'
+    return 'RGBA'
+
+
+class TextureAtlas:
+    """
+    The game's image sheets packed into one surface.  Each sheet is decoded from its PNG the first time it is used, so
+    sheets never used are never decoded.  Given a cache path, store_cache() dumps the whole atlas there as raw pixels in
+    the display's pixel format, and later atlases load that dump instead of decoding any PNG.
+    """
+    directory: str
+    index: Dict[str, Rect]
+    surface: Surface
+    loaded: Set[str]
+    cache_path: Optional[str]
+    key: bytes
+    format: str
+
+    def __init__(self, directory: str, names: Sequence[str], cache_path: Optional[str] = None):
+        """
+        Lay out an atlas of sheets, loading it from the cache if the sheets have not changed since it was dumped.  The
+        display mode must be set.
+
+        :param directory: Directory holding the sheets
+        :param names: File names of the sheets
+        :param cache_path: Path of the file the atlas is dumped to, or None to not cache it
+        """
+        self.directory = directory
+        self.cache_path = cache_path
+        self.format = raw_format(pygame.display.get_surface())
+
+        paths = [os.path.join(directory, name) for name in names]
+        sizes = {name: png_size(path) for name, path in zip(names, paths)}
+        self.index, width, height = pack_sheets(sizes)
+        stats = [os.stat(path) for path in paths]
+        self.key = json.dumps([self.format, [(name, stat.st_size, stat.st_mtime_ns)
+                                             for name, stat in zip(names, stats)]]).encode('ascii')
+
+        self.loaded = set()
+        self.surface = None
+        if cache_path is not None:
+            self.surface = self.load_cache(width, height)
+        if self.surface is None:
+            self.surface = Surface((width, height)).convert()
+        else:
+            self.loaded.update(names)
+
+    def load_cache(self, width: int, height: int) -> Optional[Surface]:
+        """
+        Load the atlas dumped by an earlier run
+
+        :param width: Width of the atlas
+        :param height: Height of the atlas
+        :return: The atlas, or None if it is not cached or the sheets changed since
+        """
+        try:
+            with open(self.cache_path, 'rb') as file:
+                data = file.read()
+        except OSError:
+            return None
+        if len(data) < ATLAS_HEADER.size:
+            return None
+        magic, version, cached_width, cached_height, key_size = ATLAS_HEADER.unpack_from(data)
+        pixels = ATLAS_HEADER.size + key_size
+        if magic != ATLAS_MAGIC or version != ATLAS_VERSION or (cached_width, cached_height) != (width, height) or \
+                data[ATLAS_HEADER.size:pixels] != self.key or len(data) - pixels != width * height * 4:
+            return None
+        return pygame.image.frombuffer(data[pixels:], (width, height), self.format).convert()
+
+    def store_cache(self):
+        """
+        Dump the atlas to the cache, first loading any sheet not used yet.  The file is written under a temporary name
+        and then renamed, so a dump cut short never leaves a partial cache.  Failing to write it is not an error, the
+        next atlas just decodes the sheets again.
+        """
+        if self.cache_path is None:
+            return
+        for name in self.index:
+            self.sheet(name)
+        width, height = self.surface.get_size()
+        temp_path = '%s.%d.tmp' % (self.cache_path, os.getpid())
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+            with open(temp_path, 'wb') as file:
+                file.write(ATLAS_HEADER.pack(ATLAS_MAGIC, ATLAS_VERSION, width, height, len(self.key)))
+                file.write(self.key)
+                file.write(pygame.image.tobytes(self.surface, self.format))
+            os.replace(temp_path, self.cache_path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    @property
+    def complete(self) -> bool:
+        """
+        True if every sheet is in the atlas
+        """
+        return len(self.loaded) == len(self.index)
+
+    def sheet(self, name: str) -> Surface:
+        """
+        Get a sheet, decoding it into the atlas if it is not there yet
+
+        :param name: File name of the sheet
+        :return: The sheet, a subsurface of the atlas
+        """
+        rect = self.index[name]
+        if name not in self.loaded:
+            path = os.path.join(self.directory, name)
+            try:
+                self.surface.blit(load(path).convert(), rect)
+            except pygame.error:
+                raise SystemExit('Could not load image "%s" %s' % (path, pygame.get_error()))
+            self.loaded.add(name)
+        return self.surface.subsurface(rect)
@@ -0,0 +1,193 @@
+"""
+Batch play of headless games, for tuning how the levels get harder.  Each game is played by a scripted mouse and the
+outcome of every level it reaches is recorded.  Games are spread over a pool of worker processes.
+"""
+import os
+import struct
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from maze.cats import Cat
+from maze.config import MAZE_WIDTH, MAZE_HEIGHT
+from maze.maze_generate import MazeGenerator, EXITS
+from maze.simulation import Simulation, CHEESE_COUNT
+
+# Results file: magic, version, number of columns and number of rows, then for every column its name padded to 16 bytes,
+# its array type code and the size of its values, then the values of each column one column after another
+RESULTS_MAGIC = b'MZRS'
+RESULTS_VERSION = 2
+RESULTS_HEADER = struct.Struct('<4sB3xII')
+RESULTS_COLUMN = struct.Struct('<16scB2x')
+
+# Name and array type code of the columns recorded for every level played.  The codes are ones of the same size on
+# every platform, 'L' is 8 bytes on Linux but 4 on Windows.
+RESULT_COLUMNS = (('seed', 'I'), ('level', 'H'), ('frames', 'I'), ('cheese', 'H'), ('deaths', 'B'),
+                  ('score', 'I'), ('cleared', 'B'))
+
+# Games that go on longer than this are stopped, a scripted mouse can get stuck
+MAX_FRAMES = 50000
+MAX_LEVELS = 10
+
+
+def seek_cheese(sim: Simulation) -> Optional[int]:
+    """
+    Scripted mouse that heads along the shortest path to the nearest cheese, not going through cells with a cat in them
+
+    :param sim: The game being played
+    :return: The direction to steer the mouse, or None to leave it be
+    """
+    mouse = sim.mouse.sprite
+    if mouse is None or mouse.in_transit:
+        return None
+    maze = sim.map
+    height = maze.height
+    masks = maze.exit_masks
+    occupants = sim.occupancy.cells
+    cheese = sim.cheese
+    offsets = (-height, -1, height, 1)
+
+    start = maze.index(mouse.column, mouse.row)
+    first_steps = {start: None}
+    frontier = [start]
+    while frontier:
+        next_frontier = []
+        for cell in frontier:
+            for direction in EXITS[masks[cell]]:
+                neighbour = cell + offsets[direction]
+                if neighbour in first_steps:
+                    continue
+                here = occupants.get(neighbour, ())
+                if any(isinstance(entity, Cat) for entity in here):
+                    continue
+                step = direction if cell == start else first_steps[cell]
+                if any(entity in cheese for entity in here):
+                    return step
+                first_steps[neighbour] = step
+                next_frontier.append(neighbour)
+        frontier = next_frontier
+    return None
+
+
+def play_game(seed: int, width: int = MAZE_WIDTH, height: int = MAZE_HEIGHT,
+              max_frames: int = MAX_FRAMES, max_levels: int = MAX_LEVELS) -> List[Tuple[int, ...]]:
+    """
+    Play a whole game with the scripted mouse.  Module level so it can be sent to a worker process.
+
+    :param seed: Seed of the game, its mazes and critters all follow from it
+    :param width: Width of the mazes
+    :param height: Height of the mazes
+    :param max_frames: Frames after which the game is stopped
+    :param max_levels: Levels after which the game is stopped
+    :return: A row of RESULT_COLUMNS for every level played
+    """
+    generator = MazeGenerator(width, height, seed=seed)
+    sim = Simulation(lambda: generator.get_maze(generator.next_seed()), seed)
+    sim.new_game()
+
+    rows = list()
+    level_start = 0
+    lives = sim.score.lives
+    deaths = 0
+    while True:
+        playing = sim.step(seek_cheese(sim))
+        if sim.score.lives < lives:
+            deaths += lives - sim.score.lives
+            lives = sim.score.lives
+        cleared = sim.level > len(rows) + 1
+        if cleared or not playing or sim.frame >= max_frames:
+            eaten = CHEESE_COUNT if cleared else CHEESE_COUNT - len(sim.cheese)
+            rows.append((seed, len(rows) + 1, sim.frame - level_start, eaten, deaths, sim.score.score, int(cleared)))
+            level_start = sim.frame
+            deaths = 0
+            if not cleared or len(rows) >= max_levels:
+                return rows
+
+
+def run_batch(games: int, first_seed: int = 0, workers: Optional[int] = None, **kwargs) -> Dict[str, array]:
+    """
+    Play a batch of games over a pool of worker processes
+
+    :param games: Number of games to play, seeded first_seed, first_seed + 1 and so on
+    :param first_seed: Seed of the first game
+    :param workers: Number of worker processes, every core by default
+    :param kwargs: Passed on to play_game()
+    :return: The results, a column per name in RESULT_COLUMNS
+    """
+    columns = {name: array(code) for name, code in RESULT_COLUMNS}
+    seeds = range(first_seed, first_seed + games)
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = [executor.submit(play_game, seed, **kwargs) for seed in seeds]
+        for future in futures:
+            for row in future.result():
+                for (name, _), value in zip(RESULT_COLUMNS, row):
+                    columns[name].append(value)
+    return columns
+
+
+def write_results(path: str, columns: Dict[str, array]):
+    """
+    Write batch results to a results file
+
+    :param path: Path of the file
+    :param columns: The results, as returned by run_batch()
+    """
+    rows = len(next(iter(columns.values()))) if columns else 0
+    with open(path, 'wb') as file:
+        file.write(RESULTS_HEADER.pack(RESULTS_MAGIC, RESULTS_VERSION, len(columns), rows))
+        for name, values in columns.items():
+            file.write(RESULTS_COLUMN.pack(name.encode('ascii'), values.typecode.encode('ascii'), values.itemsize))
+        for values in columns.values():
+            # Stored little endian whatever machine wrote them
+            if values.itemsize > 1 and struct.pack('=H', 1) != struct.pack('<H', 1):
+                values = array(values.typecode, values)
+                values.byteswap()
+            file.write(values.tobytes())
+
+
+def sized_array(code: str, itemsize: int) -> array:
+    """
+    Make an array of the kind of values of a type code, but of a given size, which its code can have on another platform
+
+    :param code: Array type code the values were written with
+    :param itemsize: Size of the values written
+    :return: An empty array for the values
+    """
+    values = array(code)
+    if values.itemsize == itemsize:
+        return values
+    for candidate in ('bhilq' if code.islower() else 'BHILQ') if code in 'bhilqBHILQ' else ():
+        values = array(candidate)
+        if values.itemsize == itemsize:
+            return values
+    raise ValueError("No array type code %s of %d bytes." % (code, itemsize))
+
+
+def read_results(path: str) -> Dict[str, array]:
+    """
+    Read a results file
+
+    :param path: Path of the file
+    :return: The results, a column per name
+    """
+    with open(path, 'rb') as file:
+        data = file.read()
+    magic, version, count, rows = RESULTS_HEADER.unpack_from(data)
+    if magic != RESULTS_MAGIC or version != RESULTS_VERSION:
+        raise ValueError("Not a version %d results file." % RESULTS_VERSION)
+    offset = RESULTS_HEADER.size
+    names = list()
+    for _ in range(count):
+        name, code, itemsize = RESULTS_COLUMN.unpack_from(data, offset)
+        names.append((name.rstrip(b'\0').decode('ascii'), code.decode('ascii'), itemsize))
+        offset += RESULTS_COLUMN.size
+    columns = dict()
+    for name, code, itemsize in names:
+        values = sized_array(code, itemsize)
+        size = itemsize * rows
+        values.frombytes(data[offset:offset + size])
+        if values.itemsize > 1 and struct.pack('=H', 1) != struct.pack('<H', 1):
+            values.byteswap()
+        columns[name] = values
+        offset += size
+    return columns
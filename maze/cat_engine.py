@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from array import array
+from random import Random
+from typing import List, Optional, TYPE_CHECKING
+
+from maze.config import TILE_WIDTH, TILE_HEIGHT
+from maze.flow_field import FlowField, NO_STEP
+from maze.maze_generate import MazeMap, PASSAGES, RIGHT_HAND
+from maze.occupancy import OccupancyGrid
+
+if TYPE_CHECKING:
+    from maze.cats import Cat
+
+# Pixel and cell offsets of a step in each direction
+STEP_X = (-1, 0, 1, 0)
+STEP_Y = (0, -1, 0, 1)
+
+# Name and array type code of each column of cat state
+CAT_FIELDS = (('column', 'l'), ('row', 'l'), ('x', 'l'), ('y', 'l'), ('prev_x', 'l'), ('prev_y', 'l'),
+              ('direction', 'b'), ('speed', 'b'), ('activity', 'l'), ('in_transit', 'b'), ('chased', 'b'))
+
+
+class CatEngine:
+    """
+    The state of a group of cats held column by column, an array per field with a cat at the same index in each, and the
+    cats' moves worked out for all of them in one loop over the arrays.  The Cat entities are views onto their index, so
+    the rest of the game and the sprites drawing the cats see them as any other critter.
+    """
+    cats: List[Cat]
+    column: array
+    row: array
+    x: array
+    y: array
+    prev_x: array
+    prev_y: array
+    direction: array
+    speed: array
+    activity: array
+    in_transit: array
+    chased: array
+
+    def __init__(self):
+        self.cats = list()
+        for name, code in CAT_FIELDS:
+            setattr(self, name, array(code))
+
+    def __len__(self) -> int:
+        return len(self.cats)
+
+    def add(self, cat: Cat):
+        """
+        Add a cat.  A cat moving over from another engine brings its fields along, a new cat starts with every field
+        zero.
+
+        :param cat: The cat, its engine and index are set to its place here
+        """
+        previous = cat.__dict__.get('engine')
+        index = cat.index if previous is not None else 0
+        for name, _ in CAT_FIELDS:
+            getattr(self, name).append(getattr(previous, name)[index] if previous is not None else 0)
+        cat.engine = self
+        cat.index = len(self.cats)
+        self.cats.append(cat)
+
+    def remove(self, cat: Cat):
+        """
+        Take a cat out.  The last cat is moved into its place, and the cat taken out keeps its state in an engine of its
+        own, so it can still be looked at.
+
+        :param cat: The cat to take out
+        """
+        index = cat.index
+        last = len(self.cats) - 1
+        detached = CatEngine()
+        detached.add(cat)
+        for name, _ in CAT_FIELDS:
+            values = getattr(self, name)
+            getattr(detached, name)[0] = values[index]
+            values[index] = values[last]
+            values.pop()
+        moved = self.cats.pop()
+        if moved is not cat:
+            self.cats[index] = moved
+            moved.index = index
+
+    def update(self, maze: MazeMap, trail: FlowField, rng: Random, occupancy: OccupancyGrid,
+               first: int = 0, last: Optional[int] = None):
+        """
+        Move the cats one step.  Each cat that is between cells carries on, and each that got to a cell picks its next
+        way: away from the dog when chased, down the mouse's trail when it can smell it, or else wandering with a hand
+        on the wall.  Random choices are drawn cat by cat in order, so a game plays out the same whatever the number of
+        cats updated at once.
+
+        :param maze: The maze the cats are in, with its exit masks built
+        :param trail: Field leading to the mouse
+        :param rng: Random number generator of the game
+        :param occupancy: Occupancy grid of the game, updated as cats get to new cells
+        :param first: Index of the first cat to move
+        :param last: Index after the last cat to move, all of them by default
+        """
+        height = maze.height
+        masks = maze.exit_masks
+        steps = trail.steps
+        choice = rng.choice
+        randint = rng.randint
+        cats = self.cats
+        column = self.column
+        row = self.row
+        x = self.x
+        y = self.y
+        prev_x = self.prev_x
+        prev_y = self.prev_y
+        direction = self.direction
+        speed = self.speed
+        activity = self.activity
+        in_transit = self.in_transit
+        chased = self.chased
+
+        for index in range(first, len(cats) if last is None else last):
+            if not in_transit[index]:
+                cell = column[index] * height + row[index]
+                mask = masks[cell]
+                trail_step = steps[cell] if steps else NO_STEP
+                if chased[index]:
+                    direction[index] = choice(PASSAGES[mask][direction[index]])
+                    if speed[index] != 0:
+                        in_transit[index] = 1
+                elif trail_step != NO_STEP:
+                    # Close enough to smell the mouse, follow the trail straight to it
+                    direction[index] = trail_step
+                    speed[index] = 2
+                    in_transit[index] = 1
+                else:
+                    if activity[index] == 0:
+                        activity[index] = randint(5, 100)
+                        speed[index] = randint(0, 2)
+                        if speed[index] != 0:
+                            direction[index] = choice(PASSAGES[mask][4])
+                    else:
+                        activity[index] -= 1
+                    if speed[index] != 0:
+                        direction[index] = RIGHT_HAND[mask][direction[index]]
+                        in_transit[index] = 1
+
+            cat_x = x[index]
+            cat_y = y[index]
+            prev_x[index] = cat_x
+            prev_y[index] = cat_y
+            if in_transit[index]:
+                cat_direction = direction[index]
+                cat_speed = speed[index]
+                cat_x += STEP_X[cat_direction] * cat_speed
+                cat_y += STEP_Y[cat_direction] * cat_speed
+                x[index] = cat_x
+                y[index] = cat_y
+                if cat_y % TILE_HEIGHT == 0 and cat_x % TILE_WIDTH == 0:
+                    in_transit[index] = 0
+                    cat_column = column[index] + STEP_X[cat_direction]
+                    cat_row = row[index] + STEP_Y[cat_direction]
+                    column[index] = cat_column
+                    row[index] = cat_row
+                    cat = cats[index]
+                    cat._cell = occupancy.place(cat, cat._cell, cat_column, cat_row)
@@ -1,59 +1,91 @@
-from random import randint, choice
-from typing import Tuple, List, Optional
+from __future__ import annotations
 
-from pygame.rect import Rect
-from pygame.sprite import Group
-from pygame.surface import Surface
+from typing import Optional, TYPE_CHECKING
 
-from maze.tiles import Tiles
-from maze.maze_generate import MazeMap, EAST, WEST, NORTH, SOUTH, Point
+from maze.cat_engine import CatEngine
+from maze.entities import EntityGroup, Entity
+from maze.flow_field import FlowField
+from maze.maze_generate import MazeMap, EAST, WEST, NORTH, SOUTH
 from maze.mouse import Mouse, TheMouse
+from maze.placement import Placement, outside_start
 from maze.critters import Critter
 
+if TYPE_CHECKING:
+    from maze.simulation import Simulation
+
+# How close, in steps through the maze, a cat has to be to pick up the mouse's trail
+HUNT_RANGE = 12
+
 
 def eat_mouse(mouse: TheMouse):
     mouse.kill()
 
 
+class CatField:
+    """
+    Attribute of a Cat kept in a column of its CatEngine
+    """
+    name: str
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, cat: Optional[Cat], owner=None):
+        if cat is None:
+            return self
+        return getattr(cat.engine, self.name)[cat.index]
+
+    def __set__(self, cat: Cat, value):
+        getattr(cat.engine, self.name)[cat.index] = value
+
+
+class CatFlag(CatField):
+    """
+    Yes or no attribute of a Cat kept in a column of its CatEngine
+    """
+
+    def __get__(self, cat: Optional[Cat], owner=None):
+        if cat is None:
+            return self
+        return bool(getattr(cat.engine, self.name)[cat.index])
+
+
 class Cat(Critter):
-    activity: int
-    is_chased: bool
+    """
+    A cat.  Its state is kept in the arrays of the CatEngine of its group, which moves every cat of the group at once.
+    """
+    engine: CatEngine
+    index: int
     mouse_group: Optional[Mouse]
-
-    def __init__(self, mouse: Mouse, maze_map: MazeMap,
-                 critter_tiles: Tuple[Surface, Rect, Rect, Rect, Rect], *sprites):
+    trail: FlowField
+
+    _column = CatField('column')
+    _row = CatField('row')
+    x = CatField('x')
+    y = CatField('y')
+    prev_x = CatField('prev_x')
+    prev_y = CatField('prev_y')
+    _direction = CatField('direction')
+    speed = CatField('speed')
+    activity = CatField('activity')
+    in_transit = CatFlag('in_transit')
+    is_chased = CatFlag('chased')
+
+    def __init__(self, mouse: Mouse, game: Simulation, trail: FlowField, group: Optional[Cats] = None):
+        (group.engine if group is not None else CatEngine()).add(self)
         self.mouse_group = mouse
         self.is_chased = False
         self.activity = 0
-        super().__init__(maze_map, critter_tiles, *sprites)
-
-    def update(self):
-        mouse = self.mouse_group.sprite
-        if mouse is None:
+        self.trail = trail
+        super().__init__(game, group)
+
+    def update(self, *args):
+        """
+        Move this cat alone, Cats.update() moves them all at once
+        """
+        if self.mouse_group.sprite is None:
             return              # Player is either between lives after being ate. Or in game over state
-
-        assert isinstance(mouse, TheMouse)
-
-        if not self.in_transit:
-            if self.is_chased:
-                self.direction = choice(self.map.passages(self.column, self.row, self.direction))
-                if self.speed != 0:
-                    self.in_transit = True
-            else:
-                if self.activity == 0:
-                    self.activity = randint(5, 100)
-                    self.speed = randint(0, 2)
-                    if self.speed != 0:
-                        self.direction = choice(self.map.passages(self.column, self.row))
-                else:
-                    self.activity -= 1
-                if self.speed != 0:
-                    self.direction = self.map.right_hand_rule(Point(self.column, self.row), self.direction)
-                    self.in_transit = True
-                    # self.find_mouse()
-                    if self.column == mouse.column and self.row == mouse.row:
-                        self.eat_mouse()
-        super().update()
+        self.engine.update(self.maze_map, self.trail, self.game.rng, self.game.occupancy, self.index, self.index + 1)
 
     # def find_mouse(self):
     #     mouse_location = self.mouse_group.sprite.rect
@@ -96,59 +128,69 @@ class Cat(Critter):
         else:
             if dog_row == self.row and dog_row > self.row:
                 flee_direction = NORTH
-        self.direction = choice(self.map.passages(self.column, self.row, flee_direction))
+        self.direction = self.game.rng.choice(self.maze_map.passages(self.column, self.row, flee_direction))
 
         # Detect trapped cat
         if self.direction == current_direction and flee_direction != current_direction:
             self.speed = 0
 
 
-class Cats(Group):
-    cats: Tuple[Surface, Rect, Rect, Rect, Rect]
-    cell_width: int
-    cell_height: int
-    map: MazeMap
+class Cats(EntityGroup):
+    game: Simulation
     mouse: Mouse
-    background: Surface
+    trail: FlowField
+    engine: CatEngine
 
-    def __init__(self, tiles: Tiles, maze_map: MazeMap, mouse: Mouse, *sprites):
-        super(Cats, self).__init__()
-        self.add(*sprites)
-        self.cats = tiles.cats
-        self.map = maze_map
+    @property
+    def map(self) -> MazeMap:
+        return self.game.map
+
+    def __init__(self, game: Simulation, mouse: Mouse, *cats: Cat):
+        self.engine = CatEngine()
+        super(Cats, self).__init__(*cats)
+        self.game = game
         self.mouse = mouse
-        self.background = tiles.ground
+        self.trail = FlowField(game.map, HUNT_RANGE)
+
+    def reset(self, placement: Placement, count: int):
+        """
+        Put new cats in random cells, away from the start
 
-    def reset(self, exclude_list: List[Point], count: int):
+        :param placement: Placement of the level, the cells taken are taken out of it
+        :param count: Number of cats
+        """
         self.empty()
-        for _ in range(0, count):
-            cat = Cat(self.mouse, self.map, self.cats)
-            self.add(cat)
-            new_point = self.map.get_rand_cell()
-            while new_point in exclude_list or new_point < Point(10, 10):
-                new_point = self.map.get_rand_cell()
-            cat.column = new_point.col
-            cat.row = new_point.row
+        self.trail = FlowField(self.map, HUNT_RANGE)
+        for cell in placement.take(count, self.game.rng, outside_start(self.map.height)):
+            cat = Cat(self.mouse, self.game, self.trail, self)
+            cat.column, cat.row = divmod(cell, self.map.height)
             cat.speed = 1
 
-            exclude_list.append(new_point)
+    def add(self, *entities: Entity):
+        super().add(*entities)
+        # Cats made on their own, or taken from another group, move their state into this group's engine
+        for entity in entities:
+            if isinstance(entity, Cat) and entity.engine is not self.engine:
+                self.engine.add(entity)
 
-    def here_kitty_kitty(self) -> List[Tuple[Cat, int, int]]:
-        locs = list()
-        for cat in self:
-            if isinstance(cat, Cat):
-                locs.append((cat, cat.column, cat.row))
-        return locs
+    def remove(self, entity: Entity):
+        super().remove(entity)
+        if isinstance(entity, Cat) and entity.engine is self.engine:
+            self.engine.remove(entity)
 
     def ate_the_mouse(self):
         pass
 
-    def update(self, *args, **kwargs) -> None:
-        restore_tiles = args[0]
-        assert isinstance(restore_tiles, list)
-        for cat in self:
-            restore_tiles.append(cat.rect.copy())
-        super().update(*args, **kwargs)
-
-    def draw(self, surface: Surface) -> None:
-        super().draw(surface)
+    def update(self, *args) -> None:
+        # One search from the mouse serves every cat, and only when the mouse gets to a new cell
+        mouse = self.mouse.sprite
+        if mouse is None:
+            return              # Player is either between lives after being ate. Or in game over state
+        self.trail.update(mouse.column, mouse.row)
+        self.engine.update(self.map, self.trail, self.game.rng, self.game.occupancy)
+
+        # Any cat that made it to the mouse's cell eats it
+        for entity in self.game.occupancy.at(mouse.column, mouse.row):
+            if isinstance(entity, Cat) and not entity.in_transit:
+                entity.eat_mouse()
+                break
@@ -0,0 +1,157 @@
+from collections import OrderedDict
+from typing import Optional, Tuple, List
+
+from pygame import Rect
+from pygame.surface import Surface
+
+from maze.config import TILE_WIDTH, TILE_HEIGHT, CHUNK_TILES, CHUNK_BUDGET, BACKGROUND_COLOR
+from maze.maze_generate import MazeMap, StreamingMazeMap
+
+
+class ChunkCache:
+    """
+    The maze rendered in square chunks of tiles.  Chunks are only rendered when a part of them is drawn, and the least
+    recently drawn chunks are dropped once the cache grows past its memory budget, so the memory used depends on the
+    size of the view and not the size of the maze.
+    """
+    wall: Surface
+    ground: Surface
+    ground_chunk: Surface
+    background_color = BACKGROUND_COLOR
+
+    chunk_tiles: int
+    chunk_width: int
+    chunk_height: int
+    budget: int
+    size: int
+    chunks: 'OrderedDict[Tuple[int, int], Surface]'
+    spares: List[Surface]
+    map: Optional[MazeMap]
+
+    def __init__(self, wall: Surface, ground: Surface, chunk_tiles: int = CHUNK_TILES, budget: int = CHUNK_BUDGET):
+        """
+        Initialize an empty cache
+
+        :param wall: Tile drawn for the walls
+        :param ground: Tile drawn for the passages
+        :param chunk_tiles: Number of tiles across and down a chunk
+        :param budget: Number of bytes of chunk surfaces to keep before the least recently used ones are dropped
+        """
+        self.wall = wall
+        self.ground = ground
+        self.chunk_tiles = chunk_tiles
+        self.chunk_width = chunk_tiles * TILE_WIDTH
+        self.chunk_height = chunk_tiles * TILE_HEIGHT
+        # Chunks start as a copy of a chunk of nothing but ground, so only the walls are drawn per chunk
+        self.ground_chunk = Surface((self.chunk_width, self.chunk_height), 0, ground)
+        self.ground_chunk.blits([(ground, (column * TILE_WIDTH, row * TILE_HEIGHT))
+                                 for column in range(chunk_tiles) for row in range(chunk_tiles)], doreturn=False)
+        self.budget = budget
+        self.size = 0
+        self.chunks = OrderedDict()
+        self.spares = list()
+        self.map = None
+
+    def reset(self, maze: MazeMap):
+        """
+        Drop all the chunks and start rendering a new maze.  The surfaces of the dropped chunks are reused for the new
+        maze's chunks.
+
+        :param maze: The maze to render
+        """
+        self.map = maze
+        self.spares.extend(self.chunks.values())
+        self.chunks.clear()
+        self.size = 0
+
+    def invalidate_rows(self, first: int, last: int):
+        """
+        Drop the chunks holding any of the rows first to last - 1, for when those rows of the maze change.  Their
+        surfaces are kept to render the next chunks into.
+
+        :param first: First row that changed
+        :param last: Row after the last row that changed
+        """
+        first //= self.chunk_tiles
+        last = (last - 1) // self.chunk_tiles
+        for key in [key for key in self.chunks if first <= key[1] <= last]:
+            dropped = self.chunks.pop(key)
+            self.size -= self._surface_size(dropped)
+            self.spares.append(dropped)
+
+    def chunk(self, chunk_col: int, chunk_row: int) -> Surface:
+        """
+        Get a chunk, rendering it if it is not in the cache
+
+        :param chunk_col: Column of the chunk, in chunks
+        :param chunk_row: Row of the chunk, in chunks
+        :return: The chunk's surface
+        """
+        key = chunk_col, chunk_row
+        surface = self.chunks.get(key)
+        if surface is not None:
+            self.chunks.move_to_end(key)
+            return surface
+
+        surface = self._render(chunk_col, chunk_row)
+        self.chunks[key] = surface
+        self.size += self._surface_size(surface)
+        # Never drop the chunk just rendered, even when the budget is smaller than one chunk
+        while self.size > self.budget and len(self.chunks) > 1:
+            _, dropped = self.chunks.popitem(last=False)
+            self.size -= self._surface_size(dropped)
+            self.spares.append(dropped)
+        return surface
+
+    def blit(self, surface: Surface, dest: Tuple[int, int], area: Rect):
+        """
+        Draw a part of the maze
+
+        :param surface: Surface to draw to
+        :param dest: Where on the surface the top left of area is drawn
+        :param area: Part of the maze to draw, in maze pixels
+        """
+        offset_x = dest[0] - area.left
+        offset_y = dest[1] - area.top
+        for chunk_row in range(area.top // self.chunk_height, (area.bottom - 1) // self.chunk_height + 1):
+            for chunk_col in range(area.left // self.chunk_width, (area.right - 1) // self.chunk_width + 1):
+                chunk_rect = Rect(chunk_col * self.chunk_width, chunk_row * self.chunk_height,
+                                  self.chunk_width, self.chunk_height)
+                part = chunk_rect.clip(area)
+                surface.blit(self.chunk(chunk_col, chunk_row), (part.left + offset_x, part.top + offset_y),
+                             part.move(-chunk_rect.left, -chunk_rect.top))
+
+    def _render(self, chunk_col: int, chunk_row: int) -> Surface:
+        """
+        Render a chunk of the maze.  The parts of the chunk past the edges of the maze are left the background color.
+        """
+        maze = self.map
+        if self.spares:
+            surface = self.spares.pop()
+            surface.blit(self.ground_chunk, (0, 0))
+        else:
+            surface = self.ground_chunk.copy()
+        first_col = chunk_col * self.chunk_tiles
+        first_row = chunk_row * self.chunk_tiles
+        last_col = min(first_col + self.chunk_tiles, maze.width)
+        last_row = first_row + self.chunk_tiles
+        if not isinstance(maze, StreamingMazeMap):
+            last_row = min(last_row, maze.height)
+
+        wall = self.wall
+        is_wall = maze.is_wall
+        surface.blits([(wall, ((column - first_col) * TILE_WIDTH, (row - first_row) * TILE_HEIGHT))
+                       for column in range(first_col, last_col) for row in range(first_row, last_row)
+                       if is_wall(column, row)], doreturn=False)
+
+        right = max(0, last_col - first_col) * TILE_WIDTH
+        if right < self.chunk_width:
+            surface.fill(self.background_color, Rect(right, 0, self.chunk_width - right, self.chunk_height))
+        bottom = max(0, last_row - first_row) * TILE_HEIGHT
+        if bottom < self.chunk_height:
+            surface.fill(self.background_color, Rect(0, bottom, self.chunk_width, self.chunk_height - bottom))
+        return surface
+
+    @staticmethod
+    def _surface_size(surface: Surface) -> int:
+        return surface.get_pitch() * surface.get_height()
@@ -1,3 +1,5 @@
+import os
+
 WIDTH = 20
 HEIGHT = 20
 
@@ -14,6 +16,18 @@ DIGIT_WIDTH = TILE_WIDTH // 2
 SURFACE_WIDTH = TILE_WIDTH * MAZE_WIDTH
 SURFACE_HEIGHT = TILE_HEIGHT * MAZE_HEIGHT
 
+# The maze is rendered in square chunks of this many tiles, and at most CHUNK_BUDGET bytes of chunks are kept
+CHUNK_TILES = 16
+CHUNK_BUDGET = 32 * 1024 * 1024
+
+# The game is simulated at a fixed STEP_RATE steps a second whatever the frame rate, which is capped at FRAME_RATE.  A
+# long frame catches up at most MAX_STEPS steps, the rest of the time is dropped so the game slows instead of stalling.
+STEP_RATE = 40
+FRAME_RATE = 120
+MAX_STEPS = 5
+# Fraction bits of the fixed point blend between the last two steps that sprites are drawn at
+FIXED_SHIFT = 8
+FIXED_ONE = 1 << FIXED_SHIFT
 
 # Size of the game play area
 PLAY_WIDTH = WIDTH * TILE_WIDTH
@@ -34,3 +48,6 @@ BOARD_WIDTH = PLAY_WIDTH
 BOARD_HEIGHT = PLAY_HEIGHT + HEAD_HEIGHT
 
 BACKGROUND_COLOR = (156, 102, 47)
+
+# The tiles are decoded once and kept here as raw pixels, so later starts do not decode them again
+ASSET_CACHE = os.path.join(os.path.expanduser('~'), '.cache', 'maze_game', 'atlas.bin')
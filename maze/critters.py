@@ -1,38 +1,34 @@
-from typing import Tuple, Optional
+from __future__ import annotations
 
-from pygame.rect import Rect
-from pygame.sprite import GroupSingle
-from pygame.surface import Surface
+from typing import Optional, TYPE_CHECKING, Tuple
 
+from maze.config import TILE_WIDTH, TILE_HEIGHT
+from maze.entities import Entity, EntitySingle
 from maze.maze_generate import MazeMap, WEST, NORTH, EAST, SOUTH
-from maze.mouse import TheMouse
-from maze.sprites import MazeSprite
-from maze.tiles import Tiles
 
+if TYPE_CHECKING:
+    from maze.simulation import Simulation
 
-class Critter(MazeSprite):
+
+class Critter(Entity):
     """
-    A sub class of MazeSprite add functionality that is common to the dog and cat
+    A sub class of Entity add functionality that is common to the dog and cat
     """
 
-    tiles: Surface
-    dir_rects: Tuple[Rect, Rect, Rect, Rect]
     _direction: int
     in_transit: bool
     speed: int
     speeds = [(-1, 0), (0, -1), (1, 0), (0, 1)]
 
-    def __init__(self, maze_map: MazeMap, critter_tiles: Tuple[Surface, Rect, Rect, Rect, Rect], *groups):
+    def __init__(self, game: Simulation, group: Optional[EntitySingle] = None):
         """
         Initialize the critter specific fields
 
-        :param maze_map: the MazeMap of the maze the critter lives in
-        :param critter_tiles: The critter's tile tuple
-        :param groups:  Any groups the critter sprite is associated with
+        :param game: the simulation the critter lives in
+        :param group: Group the critter is added to
         """
-        super().__init__(maze_map, *groups)
+        super().__init__(game, group)
 
-        self.tiles, *self.dir_rects = critter_tiles
         self.direction = 0
         self.speed = 2
         self.in_transit = False
@@ -48,7 +44,6 @@ class Critter(MazeSprite):
     def direction(self, value):
         assert 0 <= value < 4
         self._direction = value
-        self.image = self.tiles.subsurface(self.dir_rects[value])
 
     @property
     def current_loc(self):
@@ -56,70 +51,77 @@ class Critter(MazeSprite):
 
     def move_west(self):
         """
-        Start the sprite moving to the location to the west
+        Start the critter moving to the location to the west
         """
         self.in_transit = True
         self.direction = WEST
 
     def move_north(self):
         """
-        Start the sprite moving to the location to the north
+        Start the critter moving to the location to the north
         """
         self.in_transit = True
         self.direction = NORTH
 
     def move_east(self):
         """
-        Start the sprite moving to the location to the east
+        Start the critter moving to the location to the east
         """
         self.in_transit = True
         self.direction = EAST
 
     def move_south(self):
         """
-        Start the sprite moving to the location to the south
+        Start the critter moving to the location to the south
         """
         self.in_transit = True
         self.direction = SOUTH
 
-    def update(self):
+    def update(self, *args):
         """
-        Update the critter's sprite location for the next frame
+        Update the critter's location for the next step, keeping where it was to draw it between the two
         """
+        prev_x = self.x
+        prev_y = self.y
         if self.in_transit:
             mask = self.speeds[self._direction]
-            self.rect = self.rect.move(mask[0] * self.speed, mask[1] * self.speed)
-            if (self.rect.top % 32 == 0) and (self.rect.left % 32 == 0):
+            self.x += mask[0] * self.speed
+            self.y += mask[1] * self.speed
+            if (self.y % TILE_HEIGHT == 0) and (self.x % TILE_WIDTH == 0):
                 self.in_transit = False
                 self.column += [-1, 0, 1, 0][self._direction]
                 self.row += [0, -1, 0, 1][self._direction]
+        # Set after the move, arriving at the next cell is still drawn as a move from the last step
+        self.prev_x = prev_x
+        self.prev_y = prev_y
 
 
-class CritterGroup(GroupSingle):
-    tiles: Tuple[Surface, Rect, Rect, Rect, Rect]
+class CritterGroup(EntitySingle):
+    game: Simulation
 
-    def __init__(self, maze_map: MazeMap, critter: Tuple[Surface, Rect, Rect, Rect, Rect], critter_class):
-        self.tiles = critter
+    def __init__(self, game: Simulation, critter_class):
+        super().__init__()
         self.critter_class = critter_class
-        super().__init__(critter_class(maze_map, self.tiles))
-
-    def update(self, *args, **kwargs) -> bool:
-        restore_tiles = args[0]
-        assert isinstance(restore_tiles, list)
+        self.game = game
+        critter_class(game, self)
 
+    def update(self, *args) -> bool:
         if self.sprite is None:
             return False
-        restore_tiles.append(self.sprite.rect.copy())
         super().update()
         return True
 
-    def critter_reset(self, maze_map: MazeMap):
-        self.add(self.critter_class(maze_map, self.tiles))
+    def critter_reset(self):
+        if self.sprite is not None:
+            self.sprite.kill()
+        self.critter_class(self.game, self)
 
-    def get_location(self) -> Optional[Rect]:
+    def get_location(self) -> Optional[Tuple[int, int]]:
+        """
+        Get the pixel position of the critter in the maze, or None if there is no critter
+        """
         if self.sprite:
-            assert isinstance(self.sprite, Critter)
-            return self.sprite.rect.copy()
+            return self.sprite.x, self.sprite.y
         return None
 
     @property
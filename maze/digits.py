@@ -11,12 +11,17 @@ WORD_WIDTH = 5 * DIGIT_WIDTH
 
 
 class Digits:
+    """
+    A number drawn with a digit sheet.  The digits are only drawn again after the value changes, until then draw() is a
+    single blit of the digits drawn last.
+    """
     is_byte: bool
     digits: Surface
     digit_rects: List[Rect]
     _value: int
     value_list: List[int]
     display: Surface
+    dirty: bool
 
     @property
     def value(self):
@@ -24,27 +29,34 @@ class Digits:
 
     @value.setter
     def value(self, value: int):
-        self._value = value if value >= 0 else 0
-        self._value &= 0xFF if self.is_byte else 0xFFFF
+        value = value if value >= 0 else 0
+        value &= 0xFF if self.is_byte else 0xFFFF
+        if value == self._value:
+            return
+        self._value = value
         self.value_list = [int(x) for x in list(str(self._value))]
+        self.dirty = True
 
     def __init__(self, tiles: Tiles, color: int, value: int = 0, is_byte: bool = False):
         if DC_BLUE > color > DC_YELLOW:
             raise ValueError("%d is not a valid color index." % color)
-        self.digits = tiles.digits[color]
+        self.digits = tiles.digit_sheet(color)
         self.digit_rects = tiles.digit_rects
         self.is_byte = is_byte
+        # Never a value, so the first one is drawn
+        self._value = -1
         self.value = value
 
         size = BYTE_WIDTH if self.is_byte else WORD_WIDTH, 32
         self.display = Surface(size)
 
     def draw(self, surface: Surface, dest_rect: Rect):
-        self.display.fill(BACKGROUND_COLOR)
-
-        for idx, digit in enumerate(self.value_list):
-            digit_location = 16 * idx
-            self.display.blit(self.digits, Rect(digit_location, 0, 16, 32), self.digit_rects[digit])
+        if self.dirty:
+            self.display.fill(BACKGROUND_COLOR)
+            for idx, digit in enumerate(self.value_list):
+                digit_location = 16 * idx
+                self.display.blit(self.digits, Rect(digit_location, 0, 16, 32), self.digit_rects[digit])
+            self.dirty = False
 
         surface.blit(self.display, dest_rect)
 
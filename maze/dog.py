@@ -1,35 +1,36 @@
-from random import choice
-from typing import Tuple
+from __future__ import annotations
 
-from pygame import Surface, Rect
+from typing import Optional, TYPE_CHECKING
 
 from maze.cats import Cats, Cat
 from maze.critters import Critter, CritterGroup
-from maze.maze_generate import MazeMap
+from maze.entities import EntitySingle
 from maze.mouse import TheMouse
-from maze.tiles import Tiles
+
+if TYPE_CHECKING:
+    from maze.simulation import Simulation
 
 
 class TheDog(Critter):
     cats: Cats
     cats_ate: int
 
-    def __init__(self, maze_map: MazeMap, critter_tiles: Tuple[Surface, Rect, Rect, Rect, Rect], cats: Cats, *groups):
-        super().__init__(maze_map, critter_tiles, *groups)
+    def __init__(self, game: Simulation, group: Optional[EntitySingle] = None):
+        super().__init__(game, group)
         self.column = 1
         self.row = 1
-        self.direction = choice(self.map.passages(self.column, self.row))
-        self.cats = cats
+        self.direction = game.rng.choice(self.maze_map.passages(self.column, self.row))
+        self.cats = game.cats
         self.cats_ate = 0
 
-    def update(self):
+    def update(self, *args):
         super().update()
-        cat_locations = self.cats.here_kitty_kitty()
-        for cat, cat_column, cat_row in cat_locations:
-            if self.column == cat_column and self.row == cat_row:
-                dog_group = self.groups()[0]
+        # Copy the cats here, eating one changes the grid
+        for entity in list(self.game.occupancy.at(self.column, self.row)):
+            if isinstance(entity, Cat):
+                dog_group = self.group
                 assert isinstance(dog_group, Dog)
-                dog_group.eat_cat(cat)
+                dog_group.eat_cat(entity)
 
 
 class DogBlew(Exception):
@@ -40,12 +41,10 @@ class Dog(CritterGroup):
     dog: Critter
     cats_ate: int
 
-    def __init__(self, tiles: Tiles, maze_map: MazeMap):
-        self.tiles_mouse = tiles.mice
-        self.tiles_dog = tiles.dogs
+    def __init__(self, game: Simulation):
         self.cats_ate = 0
 
-        super().__init__(maze_map, tiles.dogs, TheDog)
+        super().__init__(game, TheDog)
 
     def activate(self, mouse: TheMouse):
         assert isinstance(self.sprite, TheDog)
@@ -65,4 +64,4 @@ class Dog(CritterGroup):
             self.pop()
 
     def pop(self):
-        raise DogBlew()
\ No newline at end of file
+        raise DogBlew()
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Dict, Iterator, List
+
+from maze.config import TILE_WIDTH, TILE_HEIGHT
+from maze.maze_generate import MazeMap
+
+if TYPE_CHECKING:
+    from maze.simulation import Simulation
+
+
+class Entity:
+    """
+    Something positioned in a cell of the maze.  Entities are only the state of the game, they know nothing of how they
+    are drawn and do not need pygame, so the game can be simulated without a display.
+    """
+    _column: int
+    _row: int
+    _cell: Optional[int]
+    x: int
+    y: int
+    prev_x: int
+    prev_y: int
+    game: Simulation
+    group: Optional[EntityGroup]
+
+    @property
+    def maze_map(self) -> MazeMap:
+        return self.game.map
+
+    def __init__(self, game: Simulation, group: Optional[EntityGroup] = None) -> None:
+        """
+        Initialize the entity at the top left of the maze
+
+        :param game: the simulation the entity lives in
+        :param group: group to add the entity to
+        """
+        self._column = 0
+        self._row = 0
+        self._cell = None
+        self.x = 0
+        self.y = 0
+        self.prev_x = 0
+        self.prev_y = 0
+        self.game = game
+        self.group = None
+        if group is not None:
+            group.add(self)
+
+    def _compute_location(self):
+        """
+        Update our pixel position to reflect current location in maze, and our place in the game's occupancy grid.  This
+        is internal function is called from the row and column setters.  The entity jumps there, so it is not drawn
+        moving from where it was.
+        """
+        self.y = self.prev_y = self._row * TILE_HEIGHT
+        self.x = self.prev_x = self._column * TILE_WIDTH
+        self._cell = self.game.occupancy.place(self, self._cell, self._column, self._row)
+
+    def kill(self) -> None:
+        """
+        Take the entity out of the game
+        """
+        if self._cell is not None:
+            self.game.occupancy.remove(self, self._cell)
+            self._cell = None
+        if self.group is not None:
+            self.group.remove(self)
+
+    def alive(self) -> bool:
+        return self.group is not None
+
+    def update(self, *args) -> None:
+        pass
+
+    @property
+    def column(self):
+        """
+        Property holding the column where the entity is positioned in the maze
+        """
+        return self._column
+
+    @column.setter
+    def column(self, value):
+        self._column = value
+        self._compute_location()
+
+    @property
+    def row(self):
+        """
+        Property holding the row of where the entity is positioned in the maze
+        """
+        return self._row
+
+    @row.setter
+    def row(self, value):
+        self._row = value
+        self._compute_location()
+
+
+class EntityGroup:
+    """
+    Collection of entities, kept in the order they were added.  An entity is in at most one group.
+    """
+    entities: Dict[Entity, None]
+
+    def __init__(self, *entities: Entity):
+        self.entities = dict()
+        self.add(*entities)
+
+    def add(self, *entities: Entity):
+        for entity in entities:
+            if entity.group is not None:
+                entity.group.remove(entity)
+            entity.group = self
+            self.entities[entity] = None
+
+    def remove(self, entity: Entity):
+        if self.entities.pop(entity, False) is None:
+            entity.group = None
+
+    def sprites(self) -> List[Entity]:
+        """
+        Get a list of the entities, safe to keep while the group changes
+        """
+        return list(self.entities)
+
+    def empty(self):
+        for entity in self.sprites():
+            entity.kill()
+
+    def update(self, *args) -> None:
+        for entity in self.sprites():
+            entity.update(*args)
+
+    def __iter__(self) -> Iterator[Entity]:
+        return iter(self.sprites())
+
+    def __contains__(self, entity: Entity) -> bool:
+        return entity in self.entities
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def __bool__(self) -> bool:
+        return bool(self.entities)
+
+
+class EntitySingle(EntityGroup):
+    """
+    Group holding a single entity, adding another one replaces it
+    """
+
+    @property
+    def sprite(self) -> Optional[Entity]:
+        for entity in self.entities:
+            return entity
+        return None
+
+    def add(self, *entities: Entity):
+        if entities:
+            for entity in self.sprites():
+                self.remove(entity)
+            super().add(entities[-1])
@@ -0,0 +1,110 @@
+from array import array
+from typing import Optional, Tuple
+
+from maze.maze_generate import MazeMap, StreamingMazeMap, EXITS, NORTH, EAST, SOUTH, WEST
+
+UNREACHED = -1
+NO_STEP = 0xFF
+
+
+class FlowField:
+    """
+    Breadth first distance field over a maze towards a target location, such as the mouse.  Every reached cell holds
+    its distance to the target and the direction of its first step along a shortest path there, so any number of
+    critters can look up their way to the target in constant time.  The field is only worked out again when the target
+    moves to another cell or the maze changes.
+    """
+    maze: MazeMap
+    limit: Optional[int]
+    target: Optional[Tuple[int, int]]
+    distances: array
+    steps: bytearray
+    _masks: Optional[bytearray]
+
+    def __init__(self, maze: MazeMap, limit: Optional[int] = None):
+        """
+        Initialize an empty field over a maze
+
+        :param maze: The maze the field covers
+        :param limit: Furthest distance from the target the field is worked out to, or None to cover the whole maze
+        """
+        if isinstance(maze, StreamingMazeMap):
+            raise ValueError("A flow field can not be worked out over an endless maze, it has no exit masks.")
+        self.maze = maze
+        self.limit = limit
+        self.target = None
+        self.distances = array('l')
+        self.steps = bytearray()
+        self._masks = None
+
+    def update(self, col: int, row: int) -> bool:
+        """
+        Move the target, working the field out again if the target changed cell or the maze changed
+
+        :param col: Column of the target
+        :param row: Row of the target
+        :return: True if the field was worked out again
+        """
+        maze = self.maze
+        if maze.exit_masks is None:
+            maze.build_exits()
+        if self.target == (col, row) and self._masks is maze.exit_masks:
+            return False
+        self.target = (col, row)
+        self._masks = maze.exit_masks
+        self._search(maze.index(col, row))
+        return True
+
+    def _search(self, start: int):
+        """
+        Breadth first search out from the target, recording for every cell reached the way back towards it
+        """
+        masks = self._masks
+        height = self.maze.height
+        count = len(masks)
+        limit = count if self.limit is None else self.limit
+        offsets = (-height, -1, height, 1)     # Indexed by direction: west, north, east, south
+        back = (EAST, SOUTH, WEST, NORTH)
+
+        distances = array('l', [UNREACHED]) * count
+        steps = bytearray([NO_STEP]) * count
+        distances[start] = 0
+
+        frontier = [start]
+        distance = 0
+        while frontier and distance < limit:
+            distance += 1
+            next_frontier = []
+            for cell in frontier:
+                for direction in EXITS[masks[cell]]:
+                    neighbour = cell + offsets[direction]
+                    if distances[neighbour] == UNREACHED:
+                        distances[neighbour] = distance
+                        steps[neighbour] = back[direction]
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+
+        self.distances = distances
+        self.steps = steps
+
+    def distance(self, col: int, row: int) -> int:
+        """
+        Get how far a location is from the target
+
+        :param col: column of the maze location
+        :param row: row of the maze location
+        :return: Number of steps to the target, or UNREACHED if the location is out of the field's reach
+        """
+        return self.distances[self.maze.index(col, row)] if self.distances else UNREACHED
+
+    def next_step(self, col: int, row: int) -> Optional[int]:
+        """
+        Get the direction to take from a location to get closer to the target
+
+        :param col: column of the maze location
+        :param row: row of the maze location
+        :return: The direction, or None if at the target or out of the field's reach
+        """
+        step = self.steps[self.maze.index(col, row)] if self.steps else NO_STEP
+        return None if step == NO_STEP else step
+
@@ -1,58 +1,118 @@
+from typing import Optional, List, Tuple
+
 from pygame import Surface
 from pygame.rect import Rect
 
 from maze.config import HEAD_WIDTH, HEAD_HEIGHT, DIGIT_WIDTH, BACKGROUND_COLOR
 from maze.digits import Digits, BYTE_WIDTH, WORD_WIDTH
 from maze.maze_generate import NORTH
-from maze.tiles import Tiles, DC_CYAN, DC_YELLOW, DC_WHITE
+from maze.profiler import FrameProfiler
+from maze.tiles import Tiles, DC_CYAN, DC_YELLOW, DC_WHITE, DC_GREEN, DC_RED
 
 LIVES_POS = HEAD_WIDTH - (4 * DIGIT_WIDTH)
 BONES_POS = HEAD_WIDTH - (11 * DIGIT_WIDTH)
 SCORE_POS = DIGIT_WIDTH
+# The profile overlay, the last frame time and p99 frame time in microseconds, between the score and the bones
+FRAME_TIME_POS = SCORE_POS + WORD_WIDTH + DIGIT_WIDTH
+FRAME_P99_POS = FRAME_TIME_POS + WORD_WIDTH + DIGIT_WIDTH
 
 LIVES_ICON_POS = HEAD_WIDTH - (6 * DIGIT_WIDTH)
 BONES_ICON_POS = HEAD_WIDTH - (13 * DIGIT_WIDTH)
 
 
 class GameState(object):
+    """
+    The HUD row above the maze.  Each number is a widget that is only drawn again when its value changes, so a frame
+    where nothing changed costs no blits.
+    """
     lives: Digits
     bones: Digits
     score: Digits
+    profiler: Optional[FrameProfiler]
+    frame_time: Optional[Digits]
+    frame_p99: Optional[Digits]
 
     lives_icon: Surface
     bones_icon: Surface
 
     display: Surface
+    widgets: List[Tuple[Digits, Rect]]
+    full_redraw: bool
     lives_rect = Rect(LIVES_POS, 0, BYTE_WIDTH, 32)
     bones_rect = Rect(BONES_POS, 0, BYTE_WIDTH, 32)
     score_rect = Rect(SCORE_POS, 0, WORD_WIDTH, 32)
+    frame_time_rect = Rect(FRAME_TIME_POS, 0, WORD_WIDTH, 32)
+    frame_p99_rect = Rect(FRAME_P99_POS, 0, WORD_WIDTH, 32)
 
     lives_icon_rect = Rect(LIVES_ICON_POS, 0, 32, 32)
     bones_icon_rect = Rect(BONES_ICON_POS, 0, 32, 32)
 
-    def __init__(self, tiles: Tiles):
+    def __init__(self, tiles: Tiles, profiler: Optional[FrameProfiler] = None):
+        """
+        Initialize the HUD
+
+        :param tiles: Tiles the HUD is drawn with
+        :param profiler: Profiler whose frame times are shown, if it is enabled
+        """
         self.score = Digits(tiles, DC_CYAN)
         self.lives = Digits(tiles, DC_YELLOW, is_byte=True)
         self.bones = Digits(tiles, DC_WHITE, is_byte=True)
+        # The frame times are only shown when profiling, so their colors are not decoded otherwise
+        self.profiler = profiler if profiler is not None and profiler.enabled else None
+        self.frame_time = Digits(tiles, DC_GREEN) if self.profiler is not None else None
+        self.frame_p99 = Digits(tiles, DC_RED) if self.profiler is not None else None
 
         self.display = Surface((HEAD_WIDTH, HEAD_HEIGHT))
 
-        mice, *mice_rects = tiles.mice
-        self.lives_icon = mice.subsurface(mice_rects[NORTH])
+        self.lives_icon = tiles.mouse_frames[NORTH]
         self.bones_icon = tiles.bone
 
+        self.widgets = [(self.score, self.score_rect), (self.bones, self.bones_rect), (self.lives, self.lives_rect)]
+        if self.profiler is not None:
+            self.widgets += [(self.frame_time, self.frame_time_rect), (self.frame_p99, self.frame_p99_rect)]
+        self.full_redraw = True
+
+    def invalidate(self):
+        """
+        Draw the whole HUD on the next draw(), for when the screen under it was drawn over
+        """
+        self.full_redraw = True
+
     def new_game(self):
         self.score.value = 0
         self.lives.value = 3
         self.bones.value = 0
 
-    def draw(self, surface: Surface, dest_rect: Rect):
-        self.display.fill(BACKGROUND_COLOR)
-        self.score.draw(self.display, self.score_rect)
-        self.display.blit(self.bones_icon, self.bones_icon_rect)
-        self.bones.draw(self.display, self.bones_rect)
-        self.display.blit(self.lives_icon, self.lives_icon_rect)
-        self.lives.draw(self.display, self.lives_rect)
+    def draw(self, surface: Surface, dest_rect: Rect) -> List[Rect]:
+        """
+        Draw the widgets that changed since the last draw
+
+        :param surface: Surface to draw the HUD on
+        :param dest_rect: Where the HUD is on the surface
+        :return: The rectangles of the surface that changed
+        """
+        if self.profiler is not None:
+            self.frame_time.value = min(int(self.profiler.last_frame() * 1000000), 0xFFFF)
+            # Sorting the kept frames is not free, so the p99 is only worked out now and then
+            if self.profiler.count % 32 == 0:
+                self.frame_p99.value = min(int(self.profiler.percentiles()[-1] * 1000000), 0xFFFF)
+
+        if self.full_redraw:
+            self.full_redraw = False
+            self.display.fill(BACKGROUND_COLOR)
+            self.display.blit(self.bones_icon, self.bones_icon_rect)
+            self.display.blit(self.lives_icon, self.lives_icon_rect)
+            for digits, rect in self.widgets:
+                digits.draw(self.display, rect)
+            surface.blit(self.display, dest_rect)
+            return [dest_rect]
 
-        surface.blit(self.display, dest_rect)
+        changed = list()
+        for digits, rect in self.widgets:
+            if digits.dirty:
+                digits.draw(self.display, rect)
+                dest = rect.move(dest_rect.topleft)
+                surface.blit(self.display, dest, rect)
+                changed.append(dest)
+        return changed
 
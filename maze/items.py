@@ -1,66 +1,78 @@
-from typing import List
+from __future__ import annotations
 
-from pygame.sprite import Group
-from pygame.surface import Surface
+from typing import List, Optional, TYPE_CHECKING
 
-from maze.game_state import GameState
+from maze.entities import Entity, EntityGroup
 from maze.maze_generate import MazeMap, Point
 from maze.mouse import TheMouse
-from maze.sprites import MazeSprite
+from maze.placement import Placement
 
+if TYPE_CHECKING:
+    from maze.simulation import Simulation
 
-class Item(MazeSprite):
-    game_state: GameState
+
+class Item(Entity):
     score_delta: int
     bone_delta: int
 
-    def __init__(self, col: int, row: int, game_state: GameState, maze_map: MazeMap,
-                 tile: Surface, score_delta: int, bone_delta: int, *groups):
-        super().__init__(maze_map, *groups)
-        self.image = tile
+    def __init__(self, col: int, row: int, game: Simulation, score_delta: int, bone_delta: int,
+                 group: Optional[EntityGroup] = None):
+        super().__init__(game, group)
         self.column = col
         self.row = row
-        self.game_state = game_state
         self.score_delta = score_delta
         self.bone_delta = bone_delta
 
-    def update(self, *args, **kwargs) -> None:
-        mouse = args[0]
+    def update(self, *args) -> None:
+        mouse, = args
         if mouse is None:
             return
         assert isinstance(mouse, TheMouse)
         if self.column == mouse.column and self.row == mouse.row:
-            self.game_state.score += self.score_delta
-            self.game_state.bones += self.bone_delta
+            self.game.score.score += self.score_delta
+            self.game.score.bones += self.bone_delta
             self.kill()
 
 
-class ItemGroup(Group):
-    game_state: GameState
+class ItemGroup(EntityGroup):
     item_count: int
-    tile: Surface
-    map: MazeMap
+    game: Simulation
     score_delta: int
     bone_delta: int
 
-    def __init__(self, game_state: GameState, maze_map: MazeMap, tile: Surface, score_delta: int, bone_delta: int):
-        super().__init__([])
-        self.game_state = game_state
-        self.map = maze_map
-        self.tile = tile
+    @property
+    def map(self) -> MazeMap:
+        return self.game.map
+
+    def __init__(self, game: Simulation, score_delta: int, bone_delta: int):
+        super().__init__()
+        self.game = game
         self.score_delta = score_delta
         self.bone_delta = bone_delta
 
-    def new_game(self, exclude_list: List[Point], item_count: int):
+    def update(self, *args) -> None:
+        """
+        Let the items under the mouse get eaten.  Only those items are looked at, found through the occupancy grid.
+        """
+        mouse, = args
+        if mouse is None:
+            return
+        for entity in list(self.game.occupancy.at(mouse.column, mouse.row)):
+            if entity in self:
+                entity.update(mouse)
+
+    def new_game(self, placement: Placement, item_count: int):
+        """
+        Put new items in random cells
+
+        :param placement: Placement of the level, the cells taken are taken out of it
+        :param item_count: Number of items
+        """
         self.empty()
-        for _ in range(0, item_count):
-            new_point = self.map.get_rand_cell()
-            while new_point in exclude_list:
-                new_point = self.map.get_rand_cell()
-            item = Item(new_point.col, new_point.row, self.game_state, self.map,
-                        self.tile, self.score_delta, self.bone_delta)
-            self.add(item)
-            exclude_list.append(new_point)
+        height = self.map.height
+        for cell in placement.take(item_count, self.game.rng):
+            col, row = divmod(cell, height)
+            Item(col, row, self.game, self.score_delta, self.bone_delta, self)
 
     def item_locations(self) -> List[Point]:
         item_list = list()
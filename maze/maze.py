@@ -1,17 +1,21 @@
-from typing import Union
+from typing import Union, List, Optional, Sequence
 
 from pygame import Rect
+from pygame.sprite import Sprite
 from pygame.surface import Surface
 
-from maze.config import BACKGROUND_COLOR, PLAY_WIDTH, PLAY_HEIGHT, MAZE_HEIGHT, MAZE_WIDTH, SURFACE_WIDTH, \
-    SURFACE_HEIGHT, RIGHT_SCROLL_LIM, \
-    LEFT_SCROLL_LIM, MID_PLAY_WIDTH, BOT_SCROLL_LIM, TOP_SCROLL_LIM, MID_PLAY_HEIGHT
-from maze.maze_generate import MazeGenerator, MazeMap
+from maze.chunks import ChunkCache
+from maze.config import BACKGROUND_COLOR, PLAY_WIDTH, PLAY_HEIGHT, TILE_WIDTH, TILE_HEIGHT, LEFT_SCROLL_LIM, \
+    TOP_SCROLL_LIM, HEIGHT
+from maze.maze_generate import MazeGenerator, MazeMap, StreamingMazeMap
 from maze.tiles import Tiles
 
+# Rows of an endless maze kept above the top of the view, so the window does not scroll on every step up and down
+STREAM_MARGIN = 8
+
 
 class Maze(object):
-    surface: Surface
+    chunks: ChunkCache
     background: Surface
     wall: Surface
     maze_generator: MazeGenerator
@@ -27,54 +31,92 @@ class Maze(object):
     last_rect: Rect
 
     def __init__(self, tiles: Tiles):
-        self.maze_width = MAZE_WIDTH
-        self.maze_height = MAZE_HEIGHT
-
-        self.surface = Surface((SURFACE_WIDTH, SURFACE_HEIGHT))
-        self.surface.fill(self.background_color)
+        self.maze_width = 0
+        self.maze_height = 0
 
         self.tiles = tiles
         self.wall = self.tiles.wall
         self.background = self.tiles.ground
+        self.chunks = ChunkCache(self.wall, self.background)
         self.last_rect = Rect(0, 0, 0, 0)
-        # self.cheese = None
 
     def new_maze(self, maze: MazeMap):
         self.map = maze
+        self.maze_width = maze.width
+        self.maze_height = maze.height
 
-        for row in range(0, MAZE_HEIGHT):
-            for column in range(0, MAZE_WIDTH):
-                rect = Rect(column * 32, row * 32, 32, 32)
-                if self.map.is_wall(column, row):
-                    self.surface.blit(self.wall, rect)
-                else:
-                    self.surface.blit(self.background, rect)
+        if isinstance(maze, StreamingMazeMap) and not HEIGHT + STREAM_MARGIN < maze.window:
+            raise ValueError("The endless maze window is too small for the view.")
+        self.chunks.reset(maze)
+        self.last_rect = Rect(0, 0, 0, 0)
 
     def update(self) -> bool:
         pass
 
-    def draw(self, surface: Surface, dest_rect: Rect, critter_location: Union[Rect, None]):
+    def view(self, critter_location: Union[Rect, None]) -> Rect:
         """
-        Render a window into the maze into the main surface while making sure the critter at critter_location is visible
+        Work out the window into the maze that keeps the critter at critter_location visible.  The window follows the
+        critter while staying inside the maze.  An endless maze is slid down as the critter descends.
 
-        :param surface: Main window's surface
-        :param dest_rect: The rectangle of where in the window's that the viewable maze section is rendered into
         :param critter_location: Rectangle of critter to scroll maze around
+        :return: The window, in maze pixels
         """
         rect = self.rect.copy()
+        streaming = isinstance(self.map, StreamingMazeMap)
+        if streaming:
+            rect.top = self.map.top * TILE_HEIGHT
         if critter_location is not None:
-            if RIGHT_SCROLL_LIM > critter_location.left > LEFT_SCROLL_LIM:
-                rect.left = critter_location.left - LEFT_SCROLL_LIM
-            elif critter_location.left < MID_PLAY_WIDTH:
-                rect.left = 0
-            else:
-                rect.left = RIGHT_SCROLL_LIM - MID_PLAY_WIDTH
-
-            if BOT_SCROLL_LIM > critter_location.top > TOP_SCROLL_LIM:
-                rect.top = critter_location.top - TOP_SCROLL_LIM
-            elif critter_location.top < MID_PLAY_HEIGHT:
-                rect.top = 0
+            right = max(0, self.maze_width * TILE_WIDTH - rect.width)
+            rect.left = min(max(critter_location.left - LEFT_SCROLL_LIM, 0), right)
+            if streaming:
+                rect.top = max(critter_location.top - TOP_SCROLL_LIM, rect.top)
             else:
-                rect.top = BOT_SCROLL_LIM - MID_PLAY_HEIGHT
+                bottom = max(0, self.maze_height * TILE_HEIGHT - rect.height)
+                rect.top = min(max(critter_location.top - TOP_SCROLL_LIM, 0), bottom)
+
+        if streaming:
+            maze = self.map
+            assert isinstance(maze, StreamingMazeMap)
+            old_bottom = maze.bottom
+            if maze.scroll_to(max(maze.top, (rect.top // TILE_HEIGHT) - STREAM_MARGIN)):
+                # The chunks holding the rows just loaded were rendered while those rows were still walls
+                self.chunks.invalidate_rows(old_bottom, maze.bottom)
+        return rect
+
+    def draw(self, surface: Surface, dest_rect: Rect, critter_location: Union[Rect, None],
+             dirty: Optional[List[Rect]] = None, sprites: Sequence[Sprite] = ()) -> List[Rect]:
+        """
+        Render a window into the maze into the main surface while making sure the critter at critter_location is
+        visible.  If the window did not scroll since the last frame only the dirty parts of the maze are drawn.
 
-        surface.blit(self.surface, dest_rect, rect)
+        :param surface: Main window's surface
+        :param dest_rect: The rectangle of where in the window's that the viewable maze section is rendered into
+        :param critter_location: Rectangle of critter to scroll maze around
+        :param dirty: Rectangles of the maze changed since the last frame, or None to always draw the window
+        :param sprites: Sprites in the maze, drawn over it in order
+        :return: The rectangles of the main surface that were drawn to
+        """
+        rect = self.view(critter_location)
+        if dirty is None or rect != self.last_rect:
+            self.last_rect = rect
+            areas = [rect]
+        else:
+            areas = [area.clip(rect) for area in dirty]
+
+        offset_x = dest_rect.left - rect.left
+        offset_y = dest_rect.top - rect.top
+        sprite_rects = [sprite.rect for sprite in sprites]
+        clip = surface.get_clip()
+        drawn = list()
+        for area in areas:
+            if not area:
+                continue
+            screen_rect = area.move(offset_x, offset_y)
+            surface.set_clip(screen_rect)
+            self.chunks.blit(surface, screen_rect.topleft, area)
+            for index in area.collidelistall(sprite_rects):
+                sprite = sprites[index]
+                surface.blit(sprite.image, sprite.rect.move(offset_x, offset_y))
+            drawn.append(screen_rect)
+        surface.set_clip(clip)
+        return drawn
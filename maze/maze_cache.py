@@ -0,0 +1,104 @@
+import hashlib
+import mmap
+import os
+from typing import Optional
+
+from maze.maze_generate import MazeGenerator, MazeMap
+
+
+class MazeCache:
+    """
+    On disk cache of generated mazes.  A maze is fully determined by its algorithm, size and seed, so those are hashed
+    into the name of the file holding it.  Files hold the maze in the binary maze format and are memory mapped when
+    loaded, so the maze reads its walls straight out of the file.
+    """
+    directory: str
+
+    def __init__(self, directory: str):
+        """
+        Open a maze cache, creating the directory if needed
+
+        :param directory: Directory holding the cached mazes
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, algorithm: str, width: int, height: int, seed: int) -> str:
+        """
+        Get the path of the file caching a maze
+
+        :param algorithm: Name of the maze algorithm
+        :param width: Width of the maze
+        :param height: Height of the maze
+        :param seed: Seed of the maze
+        :return: Path of the cache file
+        """
+        key = '%s:%d:%d:%d' % (algorithm, width, height, seed)
+        return os.path.join(self.directory, hashlib.sha1(key.encode('ascii')).hexdigest() + '.maze')
+
+    def load(self, algorithm: str, width: int, height: int, seed: int) -> Optional[MazeMap]:
+        """
+        Load a maze from the cache
+
+        :param algorithm: Name of the maze algorithm
+        :param width: Width of the maze
+        :param height: Height of the maze
+        :param seed: Seed of the maze
+        :return: The cached MazeMap, or None if the maze is not cached
+        """
+        try:
+            with open(self.path(algorithm, width, height, seed), 'rb') as file:
+                # The map outlives the file, it stays open for as long as the maze is using it
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            maze = MazeMap.from_buffer(data)
+        except (OSError, ValueError):
+            return None
+        if (maze.width, maze.height) != (width, height):
+            return None
+        return maze
+
+    def store(self, maze: MazeMap, algorithm: str, seed: int):
+        """
+        Write a maze to the cache.  The file is written under a temporary name and then renamed, so readers never see a
+        partial maze.
+
+        :param maze: The maze to store
+        :param algorithm: Name of the algorithm that generated the maze
+        :param seed: Seed the maze was generated from
+        """
+        self.store_bytes(maze.to_bytes(), algorithm, maze.width, maze.height, seed)
+
+    def store_bytes(self, data: bytes, algorithm: str, width: int, height: int, seed: int):
+        """
+        Write a maze already in the binary maze format to the cache
+
+        :param data: The maze in the binary maze format
+        :param algorithm: Name of the algorithm that generated the maze
+        :param width: Width of the maze
+        :param height: Height of the maze
+        :param seed: Seed the maze was generated from
+        """
+        path = self.path(algorithm, width, height, seed)
+        temp_path = '%s.%d.tmp' % (path, os.getpid())
+        with open(temp_path, 'wb') as file:
+            file.write(data)
+        os.replace(temp_path, path)
+
+    def get_maze(self, generator: MazeGenerator, seed: Optional[int] = None) -> MazeMap:
+        """
+        Get a maze from the cache, generating and storing it if it is not cached yet
+
+        :param generator: Generator holding the size and algorithm of the maze
+        :param seed: Seed of the maze, or None to draw the next one from the generator
+        :return: Read only MazeMap of the maze, owned by the caller whether it was cached or not
+        """
+        seed = generator.next_seed() if seed is None else seed
+        algorithm = generator.algorithm.name
+        maze = self.load(algorithm, generator.width, generator.height, seed)
+        if maze is None:
+            data = generator.get_maze(seed).to_bytes()
+            self.store_bytes(data, algorithm, generator.width, generator.height, seed)
+            # The generator reuses its maze image for the next maze, so hand back a copy like the ones loaded
+            maze = MazeMap.from_buffer(data)
+        generator.seed = seed
+        return maze
@@ -1,98 +1,133 @@
 import sys
-from typing import Tuple, Optional, List
+from random import Random
+from typing import Tuple, List, Dict, Optional, Sequence
 
 import pygame
 from pygame import Rect, Color
 from pygame.surface import Surface
 from pygame.time import Clock
 
-from maze.cats import Cats
-from maze.config import BOARD_WIDTH, BOARD_HEIGHT, MAZE_WIDTH, MAZE_HEIGHT, BACKGROUND_COLOR, HEAD_WIDTH, HEAD_HEIGHT
-from maze.critters import CritterGroup
-from maze.dog import DogBlew, Dog
+from maze.config import BOARD_WIDTH, BOARD_HEIGHT, MAZE_WIDTH, MAZE_HEIGHT, BACKGROUND_COLOR, HEAD_WIDTH, HEAD_HEIGHT, \
+    PLAY_WIDTH, PLAY_HEIGHT, FRAME_RATE, FIXED_ONE, ASSET_CACHE
+from maze.critters import Critter
+from maze.entities import Entity
 from maze.game_state import GameState
-from maze.items import ItemGroup
 from maze.maze import Maze
-from maze.maze_generate import MazeGenerator, MazeMap, Point
-from maze.mouse import TheMouse, Mouse
+from maze.maze_generate import MazeGenerator, MazeMap
+from maze.prefetch import MazePrefetcher
+from maze.profiler import FrameProfiler, NullProfiler
+from maze.replay import ReplayRecorder, SEED_MASK, decode_keys, KEY_UP, KEY_LEFT, KEY_RIGHT, KEY_DOWN, \
+    KEY_SPACE
+from maze.simulation import Simulation
+from maze.sprites import MazeSprite, CritterSprite
 from maze.tiles import Tiles
+from maze.timestep import FixedTimestep
+
+# The keys read each frame, and their bit in a recording
+KEY_BITS = ((pygame.K_UP, KEY_UP), (pygame.K_LEFT, KEY_LEFT), (pygame.K_RIGHT, KEY_RIGHT), (pygame.K_DOWN, KEY_DOWN),
+            (pygame.K_SPACE, KEY_SPACE))
+
+
+def key_state(pressed: Sequence[bool]) -> int:
+    """
+    Pack the keys the game reads into bits
+
+    :param pressed: State of every key, as returned by pygame.key.get_pressed()
+    :return: Bits of the keys held
+    """
+    keys = 0
+    for key, bit in KEY_BITS:
+        if pressed[key]:
+            keys |= bit
+    return keys
 
 
 class MazeGame:
+    """
+    The game in a window.  The game itself is played by a Simulation, this draws it and feeds it the player's keys.
+    """
     play_game: bool
+    seed: int
+    sim: Simulation
     maze: Maze
-    mouse: Optional[Mouse]
-    dog: Optional[Dog]
-    cats: Optional[Cats]
-    cheese: Optional[ItemGroup]
-    bones: Optional[ItemGroup]
+    maze_count: int
 
     game_state: GameState
     tiles: Tiles
     generator: MazeGenerator
-    map: MazeMap
+    prefetcher: MazePrefetcher
     mouse_tile: Surface
     mouse_recs: Tuple[Rect]
+    sprites: Dict[Entity, MazeSprite]
 
     size = BOARD_WIDTH, BOARD_HEIGHT
     background = Color(156, 102, 47)
     screen: Surface
     clock: Clock
+    timestep: FixedTimestep
+    profiler: FrameProfiler
+    recorder: Optional[ReplayRecorder]
 
-    level: int
-    is_dog: bool
     clear_tiles: List[Rect]
 
-    def __init__(self):
+    play_rect = Rect(0, HEAD_HEIGHT, PLAY_WIDTH, PLAY_HEIGHT)
+    hud_rect = Rect(0, 0, HEAD_WIDTH, HEAD_HEIGHT)
+
+    @property
+    def map(self) -> MazeMap:
+        return self.sim.map
+
+    def __init__(self, profile: bool = False, record: Optional[str] = None, seed: Optional[int] = None,
+                 asset_cache: Optional[str] = ASSET_CACHE):
+        """
+        Open the game window
+
+        :param profile: True to time each phase of every frame, shown in the HUD and summed up on exit
+        :param record: Path of a file to record the games played to, or None to not record them
+        :param seed: Seed of the mazes and the critters, a random one by default.  Only its low 64 bits are used.
+        :param asset_cache: Path of the file caching the decoded images between runs, or None to decode them each time
+        """
         pygame.init()
 
-        self.is_dog = False
         self.screen = pygame.display.set_mode(self.size)
         self.screen.fill(BACKGROUND_COLOR)
         self.clock = Clock()
-
-        self.tiles = Tiles()
-
-        self.generator = MazeGenerator(MAZE_WIDTH, MAZE_HEIGHT)
+        self.timestep = FixedTimestep()
+        self.profiler = FrameProfiler() if profile else NullProfiler()
+
+        self.tiles = Tiles(asset_cache)
+
+        # Any int is taken, as the 64 bits a recording keeps of it
+        self.seed = Random().getrandbits(32) if seed is None else seed & SEED_MASK
+        self.generator = MazeGenerator(MAZE_WIDTH, MAZE_HEIGHT, seed=self.seed)
+        self.prefetcher = MazePrefetcher(self.generator)
+        # The next maze was generated in the background while this level was played, so a new level is just a swap
+        self.sim = Simulation(self.prefetcher.get_maze, self.seed)
+        self.recorder = ReplayRecorder(record, self.generator, self.seed, self.seed) if record is not None else None
         self.maze = Maze(self.tiles)
+        self.maze_count = 0
 
         self.mouse_tile, *self.mouse_recs = self.tiles.mice
-        self.game_state = GameState(self.tiles)
+        self.game_state = GameState(self.tiles, self.profiler)
 
+        self.sprites = dict()
         self.clear_tiles = list()
-        self.mouse = None
-        self.cats = None
-        self.dog = None
-        self.cheese = None
-        self.bones = None
-
-        self.level = 0
 
     def title_screen(self):
         pass
 
     def new_level(self):
-        self.level += 1
-        self.map = self.generator.get_maze()
-        self.maze.new_maze(self.map)
-
-        if self.mouse is None:
-            self.mouse = Mouse(self.map, self.tiles.mice, TheMouse)
-        else:
-            self.mouse.critter_reset(self.map)
-
-        if self.cheese is None:
-            self.cheese = ItemGroup(self.game_state, self.map, self.tiles.cheese, 1, 0)
-        if self.bones is None:
-            self.bones = ItemGroup(self.game_state, self.map, self.tiles.bone, 5, 1)
-        if self.cats is None:
-            self.cats = Cats(self.tiles, self.map, self.mouse)
-
-        exclude_list = [Point(1, 1)]
-        self.cheese.new_game(exclude_list, 50)
-        self.bones.new_game(exclude_list, 6 + (4 * self.level))
-        self.cats.reset(exclude_list, 5 + (5 * self.level))
-        self.level = 0
+        """
+        Start drawing the level the simulation just started
+        """
+        self.maze_count = self.sim.maze_count
+        self.maze.new_maze(self.sim.map)
+        self.sprites.clear()
+        self.sync_sprites()
+
+        # Everything on screen changes, so the first frame of the level is drawn in full
+        self.screen.fill(BACKGROUND_COLOR)
+        self.game_state.invalidate()
 
     def title_loop(self):
         return True
@@ -100,98 +135,151 @@ class MazeGame:
     def game_over_loop(self):
         pass
 
+    def start_game(self):
+        """
+        Start a new game, and its recording
+        """
+        self.sim.new_game()
+        if self.recorder is not None:
+            self.recorder.new_game()
+
+    def play_frame(self, keys: int, steps: int) -> bool:
+        """
+        Run the steps of the simulation a frame covers, and record them
+
+        :param keys: Bits of the keys held
+        :param steps: Number of steps to run
+        :return: False once the game is over
+        """
+        if self.recorder is not None:
+            self.recorder.frame(steps, keys)
+        direction, call_dog = decode_keys(keys)
+        for _ in range(steps):
+            if not self.sim.step(direction, call_dog):
+                return False
+        return True
+
+    def close(self):
+        """
+        Stop the maze worker and finish the recording
+        """
+        self.prefetcher.close()
+        if self.recorder is not None:
+            self.recorder.close()
+
     def game_loop(self):
-        self.new_level()
-        self.game_state.new_game()
-        dog_counter = 0
+        self.start_game()
         flash_counter = 0
         self.play_game = True
+        self.clock.tick()
+        profiler = self.profiler
         while self.play_game:
+            elapsed = self.clock.tick(FRAME_RATE)
+            # Time waiting for the next frame is not part of it
+            profiler.start()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
+                    self.close()
+                    self.print_profile()
                     sys.exit()
 
-            if self.is_dog:
-                dog_counter -= 1
-                if dog_counter <= 0:
-                    self.mouse.exit_dog(*self.dog.deactivate())
-
-            keys = pygame.key.get_pressed()
-            if self.is_dog:
-                if keys[pygame.K_UP]:
-                    self.mouse.move_up(self.map)
-                elif keys[pygame.K_LEFT]:
-                    self.mouse.move_left(self.map)
-                elif keys[pygame.K_RIGHT]:
-                    self.mouse.move_right(self.map)
-                elif keys[pygame.K_DOWN]:
-                    self.mouse.move_down(self.map)
+            keys = key_state(pygame.key.get_pressed())
+            profiler.mark('input')
+
+            # The simulation runs as many steps as the time since the last frame covers, however long drawing took
+            self.play_game = self.play_frame(keys, self.timestep.advance(elapsed))
+            profiler.mark('sim')
+            self.update(self.timestep.alpha)
+            profiler.mark('update')
+            dirty = self.draw()
+            pygame.display.update(dirty)
+            profiler.mark('display')
+            profiler.end_frame()
+        self.print_profile()
+
+    def print_profile(self):
+        """
+        Print the percentiles of the time taken by each phase of the frames, if they were timed
+        """
+        if self.profiler.enabled:
+            print('\n'.join(self.profiler.summary()))
+
+    def update(self, alpha: int = FIXED_ONE):
+        """
+        Catch the view up with the simulation
+
+        :param alpha: How far the frame is from the last step to the next one, a fixed point fraction with FIXED_SHIFT
+            bits.  The sprites are drawn that far along from where they were the step before.
+        """
+        if self.sim.maze_count != self.maze_count:
+            self.new_level()
+        self.clear_tiles = self.sync_sprites(alpha)
+
+    def sync_sprites(self, alpha: int = FIXED_ONE) -> List[Rect]:
+        """
+        Make a sprite for each entity in the simulation, in the order they are drawn, and drop the sprites of the
+        entities that are gone
+
+        :param alpha: How far the sprites are drawn from where they were the step before, see update()
+        :return: The rectangles of the maze that changed
+        """
+        sim = self.sim
+        entities = sim.cheese.sprites() + sim.bones.sprites() + sim.mouse.sprites() + sim.cats.sprites()
+        if sim.is_dog:
+            entities += sim.dog.sprites()
+
+        changed = list()
+        sprites = dict()
+        for entity in entities:
+            sprite = self.sprites.pop(entity, None)
+            if sprite is None:
+                sprite = self.make_sprite(entity)
+                changed.append(sprite.rect)
             else:
-                if keys[pygame.K_UP]:
-                    self.mouse.move_up(self.map)
-                elif keys[pygame.K_LEFT]:
-                    self.mouse.move_left(self.map)
-                elif keys[pygame.K_RIGHT]:
-                    self.mouse.move_right(self.map)
-                elif keys[pygame.K_DOWN]:
-                    self.mouse.move_down(self.map)
-                elif keys[pygame.K_SPACE]:
-                    if self.game_state.bones > 0:
-                        self.activate_dog()
-
-            # Update mouse - returns False if mouse got ate
-
-            self.update()
-            self.screen.fill(BACKGROUND_COLOR)
-            self.clear_critter_tiles()
-            self.draw()
-
-            pygame.display.flip()
-            self.clock.tick(40)
-
-            if len(self.cheese) == 0:
-                self.new_level()
-                self.game_state.bones.value = 0
-
-    def update(self):
-        self.clear_tiles.clear()
-        if self.is_dog:
-            try:
-                self.dog.update(self.clear_tiles)
-            except DogBlew:
-                # Pop the dog - switch back to mouse and lose a life
-                self.is_dog = False
-                self.mouse.sprite.kill()
-        else:
-            if not self.mouse.update(self.clear_tiles):
-                if self.next_mouse():
-                    self.mouse.critter_reset(self.map)
-                else:
-                    self.play_game = False  # Game Over
-        self.cheese.update(self.mouse.sprite)
-        self.bones.update(self.mouse.sprite)
-        self.cats.update(self.clear_tiles)
-
-    def clear_critter_tiles(self):
-        for tile in self.clear_tiles:
-            self.maze.surface.blit(self.tiles.ground, tile)
-
-    def draw(self):
-        self.cheese.draw(self.maze.surface)
-        self.bones.draw(self.maze.surface)
-        self.mouse.draw(self.maze.surface)
-        self.cats.draw(self.maze.surface)
-        self.maze.draw(self.screen, Rect(0, 32, 32, 32), self.mouse.get_location())
-        self.game_state.draw(self.screen, Rect(0, 0, HEAD_WIDTH, HEAD_HEIGHT))
+                old = sprite.sync(alpha)
+                if old is not None:
+                    changed.append(old)
+                    changed.append(sprite.rect)
+            sprites[entity] = sprite
+        # Whatever is left was eaten or killed since the last frame
+        changed.extend(sprite.rect for sprite in self.sprites.values())
+        self.sprites = sprites
+        return changed
+
+    def make_sprite(self, entity: Entity) -> MazeSprite:
+        sim = self.sim
+        if entity in sim.cheese:
+            return MazeSprite(entity, self.tiles.cheese)
+        if entity in sim.bones:
+            return MazeSprite(entity, self.tiles.bone)
+        assert isinstance(entity, Critter)
+        if entity in sim.cats:
+            return CritterSprite(entity, self.tiles.cat_frames)
+        if entity in sim.mouse:
+            return CritterSprite(entity, self.tiles.mouse_frames)
+        return CritterSprite(entity, self.tiles.dog_frames)
+
+    def draw(self) -> List[Rect]:
+        """
+        Draw the frame
+
+        :return: The rectangles of the screen that changed
+        """
+        mouse = self.sim.mouse.sprite
+        critter_location = self.sprites[mouse].rect if mouse is not None else None
+        # Where the sprites were and where they are now are all that changed in the maze
+        dirty = self.maze.draw(self.screen, self.play_rect, critter_location, self.clear_tiles,
+                               list(self.sprites.values()))
+        self.profiler.mark('maze')
+
+        score = self.sim.score
+        game_state = self.game_state
+        game_state.score.value, game_state.bones.value, game_state.lives.value = score.score, score.bones, score.lives
+        dirty.extend(game_state.draw(self.screen, self.hud_rect))
+        self.profiler.mark('hud')
+        return dirty
 
     def maze_run(self):
         while self.title_loop():
             self.game_loop()
             self.game_over_loop()
-
-    def next_mouse(self):
-        self.game_state.lives -= 1
-        return self.game_state.lives > 0
-
-    def activate_dog(self):
-        pass
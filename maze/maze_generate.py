@@ -1,18 +1,68 @@
-from functools import total_ordering
-from random import randint, randrange
-from typing import List, Optional
+import struct
+from mmap import mmap
+from random import randrange, Random
+from typing import List, Optional, Dict, Type, Set, Tuple, Iterator, Union
 
 WEST = 0
 NORTH = 1
 EAST = 2
 SOUTH = 3
 
+# Byte codes of the cells stored in a MazeMap
+WALL_CELL = ord('#')
+PASSAGE_CELL = ord(' ')
+OPEN_CELL = ord('.')
+
+# Directions of the passages out of a cell, for each of the 16 possible exit masks
+EXITS = tuple(tuple(direction for direction in (WEST, NORTH, EAST, SOUTH) if mask & (1 << direction))
+              for mask in range(0, 16))
+
+
+def _forward_passages(mask: int, cur_dir: Optional[int]) -> Tuple[int, ...]:
+    """
+    Work out the passages out of a cell without turning back, or all of them if turning back is the only way
+    """
+    forward = tuple(direction for direction in EXITS[mask] if cur_dir is None or direction != (cur_dir + 2) % 4)
+    return forward if forward else EXITS[mask]
+
+
+def _right_hand(mask: int, current_direction: int) -> int:
+    """
+    Work out the direction the right hand rule takes out of a cell
+    """
+    # Try right, straight on and left, turning back if none of them are open
+    order = (current_direction + 1) % 4, current_direction, (current_direction + 3) % 4
+    for direction in order:
+        if mask & (1 << direction):
+            return direction
+    return (current_direction + 2) % 4
+
+
+# Lookup tables indexed by exit mask then direction, passages uses index 4 for no current direction
+PASSAGES = tuple(tuple(_forward_passages(mask, cur_dir) for cur_dir in (WEST, NORTH, EAST, SOUTH, None))
+                  for mask in range(0, 16))
+RIGHT_HAND = tuple(tuple(_right_hand(mask, direction) for direction in (WEST, NORTH, EAST, SOUTH))
+                    for mask in range(0, 16))
+
+# Binary maze format: magic, format version, width, height.  Followed by one bit per cell, set for a wall, in the order
+# of the MazeMap cell buffer with the first cell in the lowest bit of the first byte.
+MAZE_MAGIC = b'MAZE'
+MAZE_VERSION = 1
+MAZE_HEADER = struct.Struct('<4sB3xII')
+
+# Translations between the cell byte codes and the '0'/'1' digits of the packed bits
+_CELL_BITS = bytes(ord('1') if code == WALL_CELL else ord('0') for code in range(0, 256))
+_BIT_CELLS = bytes.maketrans(b'01', bytes([PASSAGE_CELL, WALL_CELL]))
+_CELL_OPEN = bytes(0 if code == WALL_CELL else 1 for code in range(0, 256))
+
 
-@total_ordering
 class Point:
     """
-    Data structure for storing location in the maze
+    Data structure for storing location in the maze.  Points are ordered row by row, as the maze is read.  Slotted, as
+    many are made.  Code that only needs to look a location up uses its cell id, ``col * height + row``, and makes no
+    Point at all.
     """
+    __slots__ = ('col', 'row')
     col: int
     row: int
 
@@ -26,6 +76,27 @@ class Point:
         self.col = col
         self.row = row
 
+    @staticmethod
+    def from_cell(cell: int, height: int) -> 'Point':
+        """
+        Create the point of a cell id
+
+        :param cell: Offset of the cell in the cell buffer of a maze
+        :param height: Height of the maze
+        :return: The location of the cell
+        """
+        col, row = divmod(cell, height)
+        return Point(col, row)
+
+    def cell(self, height: int) -> int:
+        """
+        Get the cell id of the point
+
+        :param height: Height of the maze
+        :return: Offset of the cell in the cell buffer of the maze
+        """
+        return self.col * height + self.row
+
     def here(self, col: int, row: int) -> bool:
         """
         Returns true this point is at the position specified in the parameters
@@ -39,18 +110,38 @@ class Point:
     def __eq__(self, other):
         return self.col == other.col and self.row == other.row
 
+    def __ne__(self, other):
+        return self.col != other.col or self.row != other.row
+
+    def __hash__(self):
+        return hash((self.col, self.row))
+
     def __gt__(self, other):
-        return (self.row == other.row and self.col > other.col) or self.row > other.row
+        return (self.row, self.col) > (other.row, other.col)
+
+    def __ge__(self, other):
+        return (self.row, self.col) >= (other.row, other.col)
+
+    def __lt__(self, other):
+        return (self.row, self.col) < (other.row, other.col)
+
+    def __le__(self, other):
+        return (self.row, self.col) <= (other.row, other.col)
+
+    def __repr__(self):
+        return 'Point(%d, %d)' % (self.col, self.row)
 
 
 class MazeMap:
     """
-    Hold the map information of a generated maze. Stored as a python's equivalent of a 2-dimensional array
-    (List of Lists) as a list of Column data.  This gives the ability to for the normal x,y index order
+    Hold the map information of a generated maze.  The cells are stored in a single flat ``bytearray`` laid out
+    column by column (index ``col * height + row``), so the normal x,y index order is kept while every lookup is a
+    single buffer access.  Each cell holds one of the ``*_CELL`` byte codes.
     """
     width: int
     height: int
-    map: List[List[str]]
+    cells: bytearray
+    exit_masks: Optional[bytearray]
 
     def __init__(self, width: int, height: int):
         """
@@ -59,17 +150,42 @@ class MazeMap:
         :param width: width of the maze
         :param height: hegith of the maze
         """
-        self.map = [['.' for _ in range(0, height)] for _ in range(0, width)]
-
-        for x in range(0, width):
-            if x == 0 or x == (width - 1):
-                for y in range(0, height):
-                    self.map[x][y] = '#'
-                    continue
-            self.map[x][0] = '#'
-            self.map[x][height - 1] = '#'
         self.width = width
         self.height = height
+        self.cells = bytearray([OPEN_CELL]) * (width * height)
+        self.exit_masks = None
+
+        # Outer wall: the first and last columns, then the top and bottom cell of every column
+        self.cells[0:height] = bytes([WALL_CELL]) * height
+        self.cells[(width - 1) * height:] = bytes([WALL_CELL]) * height
+        self.cells[0::height] = bytes([WALL_CELL]) * width
+        self.cells[height - 1::height] = bytes([WALL_CELL]) * width
+
+    @property
+    def buffer(self) -> memoryview:
+        """
+        Writable view of the raw cell buffer for vectorized callers, laid out as described in the class documentation
+        """
+        return memoryview(self.cells)
+
+    @property
+    def map(self) -> List[memoryview]:
+        """
+        Per-column views into the cell buffer, so ``map[col][row]`` gives the byte code of a cell without copying
+        """
+        view = memoryview(self.cells)
+        height = self.height
+        return [view[col * height:(col + 1) * height] for col in range(0, self.width)]
+
+    def index(self, col: int, row: int) -> int:
+        """
+        Get the offset of a location in the cell buffer
+
+        :param col: column of the maze location
+        :param row: row of the maze location
+        :return: Offset of the cell in ``cells``
+        """
+        return col * self.height + row
 
     def is_wall(self, col: int, row: int) -> bool:
         """
@@ -78,169 +194,398 @@ class MazeMap:
         :param row: row of the maze location
         :return: True if the location is a wall, or False if the location is a passage way
         """
-        return self.map[col][row] == '#'
+        return self.cells[col * self.height + row] == WALL_CELL
+
+    def build_exits(self):
+        """
+        Build the exit mask of every cell, bit ``1 << direction`` set for every open passage out of the cell.  Done once
+        the maze is generated, and again whenever the cells are changed.  Walls have no exits.
+
+        The masks are worked out on whole buffers at once: the open cells as one 0/1 byte per cell, shifted by one cell
+        or one column to line up each cell with its neighbour, and then combined as big integers.  Each byte stays
+        within 0..15, so no bits ever carry into the next cell.
+        """
+        height = self.height
+        count = self.width * height
+        is_open = self.cells.translate(_CELL_OPEN)
+        here = int.from_bytes(is_open, 'big')
+        west = int.from_bytes(bytes(height) + is_open[:count - height], 'big')
+        north = int.from_bytes(b'\0' + is_open[:count - 1], 'big')
+        east = int.from_bytes(is_open[height:] + bytes(height), 'big')
+        south = int.from_bytes(is_open[1:] + b'\0', 'big')
+        masks = ((here & west) << WEST) | ((here & north) << NORTH) | \
+            ((here & east) << EAST) | ((here & south) << SOUTH)
+        self.exit_masks = bytearray(masks.to_bytes(count, 'big'))
+
+    def exit_mask(self, col: int, row: int) -> int:
+        """
+        Get the exit mask of a location
+
+        :param col: column of the maze location
+        :param row: row of the maze location
+        :return: The mask, bit ``1 << direction`` set for every direction with an open passage
+        """
+        if self.exit_masks is None:
+            self.build_exits()
+        return self.exit_masks[col * self.height + row]
 
-    def passages(self, col: int, row: int, cur_dir: Optional[int] = None) -> List[int]:
+    def exits(self, col: int, row: int) -> Tuple[int, ...]:
         """
-        Returns  a list of passages available to move from current location
+        Get the directions of all the passages out of a location
+
+        :param col: column of the maze location
+        :param row: row of the maze location
+        :return: Tuple of directions, shared between all callers
+        """
+        return EXITS[self.exit_mask(col, row)]
+
+    def passages(self, col: int, row: int, cur_dir: Optional[int] = None) -> Tuple[int, ...]:
+        """
+        Returns the passages available to move from current location.  Turning back the way we came is only offered if
+        it is the only way to go.
 
         :param col: Column of the current location
         :param row: Row of the current location
         :param cur_dir: Direction of current direction of travel or None
-        :return: List of directions of available passages
-        """
-        pass_list = list()
-        if col - 1 != 0 and not self.is_wall(col - 1, row):
-            if cur_dir is None or cur_dir != EAST:
-                pass_list.append(WEST)
-        if row - 1 != 0 and not self.is_wall(col, row - 1):
-            if cur_dir is None or cur_dir != SOUTH:
-                pass_list.append(NORTH)
-        if col + 1 < self.width and not self.is_wall(col + 1, row):
-            if cur_dir is None or cur_dir != WEST:
-                pass_list.append(EAST)
-        if row + 1 < self.height and not self.is_wall(col, row + 1):
-            if cur_dir is None or cur_dir != NORTH:
-                pass_list.append(SOUTH)
-
-        # Allow double back if it is the way we came from is the only possible direction
-        if len(pass_list) == 0:
-            return self.passages(col, row)
-
-        return pass_list
+        :return: Tuple of directions of available passages, shared between all callers
+        """
+        return PASSAGES[self.exit_mask(col, row)][4 if cur_dir is None else cur_dir]
 
     def right_hand_rule(self, location: Point, current_direction: int) -> int:
-        avail_dirs = self.passages(location.col, location.row)
-        if current_direction == EAST:
-            if SOUTH in avail_dirs:
-                return SOUTH
-            if EAST in avail_dirs:
-                return EAST
-            if NORTH in avail_dirs:
-                return NORTH
-            return WEST
-        elif current_direction == SOUTH:
-            if WEST in avail_dirs:
-                return WEST
-            if SOUTH in avail_dirs:
-                return SOUTH
-            if EAST in avail_dirs:
-                return EAST
-            return NORTH
-        elif current_direction == WEST:
-            if NORTH in avail_dirs:
-                return NORTH
-            if WEST in avail_dirs:
-                return WEST
-            if SOUTH in avail_dirs:
-                return SOUTH
-            return EAST
-        else:
-            if EAST in avail_dirs:
-                return EAST
-            if NORTH in avail_dirs:
-                return NORTH
-            if WEST in avail_dirs:
-                return WEST
-            return SOUTH
+        """
+        Pick the direction to take from a location keeping a hand on the wall to the right
+
+        :param location: The current location
+        :param current_direction: Direction of current direction of travel
+        :return: The direction to go
+        """
+        return RIGHT_HAND[self.exit_mask(location.col, location.row)][current_direction]
+
+    def random_cell(self, rng: Optional[Random] = None) -> int:
+        """
+        Get the cell id of a random location in the maze that is not a wall
+
+        :param rng: Random number generator to draw from, the random module's own by default
+        :return: Offset of the cell in ``cells``
+        """
+        rand = randrange if rng is None else rng.randrange
+        cells = self.cells
+        width = self.width
+        height = self.height
+        cell = 0
+        while cells[cell] == WALL_CELL:
+            cell = rand(1, width) * height
+            cell += rand(1, height)
+        return cell
 
-    def get_rand_cell(self) -> Point:
+    def get_rand_cell(self, rng: Optional[Random] = None) -> Point:
         """
         Get a random location in the maze that is not a wall
 
+        :param rng: Random number generator to draw from, the random module's own by default
         :return: Point containing the random location
         """
-        point = Point(0, 0)
-        while self.map[point.col][point.row] == '#':
-            point.col = randrange(1, self.width)
-            point.row = randrange(1, self.height)
-        return point
+        return Point.from_cell(self.random_cell(rng), self.height)
 
-    def __str__(self) -> str:
-        s = ''
-        for row in range(0, len(self.map[0])):
-            for col in range(0, len(self.map)):
-                s += self.map[col][row]
-            s += "\n"
-        return super().__str__()
+    def packed_size(self) -> int:
+        """
+        Get the size of the maze in the binary maze format
 
+        :return: Size in bytes, header included
+        """
+        return MAZE_HEADER.size + (self.width * self.height + 7) // 8
 
-class MazeGenerator:
-    BOTH_WALLS = 0
-    HORIZONTAL_WALL = 1
-    VERTICAL_WALL = 2
-    NO_WALLS = 3
+    def to_bytes(self) -> bytes:
+        """
+        Dump the maze in the binary maze format, one bit per cell.  Passages and cells not generated yet are both stored
+        as not being a wall.
 
-    wall_map = list()
-    mapped_cells = set()
+        :return: The packed maze
+        """
+        bits = self.cells.translate(_CELL_BITS)
+        bits.reverse()
+        packed = int(bits, 2).to_bytes((len(bits) + 7) // 8, 'little') if bits else b''
+        return MAZE_HEADER.pack(MAZE_MAGIC, MAZE_VERSION, self.width, self.height) + packed
 
-    maze_image: MazeMap
+    @staticmethod
+    def from_buffer(buffer: Union[bytes, bytearray, memoryview, mmap], offset: int = 0) -> 'PackedMazeMap':
+        """
+        Load a maze in the binary maze format without copying it.  The returned maze reads its walls straight out of
+        the buffer, which has to stay unchanged while the maze is in use.
 
-    column = 0
-    row = 0
-    _width = 0
-    _height = 0
-    total_cells = 0
+        :param buffer: Any object supporting the buffer protocol, such as bytes, a memoryview or a mmap
+        :param offset: Offset of the maze in the buffer, for buffers holding many mazes
+        :return: PackedMazeMap over the buffer
+        """
+        view = memoryview(buffer)
+        if len(view) - offset < MAZE_HEADER.size:
+            raise ValueError("The buffer is too short to hold a maze.")
+        magic, version, width, height = MAZE_HEADER.unpack_from(view, offset)
+        if magic != MAZE_MAGIC:
+            raise ValueError("The buffer does not hold a maze.")
+        if version != MAZE_VERSION:
+            raise ValueError("Maze format version %d is not supported." % version)
+        start = offset + MAZE_HEADER.size
+        end = start + (width * height + 7) // 8
+        if end > len(view):
+            raise ValueError("The buffer is too short to hold a %dx%d maze." % (width, height))
+        return PackedMazeMap(width, height, view[start:end])
 
-    @property
-    def width(self):
-        return (self._width * 2) + 1
+    def __str__(self) -> str:
+        cells = self.cells
+        return ''.join(cells[row::self.height].decode('ascii') + '\n' for row in range(0, self.height))
 
-    @width.setter
-    def width(self, w):
-        self._width = (w - 1) // 2
+
+class PackedMazeMap(MazeMap):
+    """
+    Read only MazeMap over a maze in the binary maze format, reading the walls straight out of the packed bits so
+    loading it copies nothing.  The cell buffer is only unpacked if something asks for it.
+    """
+    bits: memoryview
+    _cells: Optional[bytes]
+
+    def __init__(self, width: int, height: int, bits: memoryview):
+        """
+        Initialize the maze over its packed bits
+
+        :param width: width of the maze
+        :param height: height of the maze
+        :param bits: the packed bits of the maze, one per cell
+        """
+        self.width = width
+        self.height = height
+        self.bits = bits
+        self._cells = None
+        self.exit_masks = None
 
     @property
-    def height(self):
-        return (self._height * 2) + 1
+    def cells(self) -> bytes:
+        """
+        The cells of the maze unpacked into a byte code per cell, as in MazeMap.  Unpacked the first time it is used,
+        into bytes so that buffer and map are read only views and can not drift from the packed bits is_wall() reads.
+        """
+        if self._cells is None:
+            count = self.width * self.height
+            bits = format(int.from_bytes(self.bits, 'little'), 'b').zfill(count)[-count:] if count else ''
+            self._cells = bits[::-1].encode('ascii').translate(_BIT_CELLS)
+        return self._cells
 
-    @height.setter
-    def height(self, h):
-        self._height = (h - 1) // 2
+    def is_wall(self, col: int, row: int) -> bool:
+        index = col * self.height + row
+        return (self.bits[index >> 3] >> (index & 7)) & 1 == 1
+
+    def to_bytes(self) -> bytes:
+        return MAZE_HEADER.pack(MAZE_MAGIC, MAZE_VERSION, self.width, self.height) + self.bits
 
-    def __init__(self, width=79, height=13):
+
+def iter_mazes(buffer: Union[bytes, bytearray, memoryview, mmap]) -> Iterator[PackedMazeMap]:
+    """
+    Load every maze of a buffer holding mazes in the binary maze format one after another, without copying them
+
+    :param buffer: Any object supporting the buffer protocol, such as bytes, a memoryview or a mmap
+    :return: Iterator of the mazes
+    """
+    view = memoryview(buffer)
+    offset = 0
+    while offset < len(view):
+        maze = MazeMap.from_buffer(view, offset)
+        offset += maze.packed_size()
+        yield maze
+
+
+class StreamingMazeMap(MazeMap):
+    """
+    Sliding window over an endless maze whose rows are generated lazily.  Only ``window`` rows are held, in the same
+    column by column layout as MazeMap but with row ``row`` stored at ``row % window``, so the memory used is bounded
+    no matter how far down the maze goes.  Rows are addressed by their absolute row number, and rows outside the window
+    behave as walls.
+    """
+    window: int
+    top: int
+    bottom: int
+    _rows: Iterator[bytes]
+
+    def __init__(self, width: int, window: int, rows: Iterator[bytes]):
         """
-        Initialize a new maze generator
+        Initialize the window with the first rows of the maze
 
-        :param width: Width of the mazes to be generated
-        :param height: Height of the mazes to be generated
+        :param width: width of the maze
+        :param window: number of rows held in memory
+        :param rows: iterator of the maze rows, each one byte code per cell
         """
-        if width % 2 == 0 or height % 2 == 0:
-            raise ValueError("The width and height parameters need to be odd.")
+        super().__init__(width, window)
+        self.window = window
+        self.top = 0
+        self.bottom = 0
+        self._rows = rows
+        self.scroll_to(0)
 
-        self.maze_image = MazeMap(width, height)
+    def scroll_to(self, top: int) -> int:
+        """
+        Slide the window down so it holds the rows from top to top + window - 1
+
+        :param top: First row to hold, the window only ever moves down
+        :return: Number of rows that were newly loaded into the window
+        """
+        if top < self.top:
+            raise ValueError("The maze window can not scroll back up.")
+        self.top = top
+        loaded = 0
+        while self.bottom < top + self.window:
+            row = next(self._rows)
+            if self.bottom >= top:
+                self.cells[self.bottom % self.window::self.window] = row
+                loaded += 1
+            self.bottom += 1
+        return loaded
+
+    def index(self, col: int, row: int) -> int:
+        return col * self.window + row % self.window
+
+    def is_wall(self, col: int, row: int) -> bool:
+        if not self.top <= row < self.bottom:
+            return True
+        return self.cells[col * self.window + row % self.window] == WALL_CELL
+
+    def build_exits(self):
+        """
+        The rows of the window keep changing, so the exits are worked out from the walls on every lookup instead
+        """
+        pass
+
+    def exit_mask(self, col: int, row: int) -> int:
+        mask = 0
+        if not self.is_wall(col, row):
+            for direction, (next_col, next_row) in enumerate(((col - 1, row), (col, row - 1),
+                                                              (col + 1, row), (col, row + 1))):
+                if not self.is_wall(next_col, next_row):
+                    mask |= 1 << direction
+        return mask
+
+
+class MazeAlgorithm:
+    """
+    Base class of the maze generation strategies.  A strategy works on a grid of generator cells, where generator cell
+    (column, row) is the maze location (column * 2 + 1, row * 2 + 1) and the locations in between are the walls that
+    can be knocked down.  Subclasses implement carve() and are made selectable by name with register_algorithm().
+    """
+    name: str
+    width: int
+    height: int
+
+    def __init__(self, width: int, height: int):
+        """
+        Initialize the strategy
+
+        :param width: Width of the maze in generator cells
+        :param height: Height of the maze in generator cells
+        """
         self.width = width
         self.height = height
-        self.total_cells = self._width * self._height
 
-    def _render(self):
+    def carve(self, maze: MazeMap, rng: Random):
+        """
+        Generate a new maze into the maze map, overwriting all of its cells
+
+        :param maze: MazeMap to generate the maze into
+        :param rng: Random number generator making every choice, so the same seed always gives the same maze
+        """
+        raise NotImplementedError
+
+    def _fill(self, maze: MazeMap):
+        """
+        Reset the maze map to all walls with every generator cell open, ready for walls to be knocked down
+
+        :param maze: MazeMap to reset
+        """
+        cells = maze.cells
+        height = maze.height
+        cells[:] = bytes([WALL_CELL]) * len(cells)
+        for column in range(0, self.width):
+            start = ((column * 2) + 1) * height + 1
+            cells[start:start + (self.height * 2):2] = bytes([PASSAGE_CELL]) * self.height
+
+
+ALGORITHMS: Dict[str, Type[MazeAlgorithm]] = dict()
+
+
+def register_algorithm(name: str):
+    """
+    Class decorator that makes a MazeAlgorithm subclass selectable by name in MazeGenerator
+
+    :param name: Name to register the algorithm under
+    """
+    def register(algorithm_class: Type[MazeAlgorithm]) -> Type[MazeAlgorithm]:
+        algorithm_class.name = name
+        ALGORITHMS[name] = algorithm_class
+        return algorithm_class
+    return register
+
+
+@register_algorithm('hunt_and_kill')
+class HuntAndKill(MazeAlgorithm):
+    """
+    Random walk that, when it gets stuck, scans forward through the grid for the next mapped cell to continue from.
+    Builds a map of the walls of every cell before rendering it into the maze map.
+    """
+    BOTH_WALLS = 0
+    HORIZONTAL_WALL = 1
+    VERTICAL_WALL = 2
+    NO_WALLS = 3
+
+    wall_map: List[List[int]]
+    mapped_cells: Set[Tuple[int, int]]
+    rng: Random
+
+    column: int
+    row: int
+    total_cells: int
+
+    def __init__(self, width: int, height: int):
+        super().__init__(width, height)
+        self.wall_map = list()
+        self.mapped_cells = set()
+        self.column = 0
+        self.row = 0
+        self.total_cells = width * height
+        self.rng = Random()
+
+    def carve(self, maze: MazeMap, rng: Random):
+        self.rng = rng
+        self._generate()
+        self._render(maze)
+
+    def _render(self, maze: MazeMap):
         """
         Render the maze that generated into a MazeMap
         """
-        for row in range(0, self._height):
-            for column in range(0, self._width):
+        cells = maze.cells
+        height = maze.height
+        for row in range(0, self.height):
+            for column in range(0, self.width):
                 walls = self.wall_map[column][row]
-                v_wall = '#' if walls == self.BOTH_WALLS or walls == self.VERTICAL_WALL else ' '
-                h_wall = '#' if walls == self.BOTH_WALLS or walls == self.HORIZONTAL_WALL else ' '
-                self.maze_image.map[(column * 2) + 1][(row * 2) + 1] = ' '
-                self.maze_image.map[(column * 2) + 2][(row * 2) + 1] = v_wall
-                self.maze_image.map[(column * 2) + 1][(row * 2) + 2] = h_wall
-                self.maze_image.map[(column * 2) + 2][(row * 2) + 2] = '#'
+                v_wall = WALL_CELL if walls == self.BOTH_WALLS or walls == self.VERTICAL_WALL else PASSAGE_CELL
+                h_wall = WALL_CELL if walls == self.BOTH_WALLS or walls == self.HORIZONTAL_WALL else PASSAGE_CELL
+                cell = ((column * 2) + 1) * height + (row * 2) + 1
+                cells[cell] = PASSAGE_CELL
+                cells[cell + height] = v_wall
+                cells[cell + 1] = h_wall
+                cells[cell + height + 1] = WALL_CELL
 
     def _generate(self):
         """
         Generate the maze by determining walls and passages
         """
         wall_map = list()
-        for column in range(0, self._width):
+        for column in range(0, self.width):
             wall_map.append(list())
-            for row in range(0, self._height):
+            for row in range(0, self.height):
                 wall_map[column].append(self.BOTH_WALLS)
         self.wall_map = wall_map
 
         self.mapped_cells = set()
 
-        self.column = randint(1, self._width - 1)
+        self.column = self.rng.randint(1, self.width - 1)
         self.row = 0
         total = 1
         self.mapped_cells.add((self.column, self.row))
@@ -277,10 +622,10 @@ class MazeGenerator:
                 while (self.column, self.row) not in self.mapped_cells or do_once:
                     do_once = False
                     self.column += 1
-                    if self.column == self._width:
+                    if self.column == self.width:
                         self.column = 0
                         self.row += 1
-                        if self.row == self._height:
+                        if self.row == self.height:
                             self.row = 0
 
             if new_cell_dir != "advance":
@@ -295,38 +640,38 @@ class MazeGenerator:
         if self._is_left_open():
             if self._is_above_open():
                 if self._is_right_open():
-                    return ['left', 'up', 'right'][randint(0, 2)]
+                    return ['left', 'up', 'right'][self.rng.randint(0, 2)]
                 elif self._is_below_open():
-                    return ['left', 'up', 'down'][randint(0, 2)]
+                    return ['left', 'up', 'down'][self.rng.randint(0, 2)]
                 else:
-                    return ['left', 'up'][randint(0, 1)]
+                    return ['left', 'up'][self.rng.randint(0, 1)]
             else:
                 if self._is_right_open():
                     if self._is_below_open():
-                        return ['left', 'right', 'down'][randint(0, 2)]
+                        return ['left', 'right', 'down'][self.rng.randint(0, 2)]
                     else:
-                        return ['left', 'right'][randint(0, 1)]
+                        return ['left', 'right'][self.rng.randint(0, 1)]
                 else:
                     if self._is_below_open():
-                        return ['left', 'down'][randint(0, 1)]
+                        return ['left', 'down'][self.rng.randint(0, 1)]
                     else:
                         return 'left'
         else:
             if self._is_above_open():
                 if self._is_right_open():
                     if self._is_below_open():
-                        return ['up', 'right', 'down'][randint(0, 2)]
+                        return ['up', 'right', 'down'][self.rng.randint(0, 2)]
                     else:
-                        return ['up', 'right'][randint(0, 1)]
+                        return ['up', 'right'][self.rng.randint(0, 1)]
                 else:
                     if self._is_below_open():
-                        return ['up', 'down'][randint(0, 1)]
+                        return ['up', 'down'][self.rng.randint(0, 1)]
                     else:
                         return 'up'
             else:
                 if self._is_right_open():
                     if self._is_below_open():
-                        return ['right', 'down'][randint(0, 1)]
+                        return ['right', 'down'][self.rng.randint(0, 1)]
                     else:
                         return 'right'
                 else:
@@ -357,7 +702,7 @@ class MazeGenerator:
 
         :return: True is available, or False
         """
-        return (self.column + 1 < self._width) and ((self.column + 1, self.row) not in self.mapped_cells)
+        return (self.column + 1 < self.width) and ((self.column + 1, self.row) not in self.mapped_cells)
 
     def _is_below_open(self):
         """
@@ -365,26 +710,334 @@ class MazeGenerator:
 
         :return: True is available, or False
         """
-        return (self.row + 1 < self._height) and ((self.column, self.row + 1) not in self.mapped_cells)
+        return (self.row + 1 < self.height) and ((self.column, self.row + 1) not in self.mapped_cells)
+
+
+@register_algorithm('backtracker')
+class Backtracker(MazeAlgorithm):
+    """
+    Iterative depth first walk (recursive backtracker).  Visited cells are marked in a scratch copy of the maze image
+    padded with walls, and the walk's frontier is a list used as a stack.  Every step is constant time, so unlike the
+    hunt and kill walk there is never a scan over the grid.  Gives long winding passages with few dead ends.
+    """
+
+    def carve(self, maze: MazeMap, rng: Random):
+        cells = maze.cells
+        height = maze.height
+
+        # Scratch grid with two extra columns of wall, so the neighbours of the edge cells never index outside of it.
+        # Stepping west of the first column wraps around into the padding as a negative index.
+        grid = bytearray([WALL_CELL]) * (len(cells) + 2 * height)
+        for column in range(0, self.width):
+            start = ((column * 2) + 1) * height + 1
+            grid[start:start + (self.height * 2):2] = bytes([OPEN_CELL]) * self.height
+
+        west, north, east, south = -2 * height, -2, 2 * height, 2
+        cell = ((rng.randrange(0, self.width) * 2) + 1) * height + (rng.randrange(0, self.height) * 2) + 1
+        grid[cell] = PASSAGE_CELL
+
+        stack = [cell]
+        pop = stack.pop
+        push = stack.append
+        rand = rng.random
+        while stack:
+            cell = stack[-1]
+            options = []
+            if grid[cell + west] == OPEN_CELL:
+                options.append(west)
+            if grid[cell + north] == OPEN_CELL:
+                options.append(north)
+            if grid[cell + east] == OPEN_CELL:
+                options.append(east)
+            if grid[cell + south] == OPEN_CELL:
+                options.append(south)
+            if not options:
+                pop()
+                continue
+            step = options[int(rand() * len(options))]
+            grid[cell + step // 2] = PASSAGE_CELL
+            cell += step
+            grid[cell] = PASSAGE_CELL
+            push(cell)
+
+        cells[:] = grid[:len(cells)]
+
+
+@register_algorithm('kruskal')
+class Kruskal(MazeAlgorithm):
+    """
+    Randomized Kruskal: knock down the walls in random order whenever they separate two cells that are not connected
+    yet, tracked with a union find over all the cells.  Memory is linear in the number of cells and the maze has lots
+    of short dead ends.
+    """
+
+    def carve(self, maze: MazeMap, rng: Random):
+        self._fill(maze)
+        cells = maze.cells
+        image_height = maze.height
+        width = self.width
+        height = self.height
+
+        # Each wall is stored as cell index * 2, plus one for the wall below the cell instead of the one to the east
+        walls = [cell * 2 for cell in range(0, (width - 1) * height)]
+        walls.extend((column * height + row) * 2 + 1 for column in range(0, width) for row in range(0, height - 1))
+        rng.shuffle(walls)
+
+        parent = list(range(0, width * height))
+        for wall in walls:
+            cell = wall >> 1
+            other = cell + (1 if wall & 1 else height)
+
+            # Find both roots, halving the paths as we go
+            while parent[cell] != cell:
+                parent[cell] = parent[parent[cell]]
+                cell = parent[cell]
+            while parent[other] != other:
+                parent[other] = parent[parent[other]]
+                other = parent[other]
+            if cell == other:
+                continue
+            parent[other] = cell
+
+            column, row = divmod(wall >> 1, height)
+            image = ((column * 2) + 1) * image_height + (row * 2) + 1
+            cells[image + (1 if wall & 1 else image_height)] = PASSAGE_CELL
+
+
+@register_algorithm('wilson')
+class Wilson(MazeAlgorithm):
+    """
+    Wilson's algorithm: loop erased random walks from every cell not in the maze until they hit the maze.  Produces an
+    unbiased sample of all possible mazes, but the first walks are slow to find the maze on big boards.
+    """
+
+    def carve(self, maze: MazeMap, rng: Random):
+        self._fill(maze)
+        cells = maze.cells
+        image_height = maze.height
+        width = self.width
+        height = self.height
+        total = width * height
+        random = rng.random
+
+        cell_steps = (-height, -1, height, 1)
+        image_steps = (-image_height, -1, image_height, 1)
+
+        in_maze = bytearray(total)
+        exits = bytearray(total)
+        in_maze[rng.randrange(0, total)] = 1
+
+        for start in range(0, total):
+            if in_maze[start]:
+                continue
+
+            # Random walk until the maze is reached, remembering the last way out of every cell.  Overwriting the exit
+            # of a revisited cell erases the loop.
+            cell = start
+            while not in_maze[cell]:
+                column, row = divmod(cell, height)
+                directions = []
+                if column > 0:
+                    directions.append(WEST)
+                if row > 0:
+                    directions.append(NORTH)
+                if column < width - 1:
+                    directions.append(EAST)
+                if row < height - 1:
+                    directions.append(SOUTH)
+                direction = directions[int(random() * len(directions))]
+                exits[cell] = direction
+                cell += cell_steps[direction]
+
+            # Follow the loop erased path, adding it to the maze
+            cell = start
+            while not in_maze[cell]:
+                in_maze[cell] = 1
+                column, row = divmod(cell, height)
+                image = ((column * 2) + 1) * image_height + (row * 2) + 1
+                cells[image + image_steps[exits[cell]]] = PASSAGE_CELL
+                cell += cell_steps[exits[cell]]
+
+
+@register_algorithm('ellers')
+class Ellers(MazeAlgorithm):
+    """
+    Eller's algorithm: builds the maze one row at a time, only remembering which set each cell of the current row
+    belongs to.  Memory is O(width), so it suits very tall mazes.
+    """
+
+    def rows(self, rng: Random, endless: bool = False) -> Iterator[Tuple[bytearray, bytearray]]:
+        """
+        Generate the rows of the maze
 
-    def get_maze(self) -> MazeMap:
+        :param rng: Random number generator making every choice
+        :param endless: Keep generating rows forever instead of closing the maze off after height rows
+        :return: Iterator of (east, south) for every row.  east[column] is set if the passage to the next cell to the
+                 east is open, and south[column] is set if the passage to the cell below is open.
         """
-        Get a new random generated maze
+        width = self.width
+        random = rng.random
+        sets = list(range(0, width))
+        next_set = width
+
+        row = 0
+        while endless or row < self.height:
+            last = not endless and row == self.height - 1
+            row += 1
+            members: Dict[int, List[int]] = dict()
+            for column, cell_set in enumerate(sets):
+                members.setdefault(cell_set, []).append(column)
 
+            # Randomly join neighbouring cells of different sets, the last row joins them all
+            east = bytearray(width)
+            for column in range(0, width - 1):
+                keep, merge = sets[column], sets[column + 1]
+                if keep != merge and (last or random() < 0.5):
+                    east[column] = 1
+                    if len(members[keep]) < len(members[merge]):
+                        keep, merge = merge, keep
+                    for member in members[merge]:
+                        sets[member] = keep
+                    members[keep].extend(members.pop(merge))
+
+            # Every set carries on to the next row through at least one passage down
+            south = bytearray(width)
+            if not last:
+                for columns in members.values():
+                    opened = False
+                    for column in columns:
+                        if random() < 0.5:
+                            south[column] = 1
+                            opened = True
+                    if not opened:
+                        south[columns[int(random() * len(columns))]] = 1
+                for column in range(0, width):
+                    if not south[column]:
+                        sets[column] = next_set
+                        next_set += 1
+
+            yield east, south
+
+    def carve(self, maze: MazeMap, rng: Random):
+        self._fill(maze)
+        cells = maze.cells
+        image_height = maze.height
+        for row, (east, south) in enumerate(self.rows(rng)):
+            image = image_height + (row * 2) + 1
+            for column in range(0, self.width):
+                if east[column]:
+                    cells[image + image_height] = PASSAGE_CELL
+                if south[column]:
+                    cells[image + 1] = PASSAGE_CELL
+                image += 2 * image_height
+
+
+class MazeGenerator:
+    maze_image: MazeMap
+    algorithm: MazeAlgorithm
+    rng: Random
+    seed: Optional[int]
+
+    _width = 0
+    _height = 0
+    total_cells = 0
+
+    @property
+    def width(self):
+        return (self._width * 2) + 1
+
+    @width.setter
+    def width(self, w):
+        self._width = (w - 1) // 2
+
+    @property
+    def height(self):
+        return (self._height * 2) + 1
+
+    @height.setter
+    def height(self, h):
+        self._height = (h - 1) // 2
+
+    def __init__(self, width=79, height=13, algorithm: str = 'hunt_and_kill', seed: Optional[int] = None):
+        """
+        Initialize a new maze generator
+
+        :param width: Width of the mazes to be generated
+        :param height: Height of the mazes to be generated
+        :param algorithm: Name of the registered maze algorithm used to generate the mazes
+        :param seed: Seed of the generator's random number generator, which picks the seed of every maze generated
+        """
+        if width % 2 == 0 or height % 2 == 0:
+            raise ValueError("The width and height parameters need to be odd.")
+        if algorithm not in ALGORITHMS:
+            raise ValueError("%s is not a known maze algorithm." % algorithm)
+
+        self.maze_image = MazeMap(width, height)
+        self.width = width
+        self.height = height
+        self.total_cells = self._width * self._height
+        self.algorithm = ALGORITHMS[algorithm](self._width, self._height)
+        self.rng = Random(seed)
+        self.seed = None
+
+    def next_seed(self) -> int:
+        """
+        Draw the seed of the next maze from the generator's random number generator
+
+        :return: The seed
+        """
+        return self.rng.getrandbits(32)
+
+    def get_maze(self, seed: Optional[int] = None) -> MazeMap:
+        """
+        Get a new random generated maze.  The same algorithm, size and seed always give the same maze.
+
+        :param seed: Seed of the maze, or None to draw the next one from the generator
         :return: MazeMap of the generated maze
         """
-        self._generate()
-        self._render()
+        self.seed = self.next_seed() if seed is None else seed
+        self.algorithm.carve(self.maze_image, Random(self.seed))
+        self.maze_image.build_exits()
         return self.maze_image
 
+    def rows(self, seed: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Lazily generate the rows of an endless maze.  Rows are only built as they are asked for, with Eller's algorithm
+        since it is the one that works row by row, whatever algorithm the generator was created with.
+
+        :param seed: Seed of the maze, or None to draw the next one from the generator
+        :return: Iterator of the maze rows, each one byte code per cell for the width of the maze
+        """
+        width = self.width
+        wall_row = bytes([WALL_CELL]) * width
+        passages = bytes.maketrans(bytes([0, 1]), bytes([WALL_CELL, PASSAGE_CELL]))
+
+        rng = Random(self.next_seed() if seed is None else seed)
+
+        yield wall_row
+        for east, south in Ellers(self._width, self._height).rows(rng, endless=True):
+            row = bytearray(wall_row)
+            row[1::2] = bytes([PASSAGE_CELL]) * self._width
+            row[2::2] = east.translate(passages)
+            yield bytes(row)
+
+            row = bytearray(wall_row)
+            row[1::2] = south.translate(passages)
+            yield bytes(row)
+
+    def get_stream(self, window: int, seed: Optional[int] = None) -> StreamingMazeMap:
+        """
+        Get a new endless maze that keeps only a window of rows in memory
+
+        :param window: Number of maze rows held at once
+        :param seed: Seed of the maze, or None to draw the next one from the generator
+        :return: StreamingMazeMap positioned at the top of the maze
+        """
+        return StreamingMazeMap(self.width, window, self.rows(seed))
+
     def __str__(self):
         """
         Dump the maze into a string
         """
-        s = ''
+        return str(self.maze_image)
 
-        for row in range(0, len(self.maze_image.map[0])):
-            for col in range(0, len(self.maze_image.map)):
-                s += self.maze_image.map[col][row]
-            s += '\n'
-        return s
@@ -1,20 +1,21 @@
-from random import choice
-from typing import Tuple, Optional
+from __future__ import annotations
 
-from pygame.rect import Rect
-from pygame.surface import Surface
+from typing import Optional, TYPE_CHECKING
 
-from maze.maze_generate import MazeMap
 from maze.critters import Critter, CritterGroup
+from maze.entities import EntitySingle
+
+if TYPE_CHECKING:
+    from maze.simulation import Simulation
 
 
 class TheMouse(Critter):
 
-    def __init__(self, maze_map: MazeMap, critter_tiles: Tuple[Surface, Rect, Rect, Rect, Rect], *groups):
-        super().__init__(maze_map, critter_tiles, *groups)
+    def __init__(self, game: Simulation, group: Optional[EntitySingle] = None):
+        super().__init__(game, group)
         self.column = 1
         self.row = 1
-        self.direction = choice(self.map.passages(self.column, self.row))
+        self.direction = game.rng.choice(self.maze_map.passages(self.column, self.row))
 
 
 class Mouse(CritterGroup):
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from maze.entities import Entity
+
+
+class OccupancyGrid:
+    """
+    Index of the entities at each cell of the maze, kept up to date by the entities themselves as they move, so finding
+    who is at a location does not need a scan over all the entities.  Only the occupied cells are stored.
+    """
+    height: int
+    cells: Dict[int, List[Entity]]
+
+    def __init__(self, height: int = 0):
+        """
+        Initialize an empty grid
+
+        :param height: Height of the maze the grid covers
+        """
+        self.height = height
+        self.cells = dict()
+
+    def reset(self, height: int):
+        """
+        Empty the grid for a new maze
+
+        :param height: Height of the new maze
+        """
+        self.height = height
+        self.cells.clear()
+
+    def place(self, entity: Entity, old_cell: Optional[int], col: int, row: int) -> int:
+        """
+        Move an entity to a new location
+
+        :param entity: The entity moving
+        :param old_cell: The cell the entity was placed at before, or None if it was not placed yet
+        :param col: Column of the new location
+        :param row: Row of the new location
+        :return: The cell the entity is now placed at, to be handed back when it moves again
+        """
+        if old_cell is not None:
+            self.remove(entity, old_cell)
+        cell = col * self.height + row
+        occupants = self.cells.get(cell)
+        if occupants is None:
+            self.cells[cell] = [entity]
+        else:
+            occupants.append(entity)
+        return cell
+
+    def remove(self, entity: Entity, cell: int):
+        """
+        Take an entity off the grid
+
+        :param entity: The entity to remove
+        :param cell: The cell the entity was placed at
+        """
+        occupants = self.cells.get(cell)
+        if occupants is not None and entity in occupants:
+            occupants.remove(entity)
+            if not occupants:
+                del self.cells[cell]
+
+    def at(self, col: int, row: int) -> Sequence[Entity]:
+        """
+        Get the entities at a location
+
+        :param col: column of the maze location
+        :param row: row of the maze location
+        :return: The entities at the location, do not change it
+        """
+        return self.cells.get(col * self.height + row, ())
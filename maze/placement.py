@@ -0,0 +1,117 @@
+from array import array
+from random import Random
+from typing import Callable, List, Optional
+
+from maze.maze_generate import MazeMap, WALL_CELL
+
+
+def open_cells(maze: MazeMap) -> array:
+    """
+    Index the open cells of a maze
+
+    :param maze: The maze
+    :return: Cell id of every cell that is not a wall, in cell order
+    """
+    cells = maze.cells
+    return array('l', (cell for cell in range(len(cells)) if cells[cell] != WALL_CELL))
+
+
+def outside_start(height: int, col: int = 10, row: int = 10) -> Callable[[int], bool]:
+    """
+    Constraint keeping placements away from the start of the maze: out of the rows above a location, and out of the
+    part of its row to its left, as the locations after it in reading order
+
+    :param height: Height of the maze
+    :param col: Column of the first location allowed in its row
+    :param row: First row entirely allowed below the start
+    :return: Predicate of the cell ids allowed
+    """
+    first = col * height + row
+
+    def allowed(cell: int) -> bool:
+        cell_row = cell % height
+        return cell_row > row or (cell_row == row and cell >= first)
+    return allowed
+
+
+class Placement:
+    """
+    Random placement of things in the open cells of a maze, no two in the same cell.  The open cells are held in a pool
+    with the cells still free at the front.  A placement is a partial Fisher-Yates shuffle step: a random free cell is
+    swapped to the end of the free part and the free part shrinks by one, so every placement takes the same time
+    however full the maze gets, and nothing is ever drawn twice.
+    """
+    height: int
+    pool: array
+    slots: array
+    free: int
+
+    def __init__(self, maze: MazeMap):
+        """
+        Initialize the placement with every open cell free
+
+        :param maze: The maze things are placed in
+        """
+        self.height = maze.height
+        self.pool = open_cells(maze)
+        # Where each cell is in the pool, -1 for walls
+        self.slots = array('l', [-1]) * len(maze.cells)
+        for slot, cell in enumerate(self.pool):
+            self.slots[cell] = slot
+        self.free = len(self.pool)
+
+    def __len__(self) -> int:
+        return self.free
+
+    def exclude(self, cell: int) -> bool:
+        """
+        Keep a cell from being placed in
+
+        :param cell: Cell id of the cell
+        :return: True if the cell was free
+        """
+        slot = self.slots[cell]
+        if not 0 <= slot < self.free:
+            return False
+        self._take(slot)
+        return True
+
+    def _take(self, slot: int) -> int:
+        """
+        Move the cell at a slot of the free part of the pool to just after it, and shrink the free part over it
+        """
+        pool = self.pool
+        slots = self.slots
+        last = self.free - 1
+        cell = pool[slot]
+        moved = pool[last]
+        pool[slot] = moved
+        slots[moved] = slot
+        pool[last] = cell
+        slots[cell] = last
+        self.free = last
+        return cell
+
+    def take(self, count: int, rng: Random, allowed: Optional[Callable[[int], bool]] = None) -> List[int]:
+        """
+        Place things in random free cells
+
+        :param count: How many things to place
+        :param rng: Random number generator to draw from
+        :param allowed: Constraint on the cells, a predicate of their cell id, or None for any free cell
+        :return: Cell id of each cell taken, fewer than count if the free cells ran out
+        """
+        if allowed is None:
+            randrange = rng.randrange
+            return [self._take(randrange(self.free)) for _ in range(min(count, self.free))]
+
+        # Shuffle just the cells allowed, and take the cells drawn out of the pool
+        candidates = [cell for cell in self.pool[:self.free] if allowed(cell)]
+        taken = list()
+        for last in range(len(candidates) - 1, len(candidates) - 1 - min(count, len(candidates)), -1):
+            index = rng.randint(0, last)
+            cell = candidates[index]
+            candidates[index] = candidates[last]
+            self.exclude(cell)
+            taken.append(cell)
+        return taken
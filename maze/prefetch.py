@@ -0,0 +1,72 @@
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Optional
+
+from maze.maze_generate import MazeGenerator, MazeMap
+
+
+def generate_maze(width: int, height: int, algorithm: str, seed: int) -> MazeMap:
+    """
+    Generate a single maze.  Module level so it can be sent to a worker process.
+
+    :param width: Width of the maze
+    :param height: Height of the maze
+    :param algorithm: Name of the maze algorithm
+    :param seed: Seed of the maze
+    :return: MazeMap of the new maze
+    """
+    return MazeGenerator(width, height, algorithm).get_maze(seed)
+
+
+class MazePrefetcher:
+    """
+    Generates the next maze on a worker while the current level is being played, so switching level only has to pick up
+    a maze that is already built.  Every maze handed out is a new MazeMap.  The seeds are drawn from the generator in
+    order, so a seeded generator gives the same sequence of mazes as calling its get_maze() directly.
+    """
+    generator: MazeGenerator
+    executor: Executor
+    next_maze: Optional[Future]
+    next_seed: int
+    seed: Optional[int]
+
+    def __init__(self, generator: MazeGenerator, processes: bool = False):
+        """
+        Start generating the first maze
+
+        :param generator: Generator holding the size and algorithm of the mazes to build
+        :param processes: Build the mazes in a worker process instead of a worker thread, so generating does not compete
+                          with the game loop for the interpreter lock
+        """
+        self.generator = generator
+        self.seed = None
+        self.executor = ProcessPoolExecutor(max_workers=1) if processes else ThreadPoolExecutor(max_workers=1)
+        self.next_maze = None
+        self._prefetch()
+
+    def _prefetch(self):
+        """
+        Queue up the generation of the next maze
+        """
+        generator = self.generator
+        self.next_seed = generator.next_seed()
+        self.next_maze = self.executor.submit(generate_maze, generator.width, generator.height,
+                                              generator.algorithm.name, self.next_seed)
+
+    def get_maze(self) -> MazeMap:
+        """
+        Get the maze generated in the background and start building the one after it.  Only blocks if the maze is not
+        finished yet.
+
+        :return: MazeMap of the generated maze
+        """
+        maze = self.next_maze.result()
+        self.seed = self.next_seed
+        self._prefetch()
+        return maze
+
+    def close(self):
+        """
+        Stop the worker, dropping the maze that was being prefetched
+        """
+        self.next_maze.cancel()
+        self.executor.shutdown(wait=False)
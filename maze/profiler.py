@@ -0,0 +1,112 @@
+from array import array
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+# Phases of a frame of MazeGame.game_loop, in the order they are timed
+FRAME_PHASES = ('input', 'sim', 'update', 'maze', 'hud', 'display')
+PROFILE_FRAMES = 1024
+PERCENTILES = (50, 95, 99)
+
+
+class FrameProfiler:
+    """
+    Times each phase of the last PROFILE_FRAMES frames.  A frame is started with start(), then mark() is called at the
+    end of each phase and end_frame() at the end of the frame.  Times are kept in ring buffers of floats, so timing a
+    frame allocates nothing.
+    """
+    enabled = True
+    phases: Tuple[str, ...]
+    frames: int
+    times: Dict[str, array]
+    count: int
+    index: int
+    last: float
+
+    def __init__(self, phases: Tuple[str, ...] = FRAME_PHASES, frames: int = PROFILE_FRAMES):
+        """
+        Initialize the profiler with no frames timed
+
+        :param phases: Names of the phases timed
+        :param frames: Number of frames kept
+        """
+        self.phases = phases
+        self.frames = frames
+        self.times = {phase: array('d', bytes(8 * frames)) for phase in phases + ('frame',)}
+        self.count = 0
+        self.index = 0
+        self.last = perf_counter()
+
+    def start(self):
+        """
+        Start timing a frame
+        """
+        self.last = perf_counter()
+
+    def mark(self, phase: str):
+        """
+        End a phase, its time is from the end of the last one
+
+        :param phase: Name of the phase ending
+        """
+        now = perf_counter()
+        self.times[phase][self.index] = now - self.last
+        self.last = now
+
+    def end_frame(self):
+        """
+        End the frame, its time is the sum of its phases
+        """
+        index = self.index
+        self.times['frame'][index] = sum(self.times[phase][index] for phase in self.phases)
+        self.index = (index + 1) % self.frames
+        self.count += 1
+
+    def last_frame(self, phase: str = 'frame') -> float:
+        """
+        Time of a phase in the last frame, in seconds
+        """
+        return self.times[phase][self.index - 1]
+
+    def percentiles(self, phase: str = 'frame') -> Tuple[float, ...]:
+        """
+        Percentiles of the time of a phase over the frames kept
+
+        :param phase: Name of the phase, or 'frame' for whole frames
+        :return: The PERCENTILES of its time in seconds, nearest rank
+        """
+        kept = min(self.count, self.frames)
+        if kept == 0:
+            return tuple(0.0 for _ in PERCENTILES)
+        times = sorted(self.times[phase][:kept])
+        return tuple(times[min(kept - 1, kept * percentile // 100)] for percentile in PERCENTILES)
+
+    def summary(self) -> List[str]:
+        """
+        Table of the percentiles of each phase, in milliseconds
+
+        :return: Lines of the table
+        """
+        kept = min(self.count, self.frames)
+        lines = ['%-12s' % ('%d frames' % kept) + ''.join('%8s' % ('p%d' % percentile) for percentile in PERCENTILES)]
+        for phase in self.phases + ('frame',):
+            lines.append('%-12s' % phase + ''.join('%8.2f' % (time * 1000) for time in self.percentiles(phase)))
+        return lines
+
+
+class NullProfiler(FrameProfiler):
+    """
+    Profiler that times nothing, used when profiling is off
+    """
+    enabled = False
+
+    def __init__(self):
+        super().__init__((), 1)
+
+    def start(self):
+        pass
+
+    def mark(self, phase: str):
+        pass
+
+    def end_frame(self):
+        pass
@@ -0,0 +1,172 @@
+"""
+Recordings of played games.  A recording holds the seeds a game was played with and, for every frame drawn, the keys
+held and the number of steps the frame ran, which is all it takes to play the game again step for step.  Recordings
+are played back without a display as fast as the simulation runs, for bug reports and timing real sessions.
+"""
+import struct
+from typing import BinaryIO, Callable, Optional, Tuple
+
+from maze.maze_generate import MazeGenerator, WEST, NORTH, EAST, SOUTH
+from maze.simulation import Simulation
+
+# Recording file: magic, version, width and height of the mazes, seed of the maze generator, seed of the simulation and
+# the length of the maze algorithm's name, then the name, then a FRAME_RECORD for every frame drawn
+REPLAY_MAGIC = b'MZRP'
+REPLAY_VERSION = 1
+REPLAY_HEADER = struct.Struct('<4sB3xIIQQB')
+# Seeds are kept as 64 bit unsigned ints
+SEED_MASK = (1 << 64) - 1
+# Steps run and keys held
+FRAME_RECORD = struct.Struct('<BB')
+
+# Bits of the keys held
+KEY_UP = 1
+KEY_LEFT = 2
+KEY_RIGHT = 4
+KEY_DOWN = 8
+KEY_SPACE = 16
+
+# Steps of the record marking the start of a game
+NEW_GAME = 0xFF
+
+# Frames recorded between flushes to the file
+FLUSH_FRAMES = 256
+
+
+def decode_keys(keys: int) -> Tuple[Optional[int], bool]:
+    """
+    Work out what the player is doing from the keys held, an arrow key taking over from the keys after it
+
+    :param keys: Bits of the keys held
+    :return: The direction to steer the mouse or None, and True if the player is calling the dog
+    """
+    if keys & KEY_UP:
+        direction = NORTH
+    elif keys & KEY_LEFT:
+        direction = WEST
+    elif keys & KEY_RIGHT:
+        direction = EAST
+    elif keys & KEY_DOWN:
+        direction = SOUTH
+    else:
+        direction = None
+    return direction, bool(keys & KEY_SPACE)
+
+
+class ReplayRecorder:
+    """
+    Writes a recording as the game is played.  The file is only ever appended to, so a game that crashes still leaves
+    every frame up to the last flush.
+    """
+    path: str
+    file: BinaryIO
+    pending: int
+
+    def __init__(self, path: str, generator: MazeGenerator, maze_seed: int, rng_seed: int):
+        """
+        Start a recording
+
+        :param path: Path of the file, replaced if it exists
+        :param generator: Generator of the mazes of the game
+        :param maze_seed: Seed the generator was made with
+        :param rng_seed: Seed the simulation was made with
+        """
+        self.path = path
+        self.pending = 0
+        name = generator.algorithm.name.encode('ascii')
+        self.file = open(path, 'wb')
+        self.file.write(REPLAY_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, generator.width, generator.height,
+                                           maze_seed, rng_seed, len(name)))
+        self.file.write(name)
+        self.file.flush()
+
+    def new_game(self):
+        """
+        Record the start of a game
+        """
+        self.file.write(FRAME_RECORD.pack(NEW_GAME, 0))
+
+    def frame(self, steps: int, keys: int):
+        """
+        Record a frame
+
+        :param steps: Steps of the simulation run for the frame
+        :param keys: Bits of the keys held
+        """
+        self.file.write(FRAME_RECORD.pack(steps, keys))
+        self.pending += 1
+        if self.pending >= FLUSH_FRAMES:
+            self.file.flush()
+            self.pending = 0
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+class Replay:
+    """
+    A recording read back
+    """
+    width: int
+    height: int
+    algorithm: str
+    maze_seed: int
+    rng_seed: int
+    frames: bytes
+
+    def __init__(self, path: str):
+        """
+        Read a recording
+
+        :param path: Path of the file
+        """
+        with open(path, 'rb') as file:
+            data = file.read()
+        if len(data) < REPLAY_HEADER.size:
+            raise ValueError('"%s" is not a recording.' % path)
+        magic, version, self.width, self.height, self.maze_seed, self.rng_seed, name_size = \
+            REPLAY_HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError('"%s" is not a version %d recording.' % (path, REPLAY_VERSION))
+        start = REPLAY_HEADER.size + name_size
+        self.algorithm = data[REPLAY_HEADER.size:start].decode('ascii')
+        # A frame cut short by a crash is dropped
+        end = start + (len(data) - start) // FRAME_RECORD.size * FRAME_RECORD.size
+        self.frames = data[start:end]
+
+    def __len__(self) -> int:
+        """
+        Number of records, frames and game starts
+        """
+        return len(self.frames) // FRAME_RECORD.size
+
+    def play(self, records: Optional[int] = None, on_step: Optional[Callable[[Simulation], None]] = None) -> Simulation:
+        """
+        Play the recording back, as fast as the simulation runs
+
+        :param records: Number of records to play, all of them by default
+        :param on_step: Called with the simulation after every step
+        :return: The simulation as it was after the last record played
+        """
+        generator = MazeGenerator(self.width, self.height, self.algorithm, seed=self.maze_seed)
+        sim = Simulation(lambda: generator.get_maze(generator.next_seed()), self.rng_seed)
+        frames = self.frames
+        end = len(frames) if records is None else min(len(frames), records * FRAME_RECORD.size)
+        playing = False
+        for offset in range(0, end, FRAME_RECORD.size):
+            steps = frames[offset]
+            if steps == NEW_GAME:
+                sim.new_game()
+                playing = True
+                continue
+            if not playing:
+                continue
+            direction, call_dog = decode_keys(frames[offset + 1])
+            for _ in range(steps):
+                playing = sim.step(direction, call_dog)
+                if on_step is not None:
+                    on_step(sim)
+                if not playing:
+                    break
+        return sim
@@ -0,0 +1,180 @@
+from random import Random
+from typing import Callable, Optional
+
+from maze.cats import Cats
+from maze.dog import DogBlew, Dog
+from maze.items import ItemGroup
+from maze.maze_generate import MazeMap, WEST, NORTH, EAST, SOUTH
+from maze.mouse import TheMouse, Mouse
+from maze.occupancy import OccupancyGrid
+from maze.placement import Placement
+
+# Cheese in every level, the level is cleared when it is all eaten
+CHEESE_COUNT = 50
+
+
+class Score:
+    """
+    The counts the player is shown: the score, the bones held for calling the dog and the lives left
+    """
+    score: int
+    bones: int
+    lives: int
+
+    def __init__(self):
+        self.new_game()
+
+    def new_game(self):
+        self.score = 0
+        self.lives = 3
+        self.bones = 0
+
+
+class Simulation:
+    """
+    The rules of the game, with nothing drawn and no clock.  Each call to step() advances the game one frame, as fast as
+    it is called, so games can be played without a display for testing and balancing.  MazeGame is a view over one.
+    """
+    map: MazeMap
+    maze_source: Callable[[], MazeMap]
+    rng: Random
+    occupancy: OccupancyGrid
+    score: Score
+
+    mouse: Optional[Mouse]
+    dog: Optional[Dog]
+    cats: Optional[Cats]
+    cheese: Optional[ItemGroup]
+    bones: Optional[ItemGroup]
+
+    level: int
+    maze_count: int
+    frame: int
+    is_dog: bool
+    dog_counter: int
+    play_game: bool
+
+    def __init__(self, maze_source: Callable[[], MazeMap], seed: Optional[int] = None):
+        """
+        Initialize a simulation, the first level starts with new_game()
+
+        :param maze_source: Called for the maze of each new level
+        :param seed: Seed of the random choices made by the critters and the placement of the items, so games with the
+            same mazes, seed and moves play out the same
+        """
+        self.maze_source = maze_source
+        self.rng = Random(seed)
+        self.occupancy = OccupancyGrid()
+        self.score = Score()
+
+        self.mouse = None
+        self.cats = None
+        self.dog = None
+        self.cheese = None
+        self.bones = None
+
+        self.level = 0
+        self.maze_count = 0
+        self.frame = 0
+        self.is_dog = False
+        self.dog_counter = 0
+        self.play_game = False
+
+    def new_level(self):
+        self.level += 1
+        self.maze_count += 1
+        self.map = self.maze_source()
+        self.occupancy.reset(self.map.height)
+
+        if self.mouse is None:
+            self.mouse = Mouse(self, TheMouse)
+        else:
+            self.mouse.critter_reset()
+
+        if self.cheese is None:
+            self.cheese = ItemGroup(self, 1, 0)
+        if self.bones is None:
+            self.bones = ItemGroup(self, 5, 1)
+        if self.cats is None:
+            self.cats = Cats(self, self.mouse)
+
+        # Nothing starts on the mouse, or in the same cell as anything else
+        placement = Placement(self.map)
+        placement.exclude(self.map.index(1, 1))
+        self.cheese.new_game(placement, CHEESE_COUNT)
+        self.bones.new_game(placement, 6 + (4 * self.level))
+        self.cats.reset(placement, 5 + (5 * self.level))
+
+    def new_game(self):
+        self.level = 0
+        self.new_level()
+        self.score.new_game()
+        self.dog_counter = 0
+        self.play_game = True
+
+    def move(self, direction: Optional[int]):
+        """
+        Steer the mouse, as the arrow keys do
+
+        :param direction: Direction to start the mouse moving in, or None to leave it be
+        """
+        if direction == NORTH:
+            self.mouse.move_up(self.map)
+        elif direction == WEST:
+            self.mouse.move_left(self.map)
+        elif direction == EAST:
+            self.mouse.move_right(self.map)
+        elif direction == SOUTH:
+            self.mouse.move_down(self.map)
+
+    def step(self, direction: Optional[int] = None, call_dog: bool = False) -> bool:
+        """
+        Play one frame of the game
+
+        :param direction: Direction the player is steering the mouse this frame, or None
+        :param call_dog: True if the player is calling the dog this frame
+        :return: False once the game is over
+        """
+        if self.is_dog:
+            self.dog_counter -= 1
+            if self.dog_counter <= 0:
+                self.mouse.exit_dog(*self.dog.deactivate())
+
+        if direction is not None:
+            self.move(direction)
+        elif call_dog and not self.is_dog:
+            if self.score.bones > 0:
+                self.activate_dog()
+
+        self.update()
+        self.frame += 1
+
+        if len(self.cheese) == 0:
+            self.new_level()
+            self.score.bones = 0
+        return self.play_game
+
+    def update(self):
+        if self.is_dog:
+            try:
+                self.dog.update()
+            except DogBlew:
+                # Pop the dog - switch back to mouse and lose a life
+                self.is_dog = False
+                self.mouse.sprite.kill()
+        else:
+            if not self.mouse.update():
+                if self.next_mouse():
+                    self.mouse.critter_reset()
+                else:
+                    self.play_game = False  # Game Over
+        self.cheese.update(self.mouse.sprite)
+        self.bones.update(self.mouse.sprite)
+        self.cats.update()
+
+    def next_mouse(self):
+        self.score.lives -= 1
+        return self.score.lives > 0
+
+    def activate_dog(self):
+        pass
@@ -1,64 +1,77 @@
-from __future__ import annotations
-
-from typing import TYPE_CHECKING
+from typing import Optional
 
 import pygame
 from pygame.rect import Rect
-from pygame.sprite import AbstractGroup
-
-from maze.maze_generate import MazeMap
+from pygame.surface import Surface
 
-if TYPE_CHECKING:
-    from maze_game import MazeGame
+from maze.config import TILE_WIDTH, TILE_HEIGHT, FIXED_SHIFT, FIXED_ONE
+from maze.critters import Critter
+from maze.entities import Entity
+from maze.tiles import DirectionFrames
 
 
 class MazeSprite(pygame.sprite.Sprite):
     """
-    pyGame Sprite subclass that is designed to represent a sprite that is positioned inside the maze
+    pyGame Sprite subclass that draws an entity of the simulation inside the maze.  The sprite only follows the entity,
+    sync() catches it up after each step of the simulation.
     """
-    _column: int
-    _row: int
-    game: MazeGame
-
-    @property
-    def maze_map(self) -> MazeMap:
-        return self.game.map
+    entity: Entity
+    spare_rect: Rect
 
-    def __init__(self, game: MazeGame, *groups: AbstractGroup) -> None:
-        super().__init__(*groups)
-        self._column = 0
-        self._row = 0
-        self.rect = Rect(0, 0, 32, 32)
-        self.game = game
+    def __init__(self, entity: Entity, image: Surface) -> None:
+        super().__init__()
+        self.entity = entity
+        self.image = image
+        self.rect = Rect(entity.x, entity.y, TILE_WIDTH, TILE_HEIGHT)
+        self.spare_rect = Rect(self.rect)
 
-    def _compute_location(self):
+    def sync(self, alpha: int = FIXED_ONE) -> Optional[Rect]:
         """
-        Update our rect top and left coordinates to reflect current location in maze.  This is internal function is
-        called from the row and column setters.
-        """
-        self.rect.top = self._row * 32
-        self.rect.left = self._column * 32
+        Move the sprite to where its entity is now, or part way there from where it was the step before
 
-    @property
-    def column(self):
-        """
-        Property holding the column where the sprite is positioned in the maze
+        :param alpha: How far from the last step to the current one to draw the sprite, a fixed point fraction with
+            FIXED_SHIFT bits
+        :return: Where the sprite was if it moved or changed, else None.  Only good until the next sync(), the two
+            rectangles are swapped back and forth rather than a new one made for every move.
         """
-        return self._column
+        entity = self.entity
+        x = entity.prev_x + ((entity.x - entity.prev_x) * alpha >> FIXED_SHIFT)
+        y = entity.prev_y + ((entity.y - entity.prev_y) * alpha >> FIXED_SHIFT)
+        old = self.rect
+        if old.x == x and old.y == y:
+            return None
+        rect = self.spare_rect
+        rect.x = x
+        rect.y = y
+        self.rect = rect
+        self.spare_rect = old
+        return old
 
-    @column.setter
-    def column(self, value):
-        self._column = value
-        self._compute_location()
 
-    @property
-    def row(self):
+class CritterSprite(MazeSprite):
+    """
+    Sprite for a critter, drawn with the tile for the way it faces
+    """
+    frames: DirectionFrames
+    direction: int
+
+    def __init__(self, critter: Critter, frames: DirectionFrames) -> None:
         """
-        Property holding the row of where the sprite is positioned in the maze
+        Initialize the sprite
+
+        :param critter: The critter drawn
+        :param frames: The critter's tile for each direction, as made by Tiles
         """
-        return self._row
+        self.frames = frames
+        self.direction = critter.direction
+        super().__init__(critter, frames[self.direction])
 
-    @row.setter
-    def row(self, value):
-        self._row = value
-        self._compute_location()
+    def sync(self, alpha: int = FIXED_ONE) -> Optional[Rect]:
+        old = super().sync(alpha)
+        direction = self.entity.direction
+        if direction != self.direction:
+            self.direction = direction
+            self.image = self.frames[direction]
+            if old is None:
+                old = self.rect
+        return old
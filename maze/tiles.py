@@ -1,11 +1,11 @@
 import os
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 
-import pygame
 from pygame import Rect
-from pygame.image import load
 from pygame.surface import Surface
 
+from maze.atlas import TextureAtlas
+
 
 MAIN_DIR = os.path.split(os.path.abspath(__file__))[0]
 TILE_FILE = "tiles2.png"
@@ -48,6 +48,21 @@ SEVEN_RECT = Rect(112, 0, 16, 32)
 EIGHT_RECT = Rect(128, 0, 16, 32)
 NINE_RECT = Rect(144, 0, 16, 32)
 
+# A critter's tile for each direction, indexed by direction
+DirectionFrames = Tuple[Surface, Surface, Surface, Surface]
+
+
+def direction_frames(critter_tiles: Tuple[Surface, Rect, Rect, Rect, Rect]) -> DirectionFrames:
+    """
+    Cut the tiles of a critter out of its strip
+
+    :param critter_tiles: The strip of the critter's tiles and the rectangle of the tile for each direction
+    :return: A copy of the tile for each direction
+    """
+    strip, *rects = critter_tiles
+    west, north, east, south = (strip.subsurface(rect).copy() for rect in rects)
+    return west, north, east, south
+
 
 class Tiles:
     tiles: Surface
@@ -61,18 +76,23 @@ class Tiles:
     mice: Tuple[Surface, Rect, Rect, Rect, Rect]
     cats: Tuple[Surface, Rect, Rect, Rect, Rect]
     dogs: Tuple[Surface, Rect, Rect, Rect, Rect]
+    mouse_frames: DirectionFrames
+    cat_frames: DirectionFrames
+    dog_frames: DirectionFrames
 
     digit_rects: List[Rect]
-    digits: List[Surface]
+    atlas: TextureAtlas
 
-    def __init__(self):
-        file = os.path.join(MAIN_DIR, TILE_FILE)
+    def __init__(self, cache_path: Optional[str] = None):
+        """
+        Load the tiles.  The display mode must be set.
 
-        try:
-            self.tiles = load(file).convert()
-            self.digits = [load(os.path.join(MAIN_DIR, digit_file)).convert() for digit_file in DIGIT_FILES]
-        except pygame.error:
-            raise SystemExit('Could not load image "%s" %s' % (file, pygame.get_error()))
+        :param cache_path: Path of the file caching the decoded images between runs, or None to decode them each time
+        """
+        self.atlas = TextureAtlas(MAIN_DIR, [TILE_FILE] + DIGIT_FILES, cache_path)
+        self.tiles = self.atlas.sheet(TILE_FILE)
+        if cache_path is not None and not self.atlas.complete:
+            self.atlas.store_cache()
 
         self.ground = self.tiles.subsurface(GROUND_RECT)
         self.bone = self.tiles.subsurface(BONE_RECT)
@@ -83,5 +103,26 @@ class Tiles:
         self.cats = (self.tiles.subsurface(CATS_RECT), WEST_RECT, NORTH_RECT, EAST_RECT, SOUTH_RECT)
         self.dogs = (self.tiles.subsurface(DOGS_RECT), WEST_RECT, NORTH_RECT, EAST_RECT, SOUTH_RECT)
 
+        # Each critter facing each way as a surface of its own, indexed by direction, so turning is only picking another
+        self.mouse_frames = direction_frames(self.mice)
+        self.cat_frames = direction_frames(self.cats)
+        self.dog_frames = direction_frames(self.dogs)
+
         self.digit_rects = [ZERO_RECT, ONE_RECT, TWO_RECT, THREE_RECT, FOUR_RECT,
                             FIVE_RECT, SIX_RECT, SEVEN_RECT, EIGHT_RECT, NINE_RECT]
+
+    def digit_sheet(self, color: int) -> Surface:
+        """
+        Get the digits in a color, only decoded the first time that color is used
+
+        :param color: One of the DC_ color indexes
+        :return: The sheet of the digits 0 to 9
+        """
+        return self.atlas.sheet(DIGIT_FILES[color])
+
+    @property
+    def digits(self) -> List[Surface]:
+        """
+        The digit sheet of every color, indexed by color
+        """
+        return [self.digit_sheet(color) for color in range(len(DIGIT_FILES))]
@@ -0,0 +1,40 @@
+from maze.config import STEP_RATE, MAX_STEPS, FIXED_SHIFT
+
+
+class FixedTimestep:
+    """
+    Accumulator that turns the time taken by each drawn frame into whole steps of the simulation, so the game plays at
+    the same pace however fast it is drawn.  Time is kept in milliseconds times the step rate, so a step is exactly 1000
+    of them whatever the rate and no rounding builds up.
+    """
+    rate: int
+    max_steps: int
+    accumulator: int
+
+    def __init__(self, rate: int = STEP_RATE, max_steps: int = MAX_STEPS):
+        """
+        Initialize the accumulator empty
+
+        :param rate: Steps a second
+        :param max_steps: Most steps run for one frame, time beyond them is dropped
+        """
+        self.rate = rate
+        self.max_steps = max_steps
+        self.accumulator = 0
+
+    def advance(self, elapsed: int) -> int:
+        """
+        Add the time taken by a frame
+
+        :param elapsed: Milliseconds since the last frame, as returned by Clock.tick()
+        :return: The number of steps to run before drawing the next frame
+        """
+        steps, self.accumulator = divmod(self.accumulator + elapsed * self.rate, 1000)
+        return min(steps, self.max_steps)
+
+    @property
+    def alpha(self) -> int:
+        """
+        How far the time is from the last step to the next one, as a fixed point fraction with FIXED_SHIFT bits
+        """
+        return (self.accumulator << FIXED_SHIFT) // 1000
@@ -0,0 +1,30 @@
+"""
+Play back a recording made with ``python main.py --record PATH`` without a display, as fast as the game simulates.
+
+    python replay.py PATH [RECORDS]
+"""
+import sys
+import time
+
+from maze.config import STEP_RATE
+from maze.replay import Replay
+
+
+def main(path: str, records: int = None):
+    replay = Replay(path)
+    start = time.perf_counter()
+    sim = replay.play(records)
+    elapsed = time.perf_counter() - start
+
+    print('%s: %dx%d %s mazes, seed %d/%d, %d records' %
+          (path, replay.width, replay.height, replay.algorithm, replay.maze_seed, replay.rng_seed, len(replay)))
+    print('level %d, score %d, lives %d after %d steps' % (sim.level, sim.score.score, sim.score.lives, sim.frame))
+    played = sim.frame / STEP_RATE
+    print('%.1fs of play in %.2fs (%.0fx real time)' % (played, elapsed, played / elapsed if elapsed else 0))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(__doc__.strip())
+        sys.exit(1)
+    main(sys.argv[1], *(int(arg) for arg in sys.argv[2:3]))
@@ -0,0 +1,87 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame  # noqa: E402
+
+from maze.atlas import TextureAtlas, pack_sheets, png_size  # noqa: E402
+from maze.tiles import MAIN_DIR, TILE_FILE, DIGIT_FILES, DC_CYAN, Tiles  # noqa: E402
+
+SHEETS = [TILE_FILE] + DIGIT_FILES
+
+
+class TextureAtlasTestCase(unittest.TestCase):
+
+    def setUp(self):
+        pygame.display.init()
+        pygame.display.set_mode((64, 64))
+        self.directory = tempfile.mkdtemp()
+        for name in SHEETS:
+            shutil.copy(os.path.join(MAIN_DIR, name), self.directory)
+        self.cache_path = os.path.join(self.directory, 'cache', 'atlas.bin')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        pygame.display.quit()
+
+    def pixels(self, surface) -> bytes:
+        return pygame.image.tobytes(surface, 'RGB')
+
+    def test_pack_sheets(self):
+        sizes = {name: png_size(os.path.join(self.directory, name)) for name in SHEETS}
+        index, width, height = pack_sheets(sizes)
+        self.assertEqual((160, 128 + 7 * 32), (width, height))
+        rects = list(index.values())
+        for rect in rects:
+            self.assertTrue(pygame.Rect(0, 0, width, height).contains(rect))
+            self.assertEqual(-1, rect.collidelist([other for other in rects if other is not rect]))
+        self.assertEqual(sizes, {name: rect.size for name, rect in index.items()})
+
+    def test_lazy(self):
+        atlas = TextureAtlas(self.directory, SHEETS)
+        tiles = atlas.sheet(TILE_FILE)
+        self.assertEqual({TILE_FILE}, atlas.loaded)
+        self.assertEqual(self.pixels(pygame.image.load(os.path.join(self.directory, TILE_FILE)).convert()),
+                         self.pixels(tiles))
+        atlas.sheet(DIGIT_FILES[DC_CYAN])
+        self.assertEqual({TILE_FILE, DIGIT_FILES[DC_CYAN]}, atlas.loaded)
+        # Nothing cached without a cache path
+        atlas.store_cache()
+        self.assertFalse(atlas.complete)
+
+    def test_cache(self):
+        atlas = TextureAtlas(self.directory, SHEETS, self.cache_path)
+        self.assertFalse(atlas.complete)
+        atlas.store_cache()
+        self.assertTrue(os.path.exists(self.cache_path))
+        # Written under a temporary name that is renamed over the cache
+        self.assertEqual(['atlas.bin'], os.listdir(os.path.dirname(self.cache_path)))
+
+        # Loaded whole from the cache, without decoding a sheet
+        cached = TextureAtlas(self.directory, SHEETS, self.cache_path)
+        self.assertTrue(cached.complete)
+        for name in SHEETS:
+            self.assertEqual(self.pixels(atlas.sheet(name)), self.pixels(cached.sheet(name)))
+
+        # A changed sheet makes the cache stale
+        os.utime(os.path.join(self.directory, DIGIT_FILES[0]), ns=(0, 0))
+        self.assertFalse(TextureAtlas(self.directory, SHEETS, self.cache_path).complete)
+
+        with open(self.cache_path, 'r+b') as file:
+            file.truncate(100)
+        self.assertFalse(TextureAtlas(self.directory, SHEETS, self.cache_path).complete)
+
+    def test_tiles(self):
+        tiles = Tiles()
+        self.assertEqual({TILE_FILE}, tiles.atlas.loaded)
+        cached = Tiles(self.cache_path)
+        self.assertTrue(Tiles(self.cache_path).atlas.complete)
+        self.assertEqual(self.pixels(tiles.wall), self.pixels(cached.wall))
+        self.assertEqual(self.pixels(tiles.digit_sheet(DC_CYAN)), self.pixels(cached.digits[DC_CYAN]))
+
+
+if __name__ == '__main__':
+    unittest.main()
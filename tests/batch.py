@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+from array import array
+
+from maze.batch import play_game, run_batch, write_results, read_results, RESULT_COLUMNS
+from maze.simulation import Simulation
+from maze.maze_generate import MazeGenerator
+
+
+class BatchTestCase(unittest.TestCase):
+
+    def test_play_game(self):
+        rows = play_game(3, 31, 31, max_frames=5000, max_levels=3)
+        self.assertGreater(len(rows), 0)
+        for level, row in enumerate(rows, 1):
+            self.assertEqual(len(RESULT_COLUMNS), len(row))
+            self.assertEqual((3, level), row[:2])
+        # Every level but the last was cleared
+        self.assertEqual([1] * (len(rows) - 1), [row[6] for row in rows[:-1]])
+        self.assertEqual(rows, play_game(3, 31, 31, max_frames=5000, max_levels=3))
+
+    def test_levels_get_harder(self):
+        generator = MazeGenerator(31, 31, seed=1)
+        sim = Simulation(lambda: generator.get_maze(generator.next_seed()), 1)
+        sim.new_game()
+        self.assertEqual(10, len(sim.cats))
+        sim.new_level()
+        self.assertEqual(2, sim.level)
+        self.assertEqual(15, len(sim.cats))
+        sim.new_game()
+        self.assertEqual(1, sim.level)
+
+    def test_run_batch(self):
+        columns = run_batch(3, 5, 2, width=31, height=31, max_frames=2000, max_levels=2)
+        self.assertEqual([name for name, _ in RESULT_COLUMNS], list(columns))
+        self.assertEqual({5, 6, 7}, set(columns['seed']))
+        # Same results as playing the games one after another
+        rows = [row for seed in (5, 6, 7) for row in play_game(seed, 31, 31, max_frames=2000, max_levels=2)]
+        self.assertEqual(rows, list(zip(*columns.values())))
+
+    def test_results_file(self):
+        columns = {name: array(code, range(index, index + 4)) for index, (name, code) in enumerate(RESULT_COLUMNS)}
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'results.bin')
+            write_results(path, columns)
+            self.assertEqual(columns, read_results(path))
+            with open(path, 'r+b') as file:
+                file.write(b'JUNK')
+            self.assertRaises(ValueError, read_results, path)
+
+    def test_results_other_platform(self):
+        # Written where 'L' is 4 bytes, as on Windows
+        columns = {'seed': array('I', [1, 2, 0xFFFFFFFF]), 'delta': array('i', [-1, 0, 7])}
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'results.bin')
+            write_results(path, columns)
+            with open(path, 'rb') as file:
+                data = file.read()
+            with open(path, 'wb') as file:
+                file.write(data.replace(b'seed' + bytes(12) + b'I', b'seed' + bytes(12) + b'L')
+                           .replace(b'delta' + bytes(11) + b'i', b'delta' + bytes(11) + b'l'))
+            results = read_results(path)
+            self.assertEqual([1, 2, 0xFFFFFFFF], list(results['seed']))
+            self.assertEqual([-1, 0, 7], list(results['delta']))
+
+
+if __name__ == '__main__':
+    unittest.main()
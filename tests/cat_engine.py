@@ -0,0 +1,95 @@
+import unittest
+
+from maze.cats import Cat, Cats
+from maze.maze_generate import MazeGenerator
+from maze.placement import Placement
+from maze.simulation import Simulation
+
+
+def cat_states(sim: Simulation):
+    return [(cat.column, cat.row, cat.x, cat.y, cat.direction, cat.speed, cat.activity, cat.in_transit)
+            for cat in sim.cats.sprites()]
+
+
+class CatEngineTestCase(unittest.TestCase):
+
+    def new_sim(self) -> Simulation:
+        sim = Simulation(lambda: MazeGenerator(51, 51, seed=4).get_maze(4), 4)
+        sim.new_game()
+        sim.cats.reset(Placement(sim.map), 200)
+        return sim
+
+    def test_same_as_one_by_one(self):
+        batched = self.new_sim()
+        single = self.new_sim()
+        for _ in range(300):
+            batched.cats.update()
+            mouse = single.mouse.sprite
+            single.cats.trail.update(mouse.column, mouse.row)
+            for cat in single.cats.sprites():
+                cat.update()
+            self.assertEqual(cat_states(single), cat_states(batched))
+        # The grid follows the cats
+        for cat in batched.cats:
+            self.assertIn(cat, batched.occupancy.at(cat.column, cat.row))
+
+    def test_remove(self):
+        sim = self.new_sim()
+        for _ in range(20):
+            sim.cats.update()
+        cats = sim.cats.sprites()
+        states = cat_states(sim)
+        first, last = cats[0], cats[-1]
+        first.kill()
+        self.assertEqual(199, len(sim.cats.engine))
+        # The last cat took the place of the dead one, and both still read as they were
+        self.assertEqual(0, last.index)
+        self.assertIs(last, sim.cats.engine.cats[0])
+        self.assertEqual(states[-1][:2], last.current_loc)
+        self.assertEqual(states[0][:2], first.current_loc)
+        self.assertFalse(first.alive())
+        self.assertNotIn(first, sim.occupancy.at(*first.current_loc))
+
+        sim.cats.empty()
+        self.assertEqual(0, len(sim.cats.engine))
+
+    def test_fields(self):
+        sim = self.new_sim()
+        cat = sim.cats.sprites()[3]
+        self.assertIsInstance(cat, Cat)
+        cat.is_chased = True
+        cat.speed = 2
+        self.assertIs(True, cat.is_chased)
+        self.assertEqual(1, sim.cats.engine.chased[3])
+        self.assertEqual(2, sim.cats.engine.speed[3])
+
+    def test_add_existing(self):
+        sim = self.new_sim()
+        cat = Cat(sim.mouse, sim, sim.cats.trail)
+        cat.column, cat.row = sim.cats.sprites()[0].current_loc
+        cat.speed = 2
+        cat.activity = 50
+        cat.direction = sim.map.exits(cat.column, cat.row)[0]
+        start = cat.x, cat.y
+        sim.cats.add(cat)
+        self.assertEqual(201, len(sim.cats.engine))
+        self.assertIs(sim.cats.engine, cat.engine)
+        # It keeps the state it had
+        self.assertEqual((2, 50), (cat.speed, cat.activity))
+        for _ in range(50):
+            sim.cats.update()
+        self.assertNotEqual(start, (cat.x, cat.y))
+
+        # And from one group to another
+        cats = Cats(sim, sim.mouse, cat)
+        self.assertEqual(200, len(sim.cats.engine))
+        self.assertEqual([cat], cats.engine.cats)
+        self.assertEqual(0, cat.index)
+        location = cat.x, cat.y
+        for _ in range(50):
+            cats.update()
+        self.assertNotEqual(location, (cat.x, cat.y))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+
+from pygame import Rect
+from pygame.surface import Surface
+
+from maze.chunks import ChunkCache
+from maze.config import TILE_WIDTH, TILE_HEIGHT
+from maze.maze_generate import MazeGenerator
+
+WALL_COLOR = (255, 255, 255, 255)
+GROUND_COLOR = (0, 0, 0, 255)
+
+
+def tile(color) -> Surface:
+    surface = Surface((TILE_WIDTH, TILE_HEIGHT))
+    surface.fill(color)
+    return surface
+
+
+class ChunkCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.maze = MazeGenerator(21, 15).get_maze(5)
+        self.cache = ChunkCache(tile(WALL_COLOR), tile(GROUND_COLOR), chunk_tiles=4)
+        self.cache.reset(self.maze)
+
+    def test_blit(self):
+        # A window that straddles chunk edges, and the edge of the maze
+        area = Rect(3 * TILE_WIDTH + 5, 2 * TILE_HEIGHT + 7, 19 * TILE_WIDTH, 10 * TILE_HEIGHT)
+        surface = Surface(area.size)
+        self.cache.blit(surface, (0, 0), area)
+        for col in range(4, 21):
+            for row in range(3, 12):
+                expected = WALL_COLOR if self.maze.is_wall(col, row) else GROUND_COLOR
+                pixel = col * TILE_WIDTH - area.left, row * TILE_HEIGHT - area.top
+                self.assertEqual(expected, tuple(surface.get_at(pixel)), (col, row))
+        self.assertEqual(self.cache.background_color, tuple(surface.get_at((area.width - 1, 0)))[:3])
+
+    def test_budget(self):
+        chunk_bytes = ChunkCache._surface_size(self.cache.chunk(0, 0))
+        self.cache.budget = 2 * chunk_bytes
+        first = self.cache.chunk(0, 0)
+        self.cache.chunk(1, 0)
+        self.assertIs(first, self.cache.chunk(0, 0))
+        self.cache.chunk(2, 0)
+        self.assertEqual([(0, 0), (2, 0)], list(self.cache.chunks))
+        self.assertEqual(2 * chunk_bytes, self.cache.size)
+
+    def test_reset(self):
+        old = self.cache.chunk(0, 0)
+        other = MazeGenerator(21, 15).get_maze(6)
+        self.cache.reset(other)
+        # The surface is reused, and redrawn for the new maze
+        self.assertIs(old, self.cache.chunk(0, 0))
+        self.assertEqual([], self.cache.spares)
+        for col in range(4):
+            for row in range(4):
+                expected = WALL_COLOR if other.is_wall(col, row) else GROUND_COLOR
+                self.assertEqual(expected, tuple(old.get_at((col * TILE_WIDTH, row * TILE_HEIGHT))))
+
+    def test_invalidate_rows(self):
+        for chunk_row in range(4):
+            self.cache.chunk(0, chunk_row)
+        dropped = [self.cache.chunk(0, 1), self.cache.chunk(0, 2)]
+        self.cache.invalidate_rows(5, 9)
+        self.assertEqual([(0, 0), (0, 3)], list(self.cache.chunks))
+        # Their surfaces render the next chunks
+        self.assertEqual(dropped, self.cache.spares)
+        self.assertIn(self.cache.chunk(0, 1), dropped)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from maze.flow_field import FlowField, UNREACHED
+from maze.maze_generate import MazeGenerator, MazeMap, WALL_CELL, EAST, SOUTH
+
+
+class FlowFieldTestCase(unittest.TestCase):
+
+    def test_open_room(self):
+        maze = MazeMap(7, 5)
+        field = FlowField(maze)
+        self.assertTrue(field.update(1, 1))
+        self.assertFalse(field.update(1, 1))
+
+        self.assertEqual(0, field.distance(1, 1))
+        self.assertIsNone(field.next_step(1, 1))
+        self.assertEqual(6, field.distance(5, 3))
+        self.assertEqual(UNREACHED, field.distance(0, 0))
+        self.assertIsNone(field.next_step(0, 0))
+
+        self.assertTrue(field.update(5, 3))
+        self.assertEqual(EAST, field.next_step(4, 3))
+        self.assertEqual(SOUTH, field.next_step(5, 2))
+
+    def test_follow_trail(self):
+        generator = MazeGenerator(41, 31, 'backtracker')
+        maze = generator.get_maze(11)
+        field = FlowField(maze)
+        field.update(39, 29)
+
+        col, row = 1, 1
+        steps = 0
+        offsets = [(-1, 0), (0, -1), (1, 0), (0, 1)]
+        while field.next_step(col, row) is not None:
+            step = field.next_step(col, row)
+            self.assertIn(step, maze.exits(col, row))
+            col, row = col + offsets[step][0], row + offsets[step][1]
+            steps += 1
+        self.assertEqual((39, 29), (col, row))
+        self.assertEqual(field.distance(1, 1), steps)
+
+    def test_limit_and_maze_change(self):
+        maze = MazeMap(9, 3)
+        field = FlowField(maze, limit=3)
+        field.update(1, 1)
+        self.assertEqual(3, field.distance(4, 1))
+        self.assertEqual(UNREACHED, field.distance(5, 1))
+
+        maze.cells[maze.index(2, 1)] = WALL_CELL
+        maze.build_exits()
+        self.assertTrue(field.update(1, 1))
+        self.assertEqual(UNREACHED, field.distance(3, 1))
+        self.assertIsNone(field.next_step(3, 1))
+
+    def test_streaming_maze(self):
+        with self.assertRaises(ValueError):
+            FlowField(MazeGenerator(21, 11).get_stream(9))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame  # noqa: E402
+from pygame import Rect  # noqa: E402
+
+from maze.config import HEAD_WIDTH, HEAD_HEIGHT  # noqa: E402
+from maze.game_state import GameState  # noqa: E402
+from maze.profiler import FrameProfiler, NullProfiler  # noqa: E402
+from maze.tiles import Tiles, TILE_FILE, DIGIT_FILES, DC_CYAN, DC_YELLOW, DC_WHITE, DC_GREEN, DC_RED  # noqa: E402
+
+
+class GameStateTestCase(unittest.TestCase):
+
+    def setUp(self):
+        pygame.display.init()
+        self.screen = pygame.display.set_mode((HEAD_WIDTH, HEAD_HEIGHT * 2))
+        self.game_state = GameState(Tiles())
+        self.hud_rect = Rect(0, HEAD_HEIGHT, HEAD_WIDTH, HEAD_HEIGHT)
+
+    def tearDown(self):
+        pygame.display.quit()
+
+    def draw_fresh(self) -> bytes:
+        game_state = self.game_state
+        fresh = GameState(Tiles())
+        fresh.score.value, fresh.bones.value, fresh.lives.value = \
+            game_state.score.value, game_state.bones.value, game_state.lives.value
+        surface = pygame.Surface(self.screen.get_size())
+        fresh.draw(surface, self.hud_rect)
+        return pygame.image.tobytes(surface.subsurface(self.hud_rect), 'RGB')
+
+    def test_sheets_decoded(self):
+        hud_sheets = {TILE_FILE} | {DIGIT_FILES[color] for color in (DC_CYAN, DC_YELLOW, DC_WHITE)}
+        tiles = Tiles()
+        GameState(tiles, NullProfiler())
+        self.assertEqual(hud_sheets, tiles.atlas.loaded)
+        # The frame times are in two more colors
+        tiles = Tiles()
+        GameState(tiles, FrameProfiler())
+        self.assertEqual(hud_sheets | {DIGIT_FILES[DC_GREEN], DIGIT_FILES[DC_RED]}, tiles.atlas.loaded)
+
+    def test_draw_changed(self):
+        game_state = self.game_state
+        game_state.new_game()
+        self.assertEqual([self.hud_rect], game_state.draw(self.screen, self.hud_rect))
+        # Nothing changed, nothing drawn
+        game_state.score.value = 0
+        self.assertEqual([], game_state.draw(self.screen, self.hud_rect))
+
+        game_state.score.value = 120
+        game_state.lives.value = 2
+        changed = game_state.draw(self.screen, self.hud_rect)
+        self.assertEqual([game_state.score_rect.move(0, HEAD_HEIGHT), game_state.lives_rect.move(0, HEAD_HEIGHT)],
+                         changed)
+        self.assertEqual(self.draw_fresh(), pygame.image.tobytes(self.screen.subsurface(self.hud_rect), 'RGB'))
+
+        # Fewer digits leave nothing of the longer value behind
+        game_state.score.value = 7
+        game_state.draw(self.screen, self.hud_rect)
+        self.assertEqual(self.draw_fresh(), pygame.image.tobytes(self.screen.subsurface(self.hud_rect), 'RGB'))
+
+    def test_invalidate(self):
+        game_state = self.game_state
+        game_state.draw(self.screen, self.hud_rect)
+        self.screen.fill((0, 0, 0))
+        game_state.invalidate()
+        self.assertEqual([self.hud_rect], game_state.draw(self.screen, self.hud_rect))
+        self.assertEqual(self.draw_fresh(), pygame.image.tobytes(self.screen.subsurface(self.hud_rect), 'RGB'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+
+from maze.maze_cache import MazeCache
+from maze.maze_generate import MazeGenerator
+
+
+class MazeCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = MazeCache(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_cache_round_trip(self):
+        generator = MazeGenerator(31, 21, 'kruskal')
+        self.assertIsNone(self.cache.load('kruskal', 31, 21, 7))
+
+        maze = self.cache.get_maze(generator, 7)
+        self.assertTrue(os.path.exists(self.cache.path('kruskal', 31, 21, 7)))
+        cells = bytes(maze.cells)
+
+        cached = self.cache.load('kruskal', 31, 21, 7)
+        self.assertEqual(cells, bytes(cached.cells))
+        self.assertEqual(cells, bytes(self.cache.get_maze(MazeGenerator(31, 21, 'kruskal'), 7).cells))
+
+    def test_caller_owns_maze(self):
+        generator = MazeGenerator(31, 21, 'kruskal')
+        generated = self.cache.get_maze(generator, 7)
+        loaded = self.cache.get_maze(generator, 7)
+        cells = bytes(generated.cells)
+
+        # Generating the next maze must not change the one handed out on the cache miss
+        generator.get_maze(8)
+        self.assertIsNot(generated, generator.maze_image)
+        self.assertEqual(cells, bytes(generated.cells))
+        self.assertEqual(cells, bytes(loaded.cells))
+        self.assertTrue(generated.buffer.readonly and loaded.buffer.readonly)
+
+    def test_size_mismatch(self):
+        self.cache.get_maze(MazeGenerator(31, 21, 'ellers'), 3)
+        os.replace(self.cache.path('ellers', 31, 21, 3), self.cache.path('ellers', 21, 31, 3))
+        self.assertIsNone(self.cache.load('ellers', 21, 31, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
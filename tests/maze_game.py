@@ -0,0 +1,94 @@
+import os
+import unittest
+from random import Random
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame  # noqa: E402
+
+from maze.config import FIXED_ONE  # noqa: E402
+from maze.maze_game import MazeGame  # noqa: E402
+from maze.maze_generate import WEST, NORTH, EAST, SOUTH  # noqa: E402
+
+
+class MazeGameTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.game = MazeGame(asset_cache=None)
+
+    def tearDown(self):
+        self.game.prefetcher.close()
+
+    def test_dirty_frames_match_full_redraw(self):
+        game = self.game
+        game.sim.new_game()
+        moves = Random(3)
+        full = pygame.Surface(game.screen.get_size())
+        for frame in range(600):
+            direction = moves.choice([WEST, NORTH, EAST, SOUTH]) if frame % 20 == 0 else None
+            if not game.sim.step(direction):
+                break
+            game.update()
+            game.draw()
+
+            mouse = game.sim.mouse.sprite
+            location = game.sprites[mouse].rect if mouse is not None else None
+            full.fill((0, 0, 0))
+            game.maze.draw(full, game.play_rect, location, None, list(game.sprites.values()))
+            self.assertEqual(pygame.image.tobytes(full.subsurface(game.play_rect), 'RGB'),
+                             pygame.image.tobytes(game.screen.subsurface(game.play_rect), 'RGB'), frame)
+
+    def test_interpolation(self):
+        game = self.game
+        game.sim.new_game()
+        game.sim.step(game.map.exits(1, 1)[0])
+        game.update()
+        mouse = game.sim.mouse.sprite
+        for _ in range(4):
+            game.sim.step()
+        self.assertEqual(2, abs(mouse.x - mouse.prev_x) + abs(mouse.y - mouse.prev_y))
+
+        game.update(0)
+        self.assertEqual((mouse.prev_x, mouse.prev_y), game.sprites[mouse].rect.topleft)
+        game.update(FIXED_ONE // 2)
+        halfway = (mouse.prev_x + mouse.x) // 2, (mouse.prev_y + mouse.y) // 2
+        self.assertEqual(halfway, game.sprites[mouse].rect.topleft)
+        game.update()
+        self.assertEqual((mouse.x, mouse.y), game.sprites[mouse].rect.topleft)
+
+        # Part way between steps the dirty frames still match a full redraw
+        game.draw()
+        full = pygame.Surface(game.screen.get_size())
+        for alpha in (0, FIXED_ONE // 3, FIXED_ONE // 2, 0):
+            game.update(alpha)
+            game.draw()
+            full.fill((0, 0, 0))
+            game.maze.draw(full, game.play_rect, game.sprites[mouse].rect, None, list(game.sprites.values()))
+            self.assertEqual(pygame.image.tobytes(full.subsurface(game.play_rect), 'RGB'),
+                             pygame.image.tobytes(game.screen.subsurface(game.play_rect), 'RGB'), alpha)
+
+    def test_profile(self):
+        game = MazeGame(profile=True, asset_cache=None)
+        try:
+            game.sim.new_game()
+            hud_frames = 0
+            for _ in range(40):
+                game.profiler.start()
+                game.sim.step()
+                game.profiler.mark('sim')
+                game.update()
+                dirty = game.draw()
+                hud_frames += any(game.hud_rect.contains(rect) for rect in dirty)
+                # The HUD shows the time of the frame before
+                shown = min(int(game.profiler.last_frame() * 1000000), 0xFFFF)
+                self.assertEqual(shown, game.game_state.frame_time.value)
+                game.profiler.end_frame()
+            self.assertEqual(40, game.profiler.count)
+            self.assertGreater(game.profiler.percentiles('maze')[0], 0)
+            # The frame time changes nearly every frame, the score does not
+            self.assertGreater(hud_frames, 20)
+        finally:
+            game.prefetcher.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
+from random import Random
 
-from maze.maze_generate import MazeGenerator, MazeMap
+from maze.maze_generate import MazeGenerator, MazeMap, WALL_CELL, ALGORITHMS, StreamingMazeMap, iter_mazes, Point, \
+    WEST, NORTH, EAST, SOUTH
 
 
 class MyTestCase(unittest.TestCase):
@@ -10,11 +12,172 @@ class MyTestCase(unittest.TestCase):
         self.assertEqual(10, len(maze.map))
         self.assertEqual(5, len(maze.map[0]))
 
+    def test_maze_map_buffer(self):
+        maze = MazeMap(10, 5)
+        self.assertEqual(50, len(maze.buffer))
+        self.assertTrue(maze.is_wall(0, 2))
+        self.assertTrue(maze.is_wall(9, 2))
+        self.assertTrue(maze.is_wall(4, 0))
+        self.assertTrue(maze.is_wall(4, 4))
+        self.assertFalse(maze.is_wall(4, 2))
+
+        maze.buffer[maze.index(4, 2)] = WALL_CELL
+        self.assertTrue(maze.is_wall(4, 2))
+        self.assertEqual(WALL_CELL, maze.map[4][2])
+
+    def test_exits(self):
+        maze = MazeMap(5, 5)
+        maze.cells[maze.index(2, 1)] = WALL_CELL
+        maze.build_exits()
+
+        self.assertEqual((WEST, EAST, SOUTH), maze.exits(2, 2))
+        self.assertEqual((SOUTH,), maze.exits(1, 1))
+        self.assertEqual((), maze.exits(2, 1))
+        self.assertEqual(0b1101, maze.exit_mask(2, 2))
+
+        self.assertEqual((WEST, SOUTH), maze.passages(2, 2, WEST))
+        self.assertEqual((EAST, SOUTH), maze.passages(2, 2, EAST))
+        self.assertEqual((WEST, EAST, SOUTH), maze.passages(2, 2, SOUTH))
+        self.assertEqual((WEST, EAST, SOUTH), maze.passages(2, 2))
+        self.assertEqual((SOUTH,), maze.passages(3, 1, EAST))
+        self.assertEqual((SOUTH,), maze.passages(3, 1, NORTH))
+
+        self.assertEqual(SOUTH, maze.right_hand_rule(Point(2, 2), EAST))
+        self.assertEqual(EAST, maze.right_hand_rule(Point(2, 2), NORTH))
+        self.assertEqual(SOUTH, maze.right_hand_rule(Point(3, 1), NORTH))
+        self.assertEqual(NORTH, maze.right_hand_rule(Point(3, 3), EAST))
+
+    def test_point(self):
+        point = Point(3, 7)
+        self.assertFalse(hasattr(point, '__dict__'))
+        self.assertEqual(point, Point.from_cell(point.cell(11), 11))
+        self.assertEqual(3 * 11 + 7, point.cell(11))
+        self.assertEqual({point}, {Point(3, 7), Point(3, 7)})
+        # Ordered row by row
+        self.assertLess(Point(9, 6), point)
+        self.assertGreater(Point(2, 8), point)
+        self.assertLess(Point(2, 7), point)
+        self.assertLessEqual(Point(3, 7), point)
+        self.assertNotEqual(Point(7, 3), point)
+
+    def test_random_cell(self):
+        maze = MazeGenerator(21, 11, seed=2).get_maze(2)
+        rng = Random(5)
+        for _ in range(100):
+            col, row = divmod(maze.random_cell(rng), maze.height)
+            self.assertFalse(maze.is_wall(col, row))
+        # The same draws make the same points
+        self.assertEqual([Point.from_cell(maze.random_cell(Random(5)), 11) for _ in range(3)],
+                         [maze.get_rand_cell(Random(5)) for _ in range(3)])
+
     def test_something(self):
         maze_image = MazeGenerator()
 
         self.assertEqual(True, isinstance(maze_image.maze_image, MazeMap))  # add assertion here
 
+    def test_generated_maze(self):
+        generator = MazeGenerator(21, 11)
+        maze = generator.get_maze()
+        lines = str(generator).splitlines()
+        self.assertEqual(11, len(lines))
+        for row, line in enumerate(lines):
+            for col, char in enumerate(line):
+                self.assertEqual(char == '#', maze.is_wall(col, row))
+        self.assertFalse(maze.is_wall(1, 1))
+
+    def assert_perfect_maze(self, maze: MazeMap):
+        # Every cell is reachable and the passages form a tree: cells + (cells - 1) connecting walls are open
+        cells = ((maze.width - 1) // 2) * ((maze.height - 1) // 2)
+        open_cells = sum(1 for col in range(0, maze.width) for row in range(0, maze.height)
+                         if not maze.is_wall(col, row))
+        self.assertEqual((cells * 2) - 1, open_cells)
+        seen = {(1, 1)}
+        todo = [(1, 1)]
+        while todo:
+            col, row = todo.pop()
+            for next_cell in ((col - 1, row), (col + 1, row), (col, row - 1), (col, row + 1)):
+                if next_cell not in seen and not maze.is_wall(*next_cell):
+                    seen.add(next_cell)
+                    todo.append(next_cell)
+        self.assertEqual(open_cells, len(seen))
+
+    def test_algorithms(self):
+        for algorithm in ALGORITHMS:
+            with self.subTest(algorithm=algorithm):
+                generator = MazeGenerator(31, 21, algorithm)
+                maze = generator.get_maze()
+                self.assertEqual(31, maze.width)
+                self.assertEqual(21, maze.height)
+                self.assert_perfect_maze(maze)
+                self.assert_perfect_maze(generator.get_maze())
+
+    def test_seeded_generation(self):
+        for algorithm in ALGORITHMS:
+            with self.subTest(algorithm=algorithm):
+                first = bytes(MazeGenerator(31, 21, algorithm).get_maze(1234).cells)
+                self.assertEqual(first, bytes(MazeGenerator(31, 21, algorithm).get_maze(1234).cells))
+                self.assertNotEqual(first, bytes(MazeGenerator(31, 21, algorithm).get_maze(4321).cells))
+
+        generator = MazeGenerator(31, 21, seed=99)
+        mazes = [bytes(generator.get_maze().cells) for _ in range(0, 3)]
+        generator = MazeGenerator(31, 21, seed=99)
+        self.assertEqual(mazes, [bytes(generator.get_maze().cells) for _ in range(0, 3)])
+
+    def test_binary_format(self):
+        maze = MazeGenerator(31, 21, 'backtracker').get_maze(5)
+        data = maze.to_bytes()
+        self.assertEqual(maze.packed_size(), len(data))
+
+        packed = MazeMap.from_buffer(memoryview(data))
+        self.assertEqual((31, 21), (packed.width, packed.height))
+        for col in range(0, 31):
+            for row in range(0, 21):
+                self.assertEqual(maze.is_wall(col, row), packed.is_wall(col, row))
+        self.assertEqual(maze.cells, packed.cells)
+        self.assertEqual(str(maze), str(packed))
+        self.assertEqual(data, packed.to_bytes())
+        self.assertTrue(packed.buffer.readonly)
+        with self.assertRaises(TypeError):
+            packed.map[1][1] = WALL_CELL
+
+        other = MazeGenerator(11, 9).get_maze()
+        corpus = data + other.to_bytes()
+        self.assertEqual([str(maze), str(other)], [str(loaded) for loaded in iter_mazes(corpus)])
+
+        with self.assertRaises(ValueError):
+            MazeMap.from_buffer(data[:-1])
+        with self.assertRaises(ValueError):
+            MazeMap.from_buffer(b'NOPE' + data[4:])
+
+    def test_unknown_algorithm(self):
+        with self.assertRaises(ValueError):
+            MazeGenerator(31, 21, 'no_such_maze')
+
+    def test_streaming_maze(self):
+        maze = MazeGenerator(21, 11).get_stream(9)
+        self.assertTrue(isinstance(maze, StreamingMazeMap))
+        self.assertEqual((0, 9), (maze.top, maze.bottom))
+        self.assertTrue(all(maze.is_wall(col, 0) for col in range(0, 21)))
+
+        self.assertEqual(3, maze.scroll_to(3))
+        self.assertEqual((3, 12), (maze.top, maze.bottom))
+        self.assertEqual(21 * 9, len(maze.buffer))
+
+        maze.scroll_to(1000)
+        self.assertEqual(21 * 9, len(maze.buffer))
+        self.assertTrue(maze.is_wall(1, 999))
+        self.assertTrue(maze.is_wall(1, 1009))
+        for row in range(1000, 1009):
+            self.assertTrue(maze.is_wall(0, row))
+            self.assertTrue(maze.is_wall(20, row))
+            for col in range(1, 20):
+                if row % 2 == 1 and col % 2 == 1:
+                    self.assertFalse(maze.is_wall(col, row))
+                elif row % 2 == 0 and col % 2 == 0:
+                    self.assertTrue(maze.is_wall(col, row))
+        with self.assertRaises(ValueError):
+            maze.scroll_to(10)
+
 
 if __name__ == '__main__':
     unittest.main()
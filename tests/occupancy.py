@@ -0,0 +1,82 @@
+import unittest
+
+from maze.entities import Entity, EntityGroup
+from maze.items import Item, ItemGroup
+from maze.maze_generate import MazeMap
+from maze.occupancy import OccupancyGrid
+from maze.simulation import Simulation
+
+
+class OccupancyGridTestCase(unittest.TestCase):
+
+    def setUp(self):
+        maze = MazeMap(15, 21)
+        maze.build_exits()
+        self.sim = Simulation(lambda: maze)
+        self.sim.new_game()
+        self.grid = self.sim.occupancy
+
+    def test_place_remove(self):
+        grid = OccupancyGrid(5)
+        first, second = object(), object()
+        cell = grid.place(first, None, 2, 3)
+        self.assertEqual(2 * 5 + 3, cell)
+        grid.place(second, None, 2, 3)
+        self.assertEqual([first, second], list(grid.at(2, 3)))
+
+        cell = grid.place(first, cell, 3, 3)
+        self.assertEqual([second], list(grid.at(2, 3)))
+        self.assertEqual([first], list(grid.at(3, 3)))
+
+        grid.remove(second, 2 * 5 + 3)
+        self.assertEqual((), grid.at(2, 3))
+        self.assertNotIn(2 * 5 + 3, grid.cells)
+        grid.remove(second, 2 * 5 + 3)
+
+        grid.reset(7)
+        self.assertEqual((), grid.at(3, 3))
+
+    def test_entity_moves(self):
+        entity = Entity(self.sim, EntityGroup())
+        entity.column = 4
+        entity.row = 6
+        self.assertIn(entity, self.grid.at(4, 6))
+        self.assertNotIn(entity, self.grid.at(4, 0))
+        self.assertEqual((4 * 32, 6 * 32), (entity.x, entity.y))
+
+        entity.column = 5
+        self.assertNotIn(entity, self.grid.at(4, 6))
+        self.assertIn(entity, self.grid.at(5, 6))
+
+        entity.kill()
+        self.assertNotIn(entity, self.grid.at(5, 6))
+        self.assertFalse(entity.alive())
+
+    def test_item_pickup(self):
+        items = ItemGroup(self.sim, 3, 1)
+        item = Item(7, 9, self.sim, 3, 1, items)
+        other = Item(7, 10, self.sim, 3, 1, items)
+        mouse = self.sim.mouse.sprite
+        score = self.sim.score.score
+
+        mouse.column, mouse.row = 7, 9
+        items.update(mouse)
+        self.assertFalse(item.alive())
+        self.assertTrue(other.alive())
+        self.assertNotIn(item, self.grid.at(7, 9))
+        self.assertEqual(score + 3, self.sim.score.score)
+        self.assertEqual(1, self.sim.score.bones)
+
+    def test_cat_eats_mouse(self):
+        mouse = self.sim.mouse.sprite
+        cat = self.sim.cats.sprites()[0]
+        cat.speed = 0
+        cat.activity = 5
+        cat.column, cat.row = mouse.column, mouse.row
+        self.sim.cats.update()
+        self.assertFalse(mouse.alive())
+        self.assertIsNone(self.sim.mouse.sprite)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from random import Random
+
+from maze.maze_generate import MazeGenerator, MazeMap
+from maze.placement import Placement, open_cells, outside_start
+
+
+class PlacementTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.maze = MazeGenerator(31, 21, seed=3).get_maze(3)
+
+    def test_open_cells(self):
+        cells = open_cells(self.maze)
+        self.assertEqual([cell for cell in range(31 * 21) if not self.maze.is_wall(*divmod(cell, 21))], list(cells))
+
+    def test_take(self):
+        placement = Placement(self.maze)
+        free = len(placement)
+        self.assertTrue(placement.exclude(self.maze.index(1, 1)))
+        self.assertFalse(placement.exclude(self.maze.index(1, 1)))
+        self.assertFalse(placement.exclude(self.maze.index(0, 0)))
+
+        taken = placement.take(50, Random(1)) + placement.take(30, Random(2), outside_start(21))
+        self.assertEqual(80, len(set(taken)))
+        self.assertNotIn(self.maze.index(1, 1), taken)
+        for cell in taken:
+            self.assertFalse(self.maze.is_wall(*divmod(cell, 21)))
+        for cell in taken[50:]:
+            col, row = divmod(cell, 21)
+            self.assertTrue(row > 10 or (row == 10 and col >= 10))
+        self.assertEqual(free - 81, len(placement))
+
+    def test_same_draws(self):
+        first = Placement(self.maze)
+        second = Placement(self.maze)
+        self.assertEqual(first.take(40, Random(4), outside_start(21)), second.take(40, Random(4), outside_start(21)))
+        self.assertEqual(first.take(40, Random(5)), second.take(40, Random(5)))
+
+    def test_full(self):
+        maze = MazeMap(5, 5)
+        placement = Placement(maze)
+        self.assertEqual(9, len(placement))
+        self.assertEqual(3, len(placement.take(5, Random(1), lambda cell: cell % 5 == 1)))
+        self.assertEqual(6, len(placement.take(20, Random(1))))
+        self.assertEqual([], placement.take(1, Random(1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
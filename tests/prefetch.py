@@ -0,0 +1,29 @@
+import unittest
+
+from maze.maze_generate import MazeGenerator
+from maze.prefetch import MazePrefetcher
+
+
+class MazePrefetcherTestCase(unittest.TestCase):
+
+    def assert_same_sequence(self, processes: bool):
+        direct = MazeGenerator(31, 21, 'backtracker', seed=11)
+        expected = [bytes(direct.get_maze().cells) for _ in range(3)]
+
+        prefetcher = MazePrefetcher(MazeGenerator(31, 21, 'backtracker', seed=11), processes)
+        try:
+            mazes = [prefetcher.get_maze() for _ in range(3)]
+        finally:
+            prefetcher.close()
+        self.assertEqual(expected, [bytes(maze.cells) for maze in mazes])
+        self.assertEqual(3, len(set(map(id, mazes))))
+
+    def test_threads(self):
+        self.assert_same_sequence(False)
+
+    def test_processes(self):
+        self.assert_same_sequence(True)
+
+
+if __name__ == '__main__':
+    unittest.main()
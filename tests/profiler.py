@@ -0,0 +1,47 @@
+import unittest
+
+from maze.profiler import FrameProfiler, NullProfiler
+
+
+class FrameProfilerTestCase(unittest.TestCase):
+
+    def play(self, profiler: FrameProfiler, frames: int):
+        for frame in range(frames):
+            profiler.start()
+            profiler.last -= frame / 1000
+            profiler.mark('a')
+            profiler.last -= 0.5
+            profiler.mark('b')
+            profiler.end_frame()
+
+    def test_percentiles(self):
+        profiler = FrameProfiler(('a', 'b'), 100)
+        self.play(profiler, 100)
+        p50, p95, p99 = profiler.percentiles('a')
+        self.assertAlmostEqual(0.050, p50, 3)
+        self.assertAlmostEqual(0.095, p95, 3)
+        self.assertAlmostEqual(0.099, p99, 3)
+        self.assertAlmostEqual(0.599, profiler.last_frame(), 3)
+        self.assertAlmostEqual(0.5, profiler.percentiles('b')[0], 3)
+        self.assertEqual(['100 frames', 'a', 'b', 'frame'], [line[:12].strip() for line in profiler.summary()])
+
+    def test_ring(self):
+        profiler = FrameProfiler(('a', 'b'), 10)
+        self.assertEqual((0.0, 0.0, 0.0), profiler.percentiles())
+        self.play(profiler, 25)
+        # Only the last 10 frames are kept
+        self.assertEqual(25, profiler.count)
+        self.assertAlmostEqual(0.015, min(profiler.times['a']), 3)
+        self.assertAlmostEqual(0.024, profiler.last_frame('a'), 3)
+
+    def test_null(self):
+        profiler = NullProfiler()
+        self.assertFalse(profiler.enabled)
+        profiler.start()
+        profiler.mark('a')
+        profiler.end_frame()
+        self.assertEqual(0, profiler.count)
+
+
+if __name__ == '__main__':
+    unittest.main()
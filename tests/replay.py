@@ -0,0 +1,106 @@
+import os
+import tempfile
+import unittest
+from collections import defaultdict
+from random import Random
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame  # noqa: E402
+
+from maze.maze_game import MazeGame, key_state  # noqa: E402
+from maze.maze_generate import MazeGenerator, WEST, NORTH, SOUTH  # noqa: E402
+from maze.replay import Replay, ReplayRecorder, decode_keys, KEY_UP, KEY_LEFT, KEY_DOWN, KEY_SPACE, \
+    FRAME_RECORD  # noqa: E402
+
+
+class ReplayTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'game.rec')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_keys(self):
+        self.assertEqual((None, False), decode_keys(0))
+        self.assertEqual((NORTH, True), decode_keys(KEY_UP | KEY_DOWN | KEY_SPACE))
+        self.assertEqual((WEST, False), decode_keys(KEY_LEFT | KEY_DOWN))
+        self.assertEqual((SOUTH, False), decode_keys(KEY_DOWN))
+
+        pressed = defaultdict(bool, {pygame.K_LEFT: True, pygame.K_SPACE: True})
+        self.assertEqual(KEY_LEFT | KEY_SPACE, key_state(pressed))
+
+    def test_file(self):
+        recorder = ReplayRecorder(self.path, MazeGenerator(31, 21), 7, 8)
+        recorder.new_game()
+        for frame in range(300):
+            recorder.frame(frame % 3, frame % 32)
+        recorder.close()
+        # A crash part way through writing a frame
+        with open(self.path, 'ab') as file:
+            file.write(b'\x01')
+
+        replay = Replay(self.path)
+        self.assertEqual((31, 21, 'hunt_and_kill', 7, 8),
+                         (replay.width, replay.height, replay.algorithm, replay.maze_seed, replay.rng_seed))
+        self.assertEqual(301, len(replay))
+        self.assertEqual(FRAME_RECORD.pack(2, 11), replay.frames[-2:])
+
+        with open(self.path, 'wb') as file:
+            file.write(b'not a recording at all, no')
+        with self.assertRaises(ValueError):
+            Replay(self.path)
+
+    def test_play_back(self):
+        game = MazeGame(record=self.path, seed=11, asset_cache=None)
+        try:
+            moves = Random(2)
+            keys = 0
+            game.start_game()
+            for frame in range(400):
+                keys = moves.choice((0, KEY_UP, KEY_LEFT, KEY_DOWN, 4)) if frame % 10 == 0 else keys
+                if not game.play_frame(keys, moves.randrange(4)):
+                    game.start_game()
+                game.update()
+            states = [self.state(game.sim)]
+        finally:
+            game.close()
+
+        replay = Replay(self.path)
+        self.assertEqual(401, len(replay))
+        played = replay.play()
+        states.append(self.state(played))
+        self.assertEqual(states[0], states[1])
+
+        # Part of the way through plays the same steps
+        steps = list()
+        replay.play(101, lambda sim: steps.append(sim.frame))
+        self.assertEqual(list(range(1, len(steps) + 1)), steps)
+        self.assertLess(len(steps), played.frame)
+
+    def test_negative_seed(self):
+        game = MazeGame(record=self.path, seed=-3, asset_cache=None)
+        try:
+            self.assertEqual((1 << 64) - 3, game.seed)
+            game.start_game()
+            for frame in range(100):
+                game.play_frame(KEY_DOWN if frame < 50 else KEY_LEFT, 1)
+            state = self.state(game.sim)
+        finally:
+            game.close()
+        replay = Replay(self.path)
+        self.assertEqual(((1 << 64) - 3, (1 << 64) - 3), (replay.maze_seed, replay.rng_seed))
+        self.assertEqual(state, self.state(replay.play()))
+
+    @staticmethod
+    def state(sim):
+        mouse = sim.mouse.sprite
+        return (sim.frame, sim.level, sim.score.score, sim.score.lives, len(sim.cheese),
+                (mouse.x, mouse.y) if mouse is not None else None,
+                sorted((cat.x, cat.y) for cat in sim.cats))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import hashlib
+import subprocess
+import sys
+import unittest
+from random import Random
+
+from maze.maze_generate import MazeGenerator, MazeMap, WEST, NORTH, EAST, SOUTH
+from maze.simulation import Simulation
+
+
+def play(seed: int, frames: int = 3000):
+    generator = MazeGenerator(31, 31, 'backtracker', seed=seed)
+    sim = Simulation(lambda: MazeGenerator(31, 31, 'backtracker').get_maze(generator.next_seed()), seed)
+    sim.new_game()
+    moves = Random(seed)
+    trace = hashlib.sha1()
+    while sim.frame < frames and sim.step(moves.choice([WEST, NORTH, EAST, SOUTH])):
+        trace.update(repr((sim.mouse.current_loc, sim.score.score, sim.score.lives, len(sim.cats))).encode())
+    return sim, trace.hexdigest()
+
+
+class SimulationTestCase(unittest.TestCase):
+
+    def test_new_game(self):
+        sim = Simulation(lambda: MazeGenerator(31, 31).get_maze(3), 1)
+        sim.new_game()
+        self.assertTrue(sim.play_game)
+        self.assertEqual((1, 1), sim.mouse.current_loc)
+        self.assertEqual(50, len(sim.cheese))
+        self.assertEqual(10, len(sim.bones))
+        self.assertEqual(10, len(sim.cats))
+        # Everything is in the occupancy grid, on an open cell
+        for group in (sim.cheese, sim.bones, sim.cats):
+            for entity in group:
+                self.assertFalse(sim.map.is_wall(entity.column, entity.row))
+                self.assertIn(entity, sim.occupancy.at(entity.column, entity.row))
+
+    def test_eat_cheese(self):
+        maze = MazeMap(15, 21)
+        maze.build_exits()
+        sim = Simulation(lambda: maze)
+        sim.new_game()
+        sim.cats.empty()
+        cheese = sim.cheese.sprites()[0]
+        sim.cheese.empty()
+        sim.cheese.add(cheese)
+        cheese.column, cheese.row = 2, 1
+
+        # Up to the start of the next level, whose cheese the mouse may run into too
+        for _ in range(16):
+            sim.step(EAST)
+            if sim.maze_count > 1:
+                break
+        self.assertEqual(1, sim.score.score)
+        self.assertFalse(cheese.alive())
+        # The last cheese was eaten, so the next level started
+        self.assertEqual(2, sim.maze_count)
+
+    def test_deterministic(self):
+        first, first_trace = play(7)
+        second, second_trace = play(7)
+        self.assertEqual(first_trace, second_trace)
+        self.assertEqual(first.frame, second.frame)
+        self.assertNotEqual(first_trace, play(8)[1])
+
+    def test_no_pygame(self):
+        code = "import sys, maze.simulation; sys.exit('pygame' in sys.modules)"
+        self.assertEqual(0, subprocess.call([sys.executable, '-c', code]))
+
+
+if __name__ == '__main__':
+    unittest.main()
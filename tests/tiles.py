@@ -0,0 +1,51 @@
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame  # noqa: E402
+
+from maze.maze_generate import MazeMap, WEST, NORTH, EAST, SOUTH  # noqa: E402
+from maze.simulation import Simulation  # noqa: E402
+from maze.sprites import CritterSprite  # noqa: E402
+from maze.tiles import Tiles  # noqa: E402
+
+
+class TilesTestCase(unittest.TestCase):
+
+    def setUp(self):
+        pygame.display.init()
+        pygame.display.set_mode((64, 64))
+        self.tiles = Tiles()
+
+    def tearDown(self):
+        pygame.display.quit()
+
+    def test_direction_frames(self):
+        tiles = self.tiles
+        for strip, frames in ((tiles.mice, tiles.mouse_frames), (tiles.cats, tiles.cat_frames),
+                              (tiles.dogs, tiles.dog_frames)):
+            surface, *rects = strip
+            for direction in (WEST, NORTH, EAST, SOUTH):
+                self.assertEqual(pygame.image.tobytes(surface.subsurface(rects[direction]), 'RGB'),
+                                 pygame.image.tobytes(frames[direction], 'RGB'))
+                # Not tied to the tile sheet
+                self.assertIsNone(frames[direction].get_parent())
+
+    def test_sprite_turns(self):
+        maze = MazeMap(15, 21)
+        maze.build_exits()
+        sim = Simulation(lambda: maze)
+        sim.new_game()
+        mouse = sim.mouse.sprite
+        mouse.direction = WEST
+        sprite = CritterSprite(mouse, self.tiles.mouse_frames)
+        for direction in (SOUTH, EAST, NORTH, WEST):
+            mouse.direction = direction
+            self.assertIsNotNone(sprite.sync())
+            self.assertIs(self.tiles.mouse_frames[direction], sprite.image)
+        self.assertIsNone(sprite.sync())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+from maze.config import FIXED_ONE
+from maze.timestep import FixedTimestep
+
+
+class FixedTimestepTestCase(unittest.TestCase):
+
+    def test_steps(self):
+        timestep = FixedTimestep(40, 5)
+        self.assertEqual(0, timestep.advance(10))
+        self.assertEqual(FIXED_ONE * 2 // 5, timestep.alpha)
+        self.assertEqual(1, timestep.advance(20))
+        self.assertEqual(FIXED_ONE // 5, timestep.alpha)
+        # Long frames catch up several steps, never losing the time left over
+        self.assertEqual(4, timestep.advance(95))
+        self.assertEqual(0, timestep.alpha)
+
+    def test_uneven_rate(self):
+        timestep = FixedTimestep(60, 5)
+        self.assertEqual(60, sum(timestep.advance(7) for _ in range(1000 // 7)) + timestep.advance(1000 % 7))
+        self.assertEqual(0, timestep.accumulator)
+
+    def test_max_steps(self):
+        timestep = FixedTimestep(40, 5)
+        self.assertEqual(5, timestep.advance(1000))
+        self.assertLess(timestep.alpha, FIXED_ONE)
+        self.assertEqual(0, timestep.advance(0))
+
+
+if __name__ == '__main__':
+    unittest.main()